@@ -0,0 +1,202 @@
+"""A shared client for the AMO API used by the API tests.
+
+All the requests go through one keep-alive `requests.Session`, so a test run
+re-uses its TLS connections instead of opening a new one for every call.
+The client also:
+- builds the `Authorization: Session <sessionid>` header from the `auth` argument
+- retries throttled (429) requests after the delay asked for in `Retry-After`
+- records the latency of every request it sends
+
+The session never stores cookies set by AMO, so no state leaks between tests
+that share the client; cookies can still be sent explicitly per request."""
+
+import email.utils
+import http.cookiejar
+import time
+
+import requests
+
+from requests.adapters import HTTPAdapter
+
+# endpoints covered by the endpoint specific helpers
+_upload = '/api/v5/addons/upload/'
+_addon = '/api/v5/addons/addon/'
+_abuse_report = '/api/v5/abuse/report/addon/'
+
+
+class AMOClient:
+    def __init__(self, base_url, pool_size=16, max_retries=3, timeout=120):
+        self.base_url = base_url
+        self.max_retries = max_retries
+        self.timeout = timeout
+        # (method, path, status code, seconds) for every request sent
+        self.latencies = []
+        self.session = requests.Session()
+        self.session.cookies.set_policy(
+            http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def request(self, method, url, auth=None, **kwargs):
+        """Send a request and return the response. Relative urls are resolved
+        against the base url and `auth` is the sessionid of the user the
+        request is sent on behalf of"""
+        if url.startswith('/'):
+            url = f'{self.base_url}{url}'
+        if auth is not None:
+            kwargs['headers'] = {
+                **kwargs.get('headers', {}),
+                'Authorization': f'Session {auth}',
+            }
+        kwargs.setdefault('timeout', self.timeout)
+        for attempt in range(self.max_retries + 1):
+            start = time.perf_counter()
+            response = self.session.request(method, url, **kwargs)
+            self.latencies.append(
+                (
+                    method,
+                    requests.utils.urlparse(url).path,
+                    response.status_code,
+                    time.perf_counter() - start,
+                )
+            )
+            if response.status_code != 429 or attempt == self.max_retries:
+                return response
+            delay = self._retry_after(response)
+            print(f'{method} {url} was throttled, retrying in {delay}s')
+            time.sleep(delay)
+            # files are read while sending, so rewind them before sending them again
+            for file in (kwargs.get('files') or {}).values():
+                if hasattr(file, 'seek'):
+                    file.seek(0)
+        return response
+
+    @staticmethod
+    def _retry_after(response, default=5, limit=60):
+        """Read the delay from the 'Retry-After' header, which can hold either
+        a number of seconds or a date"""
+        value = response.headers.get('Retry-After')
+        if value is None:
+            return default
+        if value.isdigit():
+            return min(int(value), limit)
+        try:
+            retry_date = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return default
+        return min(max(retry_date.timestamp() - time.time(), 0), limit)
+
+    def get(self, url, auth=None, **kwargs):
+        return self.request('GET', url, auth=auth, **kwargs)
+
+    def post(self, url, auth=None, **kwargs):
+        return self.request('POST', url, auth=auth, **kwargs)
+
+    def put(self, url, auth=None, **kwargs):
+        return self.request('PUT', url, auth=auth, **kwargs)
+
+    def patch(self, url, auth=None, **kwargs):
+        return self.request('PATCH', url, auth=auth, **kwargs)
+
+    def delete(self, url, auth=None, **kwargs):
+        return self.request('DELETE', url, auth=auth, **kwargs)
+
+    # uploads
+    def upload(self, file_path, channel, auth=None):
+        """Upload an addon file (see the 'sample-addons' folder) to the given channel"""
+        with open(file_path, 'rb') as file:
+            return self.post(
+                _upload, auth=auth, files={'upload': file}, data={'channel': channel}
+            )
+
+    def upload_detail(self, uuid, auth=None):
+        return self.get(f'{_upload}{uuid}/', auth=auth)
+
+    # addons
+    def create_addon(self, payload, auth=None):
+        return self.post(_addon, auth=auth, json=payload)
+
+    def put_addon(self, guid, payload, auth=None):
+        return self.put(f'{_addon}{guid}/', auth=auth, json=payload)
+
+    def get_addon(self, addon, auth=None):
+        return self.get(f'{_addon}{addon}/', auth=auth)
+
+    def edit_addon(self, addon, payload=None, auth=None, files=None):
+        """Edit an addon; when files (e.g. the icon) are attached, the payload is
+        sent as form data instead of json"""
+        if files:
+            return self.patch(f'{_addon}{addon}/', auth=auth, data=payload, files=files)
+        return self.patch(f'{_addon}{addon}/', auth=auth, json=payload)
+
+    def delete_confirm(self, addon, auth=None):
+        """Get the token `delete_addon` needs"""
+        return self.get(f'{_addon}{addon}/delete_confirm/', auth=auth)
+
+    def delete_addon(self, addon, delete_confirm, auth=None):
+        """`delete_confirm` is the token returned by `delete_confirm`"""
+        return self.delete(
+            f'{_addon}{addon}/', auth=auth, params={'delete_confirm': delete_confirm}
+        )
+
+    # versions
+    def versions(self, addon, auth=None, **params):
+        return self.get(f'{_addon}{addon}/versions/', auth=auth, params=params)
+
+    def create_version(self, addon, payload, auth=None, files=None):
+        """Create a new version from an upload; when files (e.g. the source code)
+        are attached, the payload is sent as form data instead of json"""
+        if files:
+            return self.post(
+                f'{_addon}{addon}/versions/', auth=auth, data=payload, files=files
+            )
+        return self.post(f'{_addon}{addon}/versions/', auth=auth, json=payload)
+
+    def get_version(self, addon, version, auth=None):
+        return self.get(f'{_addon}{addon}/versions/{version}/', auth=auth)
+
+    def edit_version(self, addon, version, payload=None, auth=None, files=None):
+        if files:
+            return self.patch(
+                f'{_addon}{addon}/versions/{version}/',
+                auth=auth,
+                data=payload,
+                files=files,
+            )
+        return self.patch(
+            f'{_addon}{addon}/versions/{version}/', auth=auth, json=payload
+        )
+
+    # previews
+    def create_preview(self, addon, image_path, auth=None, position=None):
+        data = {'position': position} if position is not None else None
+        with open(image_path, 'rb') as image:
+            return self.post(
+                f'{_addon}{addon}/previews/',
+                auth=auth,
+                files={'image': image},
+                data=data,
+            )
+
+    def edit_preview(self, addon, preview, payload, auth=None):
+        return self.patch(
+            f'{_addon}{addon}/previews/{preview}/', auth=auth, json=payload
+        )
+
+    def delete_preview(self, addon, preview, auth=None):
+        return self.delete(f'{_addon}{addon}/previews/{preview}/', auth=auth)
+
+    # abuse reports
+    def report_addon_abuse(self, payload, auth=None):
+        return self.post(_abuse_report, auth=auth, json=payload)
+
+    def summary(self):
+        """Returns the request counters in a form that can travel between
+        xdist workers and the controller process"""
+        return {
+            'requests': len(self.latencies),
+            'total_time': sum(latency for *_, latency in self.latencies),
+            'slowest': sorted(self.latencies, key=lambda item: item[-1])[-5:],
+        }
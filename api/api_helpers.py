@@ -1,24 +1,74 @@
 """File holding some reusable methods used in the API addon submission tests"""
 
+import atexit
 import hashlib
+import io
 import json
+import os
+import shutil
+import tempfile
+import time
 import zipfile
 
-import requests
+from concurrent.futures import ThreadPoolExecutor
 
 
-def make_addon(manifest_data):
-    """Dynamically create a simple extension with minimal manifest properties"""
-    with open('sample-addons/manifest.json', 'w') as f:
-        # the contents of the manifest will be defined in tests based on the scenario we want to verify
-        json.dump(manifest_data, f)
-        print(f'Manifest content: {manifest_data}')
-    # add the manifest to the addon zip we want to upload - this will always be the 'make-addon.zip' file
-    # if the zip files contains a manifest already, it will be overwritten by the new manifest
-    with zipfile.ZipFile('sample-addons/make-addon.zip', 'w') as zipf:
-        manifest = 'sample-addons/manifest.json'
-        destination = 'manifest.json'
-        zipf.write(manifest, destination)
+# files built by make_addon() and make_manifest() in this process, keyed by a hash of their content;
+# every process (i.e. xdist worker) keeps its own copies in a temporary folder
+_built_addons = {}
+_built_addons_dir = None
+
+
+def build_xpi(manifest_data, files=None):
+    """Assemble an addon archive in memory from a manifest and, optionally, a dict
+    of extra files (archive path: content) and return its bytes. The archive
+    entries get a fixed timestamp, so the same content always gives the same bytes."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        entries = {'manifest.json': json.dumps(manifest_data), **(files or {})}
+        for name, content in sorted(entries.items()):
+            zipf.writestr(zipfile.ZipInfo(name, date_time=(1980, 1, 1, 0, 0, 0)), content)
+    return buffer.getvalue()
+
+
+def _built_file(content, extension, build):
+    """The path of the file holding `build()`, written once per process for the
+    same `content` in a temporary folder"""
+    global _built_addons_dir
+    key = hashlib.sha256(
+        json.dumps(content, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    if key not in _built_addons:
+        if _built_addons_dir is None:
+            _built_addons_dir = tempfile.mkdtemp(prefix='amo-addons-')
+            atexit.register(shutil.rmtree, _built_addons_dir, ignore_errors=True)
+        path = os.path.join(_built_addons_dir, f'{key[:16]}{extension}')
+        with open(path, 'wb') as f:
+            f.write(build())
+        _built_addons[key] = path
+    return _built_addons[key]
+
+
+def make_addon(manifest_data, files=None):
+    """Dynamically create a simple extension with minimal manifest properties and
+    return the path of the archive. Archives are cached by content, so building the
+    same addon again costs nothing and parallel workers never write to a shared file."""
+    # the contents of the manifest will be defined in tests based on the scenario we want to verify
+    print(f'Manifest content: {manifest_data}')
+    return _built_file(
+        [manifest_data, sorted((files or {}).items())],
+        '.zip',
+        lambda: build_xpi(manifest_data, files),
+    )
+
+
+def make_manifest(manifest_data):
+    """Write a manifest on its own, not packed in an archive, and return its path"""
+    return _built_file(
+        ['manifest', manifest_data],
+        '.json',
+        lambda: json.dumps(manifest_data).encode(),
+    )
 
 
 def verify_addon_response_details(payload, response, request):
@@ -67,37 +117,105 @@ def verify_addon_response_details(payload, response, request):
     return addon_details == response_values
 
 
+# hashes of the local source files, keyed by path, modification time and size,
+# so each file is only read once per test session
+_local_file_hashes = {}
+
+
+def _local_file_hash(path, chunk_size=1024 * 1024):
+    """Hash a local file in chunks, so large files are never loaded in memory"""
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    if key not in _local_file_hashes:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+        _local_file_hashes[key] = digest.digest()
+    return _local_file_hashes[key]
+
+
+def _download_hash(response, chunk_size=1024 * 1024):
+    """Hash a downloaded file chunk by chunk; the response should be requested
+    with `stream=True`, otherwise it is already fully loaded in memory"""
+    digest = hashlib.sha256()
+    with response:
+        for chunk in response.iter_content(chunk_size):
+            digest.update(chunk)
+    return digest.digest()
+
+
 def compare_source_files(file_a, file_b, request):
     """Method to compare the hashes of the uploaded and downloaded
     addon source files to make sure they are matching; the comparison differs
     between POST and PATCH requests, so the method is split in two checks"""
     # this is the source file downloaded from AMO used in both request types
-    source_from_api = hashlib.sha256(file_b.content).digest()
-    if request == 'POST':
+    source_from_api = _download_hash(file_b)
+    if request.upper() == 'POST':
         # in POST request we compare the local source uploaded with the source from the API
-        local_file = hashlib.sha256(open(file_a, 'rb').read()).digest()
+        local_file = _local_file_hash(file_a)
         assert (
             local_file == source_from_api
         ), f'File contents did not match: local_file_hash = {local_file}, source_from_api_hash = {source_from_api}'
-    if request == 'PATCH':
+    if request.upper() == 'PATCH':
         # in PATCH requests, we are fetching the previous source file attached to the version
         # and compare it to the new attached files to make sure they are different
-        previous_source_from_api = hashlib.sha256(file_a.content).digest()
+        previous_source_from_api = _download_hash(file_a)
         assert previous_source_from_api != source_from_api, (
             f'Source files were not updated successfully: previous_source_from_api_hash = {previous_source_from_api}, '
             f'source_from_api_hash = {source_from_api}'
         )
 
 
-def get_addon_version_string(base_url, addon, auth):
+def get_addon_version_string(amo_api, addon, auth):
     """Get the version string of an addon's latest version by using
     the /addons/versions/ API endpoint"""
-    request = requests.get(
-        url=f'{base_url}/api/v5/addons/addon/{addon}/versions/?filter=all_with_unlisted',
-        headers={'Authorization': f'Session {auth}'},
-    )
+    request = amo_api.versions(addon, auth=auth, filter='all_with_unlisted')
     assert (
         request.status_code == 200
     ), f'Actual response was: status code: {request.status_code}, {request.text}'
     version_string = request.json()['results'][0]['version']
     return version_string
+
+
+def wait_for_upload_processed(amo_api, uuid, auth, timeout=90):
+    """Poll the upload detail endpoint until AMO has finished processing
+    (and validating) the upload with the given uuid. The polling interval
+    starts small and backs off up to a few seconds, so fast uploads are
+    picked up almost immediately while slow ones don't flood the API.
+    Returns the upload details, including the 'validation' results."""
+    deadline = time.monotonic() + timeout
+    delay = 0.5
+    while True:
+        request = amo_api.upload_detail(uuid, auth=auth)
+        assert (
+            request.status_code == 200
+        ), f'Actual response was: status code: {request.status_code}, {request.text}'
+        upload = request.json()
+        if upload['processed']:
+            return upload
+        if time.monotonic() + delay > deadline:
+            raise TimeoutError(
+                f'Upload {uuid} was not processed after {timeout}s; last response was {upload}'
+            )
+        time.sleep(delay)
+        delay = min(delay * 1.5, 5)
+
+
+def upload_batch(amo_api, file_paths, channel, auth, max_workers=4):
+    """Upload several addon files at the same time and wait for all of them to be
+    processed, so the total time is about that of the slowest upload instead of
+    the sum of all of them. Returns a future for each file path; calling
+    `.result()` gives the processed upload details or raises the error of that
+    upload only, so one failing upload doesn't fail the others."""
+    def upload_and_wait(file_path):
+        upload = amo_api.upload(file_path, channel, auth=auth)
+        upload.raise_for_status()
+        return wait_for_upload_processed(amo_api, upload.json()['uuid'], auth)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            file_path: executor.submit(upload_and_wait, file_path)
+            for file_path in file_paths
+        }
+    return futures
@@ -10,6 +10,8 @@ from selenium.webdriver.support import expected_conditions as EC
 
 from pages.desktop.about_debug_addons import AboutDebug
 from pages.desktop.view_recent_updates import ViewRecentUpdates
+from scripts.addon_install import installed_addons
+from scripts.shadow_dom import wait_for_shadow
 
 
 class AboutAddons(Page):
@@ -91,6 +93,22 @@ class AboutAddons(Page):
         )
         return self
 
+    @property
+    def installed_addons(self):
+        """A snapshot of the installed add-ons read from the AddonManager (see
+        `scripts.addon_install.installed_addons`). It is cached, so several
+        assertions cost a single call; the page methods that change add-ons
+        drop it, and `refresh_installed_addons()` reads it again after changes
+        made elsewhere (e.g. installs from a door-hanger). Use the card
+        properties only to check what about:addons renders."""
+        if getattr(self, "_installed_addons", None) is None:
+            self._installed_addons = installed_addons(self.driver)
+        return self._installed_addons
+
+    def refresh_installed_addons(self):
+        self._installed_addons = None
+        return self.installed_addons
+
     @property
     def more_options_remove_button(self):
         self.wait.until(
@@ -134,6 +152,7 @@ class AboutAddons(Page):
         self.find_element(*self._more_options_button_locator).click()
 
     def click_more_options_remove_addon(self):
+        self._installed_addons = None
         self.wait.until(
             EC.visibility_of_element_located(self._more_options_panel_item_remove_button_locator)
         )
@@ -148,6 +167,7 @@ class AboutAddons(Page):
         self.wait.until(EC.url_contains("/firefox/feedback/addon"))
 
     def extensions_side_toggle_addon(self):
+        self._installed_addons = None
         self.wait.until(
             EC.visibility_of_element_located(self._extensions_side_toggle_addon_locator)
         )
@@ -163,6 +183,7 @@ class AboutAddons(Page):
         return self.find_element(*self._undo_remove_addon_button_locator)
 
     def click_undo_remove(self):
+        self._installed_addons = None
         self.undo_remove_button.click()
         # the message bar disappears after Undo and the addon name link reappears
         self.wait.until(
@@ -236,6 +257,7 @@ class AboutAddons(Page):
         assert find_more_addons.text in "Find more add-ons"
 
     def remove_addon_dialog(self):
+        self._installed_addons = None
         with self.driver.context(self.driver.CONTEXT_CHROME):
             self.wait.until(
                 EC.visibility_of_element_located(self._remove_addon_dialog_locator)
@@ -283,27 +305,22 @@ class AboutAddons(Page):
     #     return Search(self.driver, self.base_url).wait_for_page_to_load()
 
     def search_box(self, value):
-        self.wait.until(EC.visibility_of_element_located(self._find_more_addons_search_box_locator))
-
-        host = self.driver.execute_script("""
-            return document.querySelector("moz-input-search[placeholder='Search addons.mozilla.org']");
-        """)
-        input_el = self.driver.execute_script("return arguments[0].shadowRoot?.querySelector('input')", host)
+        # waits for the search box and reads the shadow-DOM <input> and search
+        # <button> with a single command
+        search_host = self._find_more_addons_search_box_locator[1]
+        _, (_, input_el), (_, inner_btn) = wait_for_shadow(
+            self.driver,
+            [
+                (search_host, None, "visible"),
+                (search_host, "input", "query"),
+                ("moz-button[data-l10n-id='addons-heading-search-button']", "button", "query"),
+            ],
+            timeout=self.timeout,
+        )
 
         input_el.clear()
         input_el.send_keys(value)
 
-        btn_host = self.driver.execute_script("""
-          return document.querySelector("moz-button[data-l10n-id='addons-heading-search-button']");
-        """)
-
-        inner_btn = self.driver.execute_script("""
-          const host = arguments[0];
-          return host?.shadowRoot?.querySelector("button") || null;
-        """, btn_host)
-
-        assert inner_btn, "Inner <button> not found in moz-button shadowRoot"
-
         self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", inner_btn)
         self.driver.execute_script("arguments[0].click();", inner_btn)  # JS click on real button
 
@@ -331,6 +348,14 @@ class AboutAddons(Page):
 
         return Search(self.driver, self.base_url).wait_for_page_to_load()
 
+    def open_extensions_tab(self):
+        """Opens about:addons on the Extensions tab, e.g. for the tests whose
+        extension is installed by the `preinstalled` marker"""
+        self.driver.get("about:addons")
+        self.wait_for_page_to_load()
+        self.click_extensions_side_button()
+        return self
+
     def click_extensions_side_button(self):
         self.wait.until(EC.element_to_be_clickable(self._extension_tab_button_locator))
         self.find_element(*self._extension_tab_button_locator).click()
@@ -395,6 +420,7 @@ class AboutAddons(Page):
         )
 
     def disable_extension(self):
+        self._installed_addons = None
         self.wait.until(
             EC.element_to_be_clickable(self._extension_disable_toggle_locator)
         )
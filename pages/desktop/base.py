@@ -1,8 +1,16 @@
+import functools
+import re
+import weakref
+
 import requests
 
 from pypom import Page, Region
 
-from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
@@ -10,8 +18,217 @@ from selenium.webdriver.support.select import Select
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from scripts.region_snapshot import SCRIPT_STRATEGIES, script_locator
+
+# WebDriverWait polls every half second and each poll costs about two commands
+# (find the element and check its visibility)
+_POLL_FREQUENCY = 0.5
+_COMMANDS_PER_POLL = 2
+
+# commands saved by wait_for_ready() during the current test; reset and reported
+# for every test by the 'page_ready_stats' fixture in conftest.py
+page_ready_stats = {"waits": 0, "saved_commands": 0}
+
+_WAIT_FOR_READY_SCRIPT = """
+const [[strategy, value], gone, timeout] = arguments;
+const callback = arguments[arguments.length - 1];
+function find() {
+    if (strategy === "xpath") {
+        return document.evaluate(
+            value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+    }
+    return document.querySelector(value);
+}
+function displayed(element) {
+    const rect = element.getBoundingClientRect();
+    return (
+        rect.width > 0 &&
+        rect.height > 0 &&
+        element.checkVisibility({ opacityProperty: true, visibilityProperty: true })
+    );
+}
+function ready() {
+    const element = find();
+    const visible = Boolean(element) && displayed(element);
+    return gone ? !visible : visible;
+}
+const start = performance.now();
+if (ready()) {
+    callback([true, 0]);
+} else {
+    let observer, interval, timer;
+    const finish = (result) => {
+        observer.disconnect();
+        clearInterval(interval);
+        clearTimeout(timer);
+        callback([result, (performance.now() - start) / 1000]);
+    };
+    const check = () => ready() && finish(true);
+    // every DOM change re-checks the condition; the interval catches the
+    // changes that come from css alone, like transitions
+    observer = new MutationObserver(check);
+    observer.observe(document, {
+        subtree: true,
+        childList: true,
+        attributes: true,
+        characterData: true,
+    });
+    interval = setInterval(check, 250);
+    timer = setTimeout(() => finish(false), timeout * 1000);
+}
+"""
+
+
+# the script timeout set on every driver by ensure_script_timeout
+_script_timeouts = weakref.WeakKeyDictionary()
+
+
+def ensure_script_timeout(driver, seconds):
+    """Makes sure async scripts that wait for up to `seconds` inside the browser
+    are not cut short by the WebDriver script timeout. The timeout is only ever
+    raised, since it is a limit for every later script of the session as well"""
+    if _script_timeouts.get(driver, 0) < seconds:
+        driver.set_script_timeout(seconds + 5)
+        _script_timeouts[driver] = seconds
+
+
+def wait_for_ready(page, locator, gone=False, message=None):
+    """Waits inside the page, with a single command, until the element of
+    `locator` is displayed (or, with `gone`, until it is hidden or removed).
+    Falls back to polling from Python if the script can't finish, e.g. because
+    the page navigated away while waiting."""
+    driver = page.driver
+    timeout = page.timeout
+    message = message or f"{locator} was not {'hidden' if gone else 'displayed'}"
+    condition = (
+        EC.invisibility_of_element_located if gone else EC.visibility_of_element_located
+    )
+    # locators like By.LINK_TEXT have no css or xpath equivalent for the script
+    if locator[0] not in SCRIPT_STRATEGIES:
+        page.wait.until(condition(locator), message=message)
+        return page
+    ensure_script_timeout(driver, timeout)
+    try:
+        ready, elapsed = driver.execute_async_script(
+            _WAIT_FOR_READY_SCRIPT, script_locator(*locator), gone, timeout
+        )
+    except WebDriverException:
+        page.wait.until(condition(locator), message=message)
+        return page
+    if not ready:
+        raise TimeoutException(message)
+    page_ready_stats["waits"] += 1
+    polls = int(elapsed / _POLL_FREQUENCY) + 1
+    page_ready_stats["saved_commands"] += max(polls * _COMMANDS_PER_POLL - 1, 0)
+    return page
+
+
+# the timings of the pages loaded during the current test, recorded when
+# `enabled` (--page-metrics); reported by scripts/page_metrics.py
+page_metrics = {"enabled": False, "pages": []}
+
+_PAGE_METRICS_SCRIPT = """
+const [lastOrigin] = arguments;
+const callback = arguments[arguments.length - 1];
+if (performance.timeOrigin === lastOrigin) {
+    // the document was already measured, e.g. when the page changed in place
+    callback(null);
+    return;
+}
+const supported = PerformanceObserver.supportedEntryTypes || [];
+const entries = { "largest-contentful-paint": [], "layout-shift": [] };
+const observers = Object.keys(entries)
+    .filter((type) => supported.includes(type))
+    .map((type) => {
+        const observer = new PerformanceObserver((list) => entries[type].push(...list.getEntries()));
+        observer.observe({ type, buffered: true });
+        return [type, observer];
+    });
+// the buffered entries are delivered to the observers in a later task
+setTimeout(() => {
+    for (const [type, observer] of observers) {
+        entries[type].push(...observer.takeRecords());
+        observer.disconnect();
+    }
+    const [navigation] = performance.getEntriesByType("navigation");
+    const resources = performance.getEntriesByType("resource");
+    const round = (value) => (value ? Math.round(value) : null);
+    const paints = entries["largest-contentful-paint"];
+    const shifts = entries["layout-shift"].filter((shift) => !shift.hadRecentInput);
+    callback({
+        origin: performance.timeOrigin,
+        url: location.href,
+        ttfb: round(navigation && navigation.responseStart),
+        dom_content_loaded: round(navigation && navigation.domContentLoadedEventEnd),
+        load: round(navigation && navigation.loadEventEnd),
+        ready: round(performance.now()),
+        lcp: paints.length ? round(Math.max(...paints.map((paint) => paint.startTime))) : null,
+        cls: supported.includes("layout-shift")
+            ? Number(shifts.reduce((total, shift) => total + shift.value, 0).toFixed(3))
+            : null,
+        resources: resources.length,
+        transfer_size: resources.reduce(
+            (total, resource) => total + resource.transferSize,
+            navigation ? navigation.transferSize : 0
+        ),
+    });
+}, 0);
+"""
+
+
+def record_page_metrics(page):
+    """Reads the Navigation Timing, resource totals, LCP and CLS of the current
+    document (times in ms since the navigation started) into `page_metrics`.
+    Every document is only recorded once, by the first page that loads it"""
+    driver = page.driver
+    try:
+        metrics = driver.execute_async_script(
+            _PAGE_METRICS_SCRIPT, getattr(driver, "_page_metrics_origin", None)
+        )
+    except WebDriverException:
+        # e.g. the page navigated away while it was measured
+        return
+    if metrics is None:
+        return
+    driver._page_metrics_origin = metrics.pop("origin")
+    page_metrics["pages"].append({"page": type(page).__name__, **metrics})
+
+
+def measured(wait_for_page_to_load):
+    """Records the page metrics once `wait_for_page_to_load` returns; applied
+    to every MeasuredPage, other pages can use it as a decorator"""
+
+    @functools.wraps(wait_for_page_to_load)
+    def wrapper(page, *args, **kwargs):
+        result = wait_for_page_to_load(page, *args, **kwargs)
+        if page_metrics["enabled"]:
+            record_page_metrics(page)
+        return result
+
+    return wrapper
+
+
+def users_from_text(text):
+    """Converts a users count (e.g. '1,234 Users' or '1,234users') to a number"""
+    return int(re.match(r"[\d,]+", text.strip()).group().replace(",", ""))
 
-class Base(Page):
+
+class MeasuredPage:
+    """A pypom Page mixin that records the page metrics after every
+    `wait_for_page_to_load`, including the ones its subclasses define"""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "wait_for_page_to_load" in cls.__dict__:
+            cls.wait_for_page_to_load = measured(cls.__dict__["wait_for_page_to_load"])
+
+    @measured
+    def wait_for_page_to_load(self):
+        return super().wait_for_page_to_load()
+
+
+class Base(MeasuredPage, Page):
     _url = "{base_url}"
     _amo_header = (By.CLASS_NAME, "Header")
 
@@ -19,11 +236,14 @@ class Base(Page):
         super(Base, self).__init__(selenium, base_url, timeout=30, **kwargs)
 
     def wait_for_page_to_load(self):
-        self.wait.until(
-            lambda _: self.find_element(*self._amo_header).is_displayed(),
-            message="AMO header was not loaded",
+        return self.wait_until_ready(
+            self._amo_header, message="AMO header was not loaded"
         )
-        return self
+
+    def wait_until_ready(self, locator, gone=False, message=None):
+        """Waits for an element to be displayed (or hidden, with `gone`) using
+        a single WebDriver command; see `wait_for_ready`"""
+        return wait_for_ready(self, locator, gone=gone, message=message)
 
     def wait_for_title_update(self, term):
         self.wait.until(
@@ -39,8 +259,7 @@ class Base(Page):
         return self
 
     def wait_for_element_to_be_displayed(self, element):
-        self.wait.until(EC.visibility_of_element_located(element))
-        return self
+        return self.wait_until_ready(element)
 
     def wait_for_element_to_be_clickable(self, element):
         self.wait.until(EC.element_to_be_clickable(element))
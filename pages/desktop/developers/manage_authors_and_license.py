@@ -3,8 +3,10 @@ from pypom import Page
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 
+from pages.desktop.base import MeasuredPage
 
-class ManageAuthorsAndLicenses(Page):
+
+class ManageAuthorsAndLicenses(MeasuredPage, Page):
     _radio_button_mozilla_public_license_selector = (By.XPATH, 'id_builtin_0')
     _radio_button_gnu_general_public_license_selector = (By.ID, 'id_builtin_1')
     _save_changes_button_selector = (By.CSS_SELECTOR, 'div.listing-footer button')
@@ -6,10 +6,12 @@ from pypom import Region, Page
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 
+from pages.desktop.base import MeasuredPage
+
 # from pages.desktop.developers.submit_addon import SubmitAddon
 
 
-class ManageVersions(Page):
+class ManageVersions(MeasuredPage, Page):
     _addon_name_title_locator = (By.CSS_SELECTOR, 'div[class="section"] header h2')
     _listing_visibility_section_locator = (
         By.CSS_SELECTOR,
@@ -9,9 +9,10 @@ from selenium.webdriver.support.wait import WebDriverWait
 from selenium.common.exceptions import TimeoutException
 
 from pages.desktop.developers.manage_versions import ManageVersions
+from pages.desktop.base import MeasuredPage
 
 
-class SubmitAddon(Page):
+class SubmitAddon(MeasuredPage, Page):
     """A class holding all the components used for addon submissions in DevHub"""
 
     _my_addons_page_logo_locator = (By.CSS_SELECTOR, ".site-titles")
@@ -290,10 +291,11 @@ class SubmitAddon(Page):
         return self.find_elements(*self._file_upload_process_helptext_locator)
 
     def upload_addon(self, addon):
-        """Selects an addon from the 'sample-addons' folder and uploads it"""
+        """Selects an addon from the 'sample-addons' folder and uploads it; an
+        absolute path (e.g. an archive built by 'make_addon') is used as it is"""
         time.sleep(10)
         button = self.find_element(*self._upload_file_button_locator)
-        archive = Path(f"{os.getcwd()}/sample-addons/{addon}")
+        archive = Path(os.getcwd(), "sample-addons", addon)
         button.send_keys(str(archive))
 
     @property
@@ -454,7 +456,7 @@ class SubmitAddon(Page):
         return self.find_element(*self._failed_validation_message_locator)
 
 
-class ValidationResults(Page):
+class ValidationResults(MeasuredPage, Page):
     _validation_results_header_locator = (
         By.CSS_SELECTOR,
         "div[class='section'] header h2",
@@ -520,7 +522,7 @@ class ValidationResults(Page):
         return self.find_element(*self._validation_compatibility_results_locator)
 
 
-class UploadSource(Page):
+class UploadSource(MeasuredPage, Page):
     _submit_source_code_page_header_locator = (
         By.CSS_SELECTOR,
         ".addon-submission-process h3",
@@ -661,7 +663,7 @@ class UploadSource(Page):
         )
         return self.find_element(*self._version_submitted_text_locator).text
 
-class ListedAddonSubmissionForm(Page):
+class ListedAddonSubmissionForm(MeasuredPage, Page):
     _addon_name_field_locator = (By.CSS_SELECTOR, "#trans-name input:nth-child(1)")
     _edit_addon_slug_link_locator = (By.ID, "edit_slug")
     _edit_addon_slug_field_locator = (By.ID, "id_slug")
@@ -894,7 +896,7 @@ class ListedAddonSubmissionForm(Page):
         return EditAddon(self.driver, self.base_url).wait_for_page_to_load()
 
 
-class ThemeWizard(Page):
+class ThemeWizard(MeasuredPage, Page):
     _wizard_header_locator = (By.CSS_SELECTOR, ".addon-submission-process > h3")
     _theme_name_input_field = (By.ID, "theme-name")
     _upload_theme_image_button_locator = (By.ID, "header-img")
@@ -961,7 +963,7 @@ class ThemeWizard(Page):
         return SubmitAddon(self.driver, self.base_url).wait_for_page_to_load()
 
 
-class SubmissionConfirmationPage(Page):
+class SubmissionConfirmationPage(MeasuredPage, Page):
     _confirmation_page_header_locator = (
         By.CSS_SELECTOR,
         ".addon-submission-process h3",
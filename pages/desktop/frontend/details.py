@@ -1,6 +1,8 @@
 import time
 import re
 
+from collections import namedtuple
+
 from pypom import Region
 
 from selenium.webdriver.common.by import By
@@ -8,9 +10,18 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as expected
 from selenium.webdriver.support import expected_conditions as EC
 
-from pages.desktop.base import Base
+from pages.desktop.base import Base, users_from_text
 from pages.desktop.frontend.reviews import Reviews
 from pages.desktop.frontend.versions import Versions
+from scripts.region_snapshot import SnapshotMixin
+
+StatsSummary = namedtuple("StatsSummary", ["users", "reviews", "star_rating_displayed"])
+
+
+def reviews_from_text(text):
+    """Reads the number of reviews from the reviews badge text (e.g. '4.5 (12 reviews)')"""
+    match = re.search(r'\((\d+)\s+reviews\)', text)
+    return int(match.group(1)) if match else 0
 
 
 class Detail(Base):
@@ -270,10 +281,18 @@ class Detail(Base):
     def block_metadata(self):
         return self.find_element(*self._block_metadata_message)
 
-    class Stats(Region):
+    class Stats(SnapshotMixin, Region):
         _root_locator = (By.CLASS_NAME, "Addon-main-content")
         _stats_users_locator = (By.XPATH, "//div[@data-testid='badge-user-fill']")
+        _stats_users_count_locator = (
+            By.XPATH,
+            "//div[@data-testid='badge-user-fill']//*[contains(@class, 'Badge-content')]",
+        )
         _stats_reviews_locator = (By.XPATH, "//div[@data-testid='badge-star-full']")
+        _stats_reviews_count_locator = (
+            By.XPATH,
+            "//div[@data-testid='badge-star-full']//*[contains(@class, 'Badge-content')]",
+        )
         _stats_ratings_locator = (By.XPATH, "//div[@class='Addon-read-reviews-footer']")
         _rating_score_title_locator = (
             By.CSS_SELECTOR,
@@ -296,7 +315,19 @@ class Detail(Base):
             # document, which on some addons is the "Available on Firefox for
             # Android" badge and yields "Available" instead of the user count
             count = self.addon_user_stats.find_element(By.CSS_SELECTOR, ".Badge-content").text
-            return int(count.split()[0].replace(",", ""))
+            return users_from_text(count)
+
+        def summary(self):
+            """Reads the users count, the reviews count and the star rating
+            visibility with a single snapshot of the region"""
+            stats = self.snapshot(
+                wait_for=["stats_users_count", "stats_reviews_count", "stats_ratings"]
+            )
+            return StatsSummary(
+                users_from_text(stats.stats_users_count.text),
+                reviews_from_text(stats.stats_reviews_count.text),
+                stats.stats_ratings.displayed,
+            )
 
         @property
         def no_user_stats(self):
@@ -313,11 +344,7 @@ class Detail(Base):
         def stats_reviews_count(self):
             count = self.addon_reviews_stats
             text = count.find_element(By.CSS_SELECTOR, ".Badge-content").text
-            match = re.search(r'\((\d+)\s+reviews\)', text)
-            if match:
-                return int(match.group(1))
-            else:
-                return 0
+            return reviews_from_text(text)
             # return int(count.find_element(By.XPATH, "//a").text.replace(",", ""))
 
         def stats_reviews_link(self):
@@ -491,7 +518,7 @@ class Detail(Base):
                 )
                 return self.find_element(*self._permission_description_locator)
 
-    class MoreInfo(Region):
+    class MoreInfo(SnapshotMixin, Region):
         _more_info_header_locator = (By.CSS_SELECTOR, ".AddonMoreInfo header")
         _support_links_locator = (By.CSS_SELECTOR, ".AddonMoreInfo-links a")
         _homepage_link_locator = (By.CSS_SELECTOR, ".AddonMoreInfo-homepage-link")
@@ -5,8 +5,10 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 
 from scripts import custom_waits
+from scripts.region_snapshot import SnapshotMixin
 from pages.desktop.base import Base
 from pages.desktop.frontend.details import Detail
+from regions.desktop.shelves import ShelfSnapshotMixin
 
 
 class Home(Base):
@@ -207,7 +209,7 @@ class Home(Base):
 
                 return Search(self.driver, self.page.base_url)
 
-    class Extensions(Region):
+    class Extensions(ShelfSnapshotMixin, Region):
         _browse_all_locator = (By.CSS_SELECTOR, ".Card-shelf-footer-in-header a")
         _extensions_locator = (By.CLASS_NAME, "SearchResult")
         _promo_card_header_locator = (By.CLASS_NAME, "Card-header-text")
@@ -238,7 +240,7 @@ class Home(Base):
             self.find_element(*self._browse_all_locator).click()
             # TODO: add additional validations when I'm covering collections
 
-    class Themes(Region):
+    class Themes(ShelfSnapshotMixin, Region):
         _browse_all_locator = (By.CSS_SELECTOR, ".Card-shelf-footer-in-header a")
         _themes_locator = (By.CLASS_NAME, "SearchResult--theme")
         _promo_card_header_locator = (By.CLASS_NAME, "Card-header-text")
@@ -264,7 +266,7 @@ class Home(Base):
             )
             return self.find_element(*self._promo_card_header_locator).text
 
-    class PromoShelvesAddons(Region):
+    class PromoShelvesAddons(SnapshotMixin, Region):
         _addon_link_locator = (By.CLASS_NAME, "SearchResult-link")
         _addon_name_locator = (By.CLASS_NAME, "SearchResult-name")
         _addon_icon_locator = (By.CLASS_NAME, "SearchResult-icon")
@@ -3,66 +3,96 @@ import time
 import requests
 import pyotp
 
+from collections import namedtuple
+
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 
 from pages.desktop.base import Base
 from scripts import reusables
+from scripts.account_pool import AccountPool
 
 
-class Login(Base):
-    """The following variables need to be set as Environment Variables
-     when running tests locally. These variables are also set in CircleCI's
-    Project level Environment Variables and are picked up at runtime"""
+# The test accounts, by the name used in the tests. Their email, password and
+# (for accounts with 2FA enabled) authenticator keys are read from Environment
+# Variables when running tests locally. These variables are also set in CircleCI's
+# Project level Environment Variables and are picked up at runtime.
+# A role can have more accounts, numbered from 2, which are leased to the xdist
+# workers (see scripts/account_pool.py): <prefix>_2_EMAIL, <prefix>_2_PASSWORD
+# and <key variable>_2, then <prefix>_3_EMAIL and so on.
+# user: (prefix of the <prefix>_EMAIL and <prefix>_PASSWORD variables,
+#        authenticator key variable for the dev and for the stage/prod environments)
+_ACCOUNTS = {
+    # user that performs normal operations on the site, like writing add-on reviews
+    "regular_user": ("REGULAR_USER", None, None),
+    # user with elevated permissions that can perform special actions on the site
+    "admin": ("ADMIN_USER", None, None),
+    # user who has published add-ons on AMO
+    "developer": ("DEVELOPER", "DEVELOPER_USER_KEY_DEV", "DEVELOPER_USER_KEY_STAGE"),
+    # user who re-creates accounts on AMO after having deleted them previously
+    "reusable_user": ("REUSABLE_USER", None, None),
+    # user used for the ratings tests
+    "rating_user": ("RATING_USER", "RATING_USER_KEY_DEV", "RATING_USER_KEY_STAGE"),
+    # user used for collections tests
+    "collection_user": ("COLLECTION_USER", None, None),
+    # user used for add-on submissions
+    "submissions_user": (
+        "SUBMISSIONS_USER",
+        "SUBMISSIONS_USER_KEY_DEV",
+        "SUBMISSIONS_USER_KEY_STAGE",
+    ),
+    # user used in API tests
+    "api_user": ("API_USER", "API_USER_KEY_DEV", "API_USER_KEY_STAGE"),
+    # user with a mozilla account that has specific submission permissions
+    "staff_user": ("STAFF_USER", "STAFF_USER_KEY_DEV", "STAFF_USER_KEY_STAGE"),
+    # account added to the list of banned user emails for rating and addon submissions
+    "restricted_user": ("RESTRICTED_USER", None, None),
+    # account for reviewer tools added in order to help with release and coverage tests(doesn't have full access)
+    "reviewer_user": (
+        "REVIEWER_TOOLS_USER",
+        "REVIEWER_TOOLS_USER_KEY",
+        "REVIEWER_TOOLS_USER_KEY",
+    ),
+}
+
+Credentials = namedtuple("Credentials", ["email", "password", "totp_key"])
+
+
+def _credentials_registry():
+    """Maps (user, environment) to the credentials of the user's accounts; the
+    environment is either 'dev' or 'stage' (stage keys are also used on prod)"""
+    registry = {}
+    for user, (prefix, dev_key, stage_key) in _ACCOUNTS.items():
+        suffixes = [""]
+        while os.environ.get(f"{prefix}_{len(suffixes) + 1}_EMAIL"):
+            suffixes.append(f"_{len(suffixes) + 1}")
+        for environment, key in (("dev", dev_key), ("stage", stage_key)):
+            registry[(user, environment)] = [
+                Credentials(
+                    os.environ.get(f"{prefix}{suffix}_EMAIL"),
+                    os.environ.get(f"{prefix}{suffix}_PASSWORD"),
+                    os.environ.get(f"{key}{suffix}", "") if key else "",
+                )
+                for suffix in suffixes
+            ]
+    return registry
+
 
-    # 1. user that performs normal operations on the site, like writing add-on reviews
-    REGULAR_USER_EMAIL = os.environ.get("REGULAR_USER_EMAIL")
-    REGULAR_USER_PASSWORD = os.environ.get("REGULAR_USER_PASSWORD")
-    # 2. user with elevated permissions that can perform special actions on the site
-    ADMIN_USER_EMAIL = os.environ.get("ADMIN_USER_EMAIL")
-    ADMIN_USER_PASSWORD = os.environ.get("ADMIN_USER_PASSWORD")
-    # 3. user who has published add-ons on AMO
-    DEVELOPER_EMAIL = os.environ.get("DEVELOPER_EMAIL")
-    DEVELOPER_PASSWORD = os.environ.get("DEVELOPER_PASSWORD")
-    # 4. user who re-creates accounts on AMO after having deleted them previously
-    REUSABLE_USER_EMAIL = os.environ.get("REUSABLE_USER_EMAIL")
-    REUSABLE_USER_PASSWORD = os.environ.get("REUSABLE_USER_PASSWORD")
-    # 5. user used for the ratings tests
-    RATING_USER_EMAIL = os.environ.get("RATING_USER_EMAIL")
-    RATING_USER_PASSWORD = os.environ.get("RATING_USER_PASSWORD")
-    # 6. user used for collections tests
-    COLLECTION_USER_EMAIL = os.environ.get("COLLECTION_USER_EMAIL")
-    COLLECTION_USER_PASSWORD = os.environ.get("COLLECTION_USER_PASSWORD")
-    # 7. user used for add-on submissions
-    SUBMISSIONS_USER_EMAIL = os.environ.get("SUBMISSIONS_USER_EMAIL")
-    SUBMISSIONS_USER_PASSWORD = os.environ.get("SUBMISSIONS_USER_PASSWORD")
-    # 8. user used in API tests
-    API_USER_EMAIL = os.environ.get("API_USER_EMAIL")
-    API_USER_PASSWORD = os.environ.get("API_USER_PASSWORD")
-    # 9. user with a mozilla account that has specific submission permissions
-    STAFF_USER_EMAIL = os.environ.get("STAFF_USER_EMAIL")
-    STAFF_USER_PASSWORD = os.environ.get("STAFF_USER_PASSWORD")
-    # 10. account added to the list of banned user emails for rating and addon submissions
-    RESTRICTED_USER_EMAIL = os.environ.get("RESTRICTED_USER_EMAIL")
-    RESTRICTED_USER_PASSWORD = os.environ.get("RESTRICTED_USER_PASSWORD")
-    # 11. account for reviewer tools added in order to help with release and coverage tests(doesn't have full access)
-    REVIEWER_TOOLS_USER_EMAIL = os.environ.get("REVIEWER_TOOLS_USER_EMAIL")
-    REVIEWER_TOOLS_USER_PASSWORD = os.environ.get("REVIEWER_TOOLS_USER_PASSWORD")
+CREDENTIALS = _credentials_registry()
+ACCOUNT_POOL = AccountPool(
+    {user: len(CREDENTIALS[(user, "stage")]) for user in _ACCOUNTS}
+)
 
-    # KEYS FOR AUTHENTICATOR DEV
-    DEVELOPER_USER_KEY_DEV = os.environ.get("DEVELOPER_USER_KEY_DEV")
-    RATING_USER_KEY_DEV = os.environ.get("RATING_USER_KEY_DEV")
-    SUBMISSIONS_USER_KEY_DEV = os.environ.get("SUBMISSIONS_USER_KEY_DEV")
-    API_USER_KEY_DEV = os.environ.get("API_USER_KEY_DEV")
-    STAFF_USER_KEY_DEV = os.environ.get("STAFF_USER_KEY_DEV")
-    # KEYS FOR AUTHENTICATOR STAGE
-    DEVELOPER_USER_KEY_STAGE = os.environ.get("DEVELOPER_USER_KEY_STAGE")
-    RATING_USER_KEY_STAGE = os.environ.get("RATING_USER_KEY_STAGE")
-    SUBMISSIONS_USER_KEY_STAGE = os.environ.get("SUBMISSIONS_USER_KEY_STAGE")
-    API_USER_KEY_STAGE = os.environ.get("API_USER_KEY_STAGE")
-    STAFF_USER_KEY_STAGE = os.environ.get("STAFF_USER_KEY_STAGE")
-    REVIEWER_TOOLS_USER_KEY = os.environ.get("REVIEWER_TOOLS_USER_KEY")
+# the last TOTP time step used for each authenticator key; FxA doesn't accept
+# the same code twice, so a second login with the same key waits for a new code
+_used_totp_steps = {}
+
+
+class Login(Base):
+    # a TOTP code that expires sooner than this (in seconds) is likely to be
+    # rejected by the time it is submitted, so the next one is used instead
+    TOTP_MIN_VALIDITY = 5
 
     _email_locator = (By.NAME, "email")
     _continue_locator = (By.CSS_SELECTOR, ".button-row button")
@@ -85,88 +115,30 @@ class Login(Base):
         self.wait_for_element_to_be_displayed(self._login_btn_locator)
         return self.find_element(*self._login_btn_locator).click()
 
+    def credentials(self, user):
+        """The credentials of the account of `user` leased by this process"""
+        environment = "dev" if "dev.allizom" in self.base_url else "stage"
+        # unknown users log in as the regular user
+        if (user, environment) not in CREDENTIALS:
+            user = "regular_user"
+        return CREDENTIALS[(user, environment)][ACCOUNT_POOL.slot(user)]
+
     def account(self, user):
-        if user == "reusable_user":
-            self.fxa_login(self.REUSABLE_USER_EMAIL, self.REUSABLE_USER_PASSWORD, "")
-        elif user == "admin":
-            self.fxa_login(self.ADMIN_USER_EMAIL, self.ADMIN_USER_PASSWORD, "")
-        elif user == "developer":
-            if "dev.allizom" not in self.base_url:
-                self.fxa_login(
-                    self.DEVELOPER_EMAIL,
-                    self.DEVELOPER_PASSWORD,
-                    self.DEVELOPER_USER_KEY_STAGE,
-                )
-            else:
-                self.fxa_login(
-                    self.DEVELOPER_EMAIL,
-                    self.DEVELOPER_PASSWORD,
-                    self.DEVELOPER_USER_KEY_DEV,
-                )
-        elif user == "rating_user":
-            if "dev.allizom" not in self.base_url:
-                self.fxa_login(
-                    self.RATING_USER_EMAIL,
-                    self.RATING_USER_PASSWORD,
-                    self.RATING_USER_KEY_STAGE,
-                )
-            else:
-                self.fxa_login(
-                    self.RATING_USER_EMAIL,
-                    self.RATING_USER_PASSWORD,
-                    self.RATING_USER_KEY_DEV,
-                )
-        elif user == "collection_user":
-            self.fxa_login(
-                self.COLLECTION_USER_EMAIL, self.COLLECTION_USER_PASSWORD, ""
-            )
-        elif user == "submissions_user":
-            if "dev.allizom" not in self.base_url:
-                self.fxa_login(
-                    self.SUBMISSIONS_USER_EMAIL,
-                    self.SUBMISSIONS_USER_PASSWORD,
-                    self.SUBMISSIONS_USER_KEY_STAGE,
-                )
-            else:
-                self.fxa_login(
-                    self.SUBMISSIONS_USER_EMAIL,
-                    self.SUBMISSIONS_USER_PASSWORD,
-                    self.SUBMISSIONS_USER_KEY_DEV,
-                )
-        elif user == "api_user":
-            if "dev.allizom" not in self.base_url:
-                self.fxa_login(
-                    self.API_USER_EMAIL, self.API_USER_PASSWORD, self.API_USER_KEY_STAGE
-                )
-            else:
-                self.fxa_login(
-                    self.API_USER_EMAIL, self.API_USER_PASSWORD, self.API_USER_KEY_DEV
-                )
-        elif user == "staff_user":
-            if "dev.allizom" not in self.base_url:
-                self.fxa_login(
-                    self.STAFF_USER_EMAIL,
-                    self.STAFF_USER_PASSWORD,
-                    self.STAFF_USER_KEY_STAGE,
-                )
-            else:
-                self.fxa_login(
-                    self.STAFF_USER_EMAIL,
-                    self.STAFF_USER_PASSWORD,
-                    self.STAFF_USER_KEY_DEV,
-                )
-        elif user == "restricted_user":
-            self.fxa_login(
-                self.RESTRICTED_USER_EMAIL, self.RESTRICTED_USER_PASSWORD, ""
-            )
-        elif user == "reviewer_user":
-            self.fxa_login(
-                self.REVIEWER_TOOLS_USER_EMAIL,
-                self.REVIEWER_TOOLS_USER_PASSWORD,
-                self.REVIEWER_TOOLS_USER_KEY
-            )
-        else:
-            self.fxa_login(self.REGULAR_USER_EMAIL, self.REGULAR_USER_PASSWORD, "")
+        self.fxa_login(*self.credentials(user))
+
+    def totp_code(self, key):
+        """Returns a code that is valid long enough to be submitted and that
+        wasn't used before, waiting for the next time step if needed"""
+        totp = pyotp.TOTP(key)
+        now = time.time()
+        step = int(now // totp.interval)
+        remaining = totp.interval - now % totp.interval
+        last_used = _used_totp_steps.get(key, -1)
+        if remaining < self.TOTP_MIN_VALIDITY or last_used >= step:
+            step = max(step, last_used) + 1
+            time.sleep(step * totp.interval - now)
+        _used_totp_steps[key] = step
+        return totp.at(step * totp.interval)
 
     def fxa_login(self, email, password, key):
         self.find_element(*self._email_locator).send_keys(email)
@@ -207,20 +179,25 @@ class Login(Base):
         if key != "":
             self.wait.until(EC.url_contains("signin_totp_code"))
             self.wait.until(EC.visibility_of_element_located(self._2fa_input_locator))
-            time.sleep(30)
-            totp = pyotp.TOTP(key)
-            self.find_element(*self._2fa_input_locator).send_keys(totp.now())
-            self.find_element(*self._confirm_2fa_button_locator).click()
-            time.sleep(5)
-            for max_retries in range(0, 2):
-                if self.is_element_displayed(*self._error_2fa_code_locator):
-                    time.sleep(500)
-                    totp = pyotp.TOTP(key)
-                    self.find_element(*self._2fa_input_locator).clear()
-                    self.find_element(*self._2fa_input_locator).send_keys(totp.now())
-                    self.find_element(*self._confirm_2fa_button_locator).click()
-                else:
+            for attempt in range(3):
+                self.find_element(*self._2fa_input_locator).clear()
+                self.find_element(*self._2fa_input_locator).send_keys(self.totp_code(key))
+                if attempt:
+                    # the error of the rejected code goes away once the input changes
+                    self.wait.until(
+                        EC.invisibility_of_element_located(self._error_2fa_code_locator),
+                        message="The error of the previous 2FA code is still displayed",
+                    )
+                self.find_element(*self._confirm_2fa_button_locator).click()
+                # FxA either moves on to AMO or shows an error for a rejected code
+                self.wait.until(
+                    lambda _: "signin_totp_code" not in self.driver.current_url
+                    or self.is_element_displayed(*self._error_2fa_code_locator),
+                    message="FxA did not respond to the 2FA code",
+                )
+                if "signin_totp_code" not in self.driver.current_url:
                     break
+                print(f"2FA code was rejected on attempt {attempt + 1}")
 
         # wait for transition between FxA page and AMO
         # self.wait.until(
@@ -5,8 +5,16 @@ from selenium.webdriver.support import expected_conditions as expected
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from pages.desktop.base import MeasuredPage, users_from_text, wait_for_ready
+from scripts.region_snapshot import SnapshotMixin, snapshot_regions
 
-class Search(Page):
+
+def rating_from_title(title):
+    """Reads the rating from the title of the rating stars (e.g. 'Rated 4.5 out of 5')"""
+    return float(title.split()[1])
+
+
+class Search(MeasuredPage, Page):
     _context_card_locator = (By.CLASS_NAME, "SearchContextCard-header")
     _search_box_locator = (By.CLASS_NAME, "AutoSearchInput-query")
     _submit_button_locator = (By.CLASS_NAME, "AutoSearchInput-submit-button")
@@ -20,11 +28,12 @@ class Search(Page):
     _selected_page_locator = (By.CLASS_NAME, "Paginate-page-number")
 
     def wait_for_page_to_load(self):
-        self.wait.until(
-            expected.invisibility_of_element_located((By.CLASS_NAME, "LoadingText")),
+        return wait_for_ready(
+            self,
+            (By.CLASS_NAME, "LoadingText"),
+            gone=True,
             message="Search page could not be loaded",
         )
-        return self
 
     def wait_for_contextcard_update(self, value):
         self.wait.until(
@@ -124,6 +133,25 @@ class Search(Page):
             items = self.find_elements(*self._extension_locator)
             return [self.ResultListItems(self, el) for el in items]
 
+        def users_counts(self, results=None):
+            """The users count of every result (or of the given `results`),
+            read with a single snapshot instead of a lookup per result"""
+            results = self.search_results if results is None else results
+            snapshots = snapshot_regions(results, wait_for=["users_number"])
+            return [
+                users_from_text(snapshot.users_number.text) for snapshot in snapshots
+            ]
+
+        def ratings(self, results=None):
+            """The rating of every result (or of the given `results`),
+            read with a single snapshot instead of a lookup per result"""
+            results = self.search_results if results is None else results
+            snapshots = snapshot_regions(results, wait_for=["rating"])
+            return [
+                rating_from_title(snapshot.rating[0].attributes["title"])
+                for snapshot in snapshots
+            ]
+
         def click_search_result(self, count):
             self.wait.until(EC.element_to_be_clickable(self._result_link_locator))
             self.find_elements(*self._result_link_locator)[count].click()
@@ -131,7 +159,7 @@ class Search(Page):
 
             return Detail(self.driver, self.page.base_url).wait_for_page_to_load()
 
-        class ResultListItems(Region):
+        class ResultListItems(SnapshotMixin, Region):
             _rating_locator = (By.CSS_SELECTOR, ".Rating--small")
             _search_item_name_locator = (By.CSS_SELECTOR, ".SearchResult-link")
             # scope these to the result card (CSS is relative to the region
@@ -176,14 +204,14 @@ class Search(Page):
                     EC.visibility_of_element_located(self._users_number_locator)
                 )
                 users = self.find_element(*self._users_number_locator).text
-                return int(users.split()[0].replace(",", "").replace("users", ""))
+                return users_from_text(users)
 
             @property
             def rating(self):
                 """Returns the rating"""
                 self.wait.until(EC.visibility_of_element_located(self._rating_locator))
                 rating = self.find_element(*self._rating_locator).get_property("title")
-                return float(rating.split()[1])
+                return rating_from_title(rating)
 
             @property
             def search_result_icon(self):
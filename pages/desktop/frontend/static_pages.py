@@ -3,6 +3,7 @@ from selenium.webdriver.support import expected_conditions as EC
 
 from pages.desktop.base import Base
 from pages.desktop.frontend.details import Detail
+from scripts.link_checker import page_urls
 
 
 class StaticPages(Base):
@@ -74,6 +75,14 @@ class StaticPages(Base):
         )
         return self.find_elements(*self._content_card_links_locator)
 
+    @property
+    def page_link_urls(self):
+        """The urls of all the page links, read with a single script call"""
+        self.wait.until(
+            EC.visibility_of_element_located(self._content_card_links_locator)
+        )
+        return page_urls(self.driver, self._content_card_links_locator)
+
     @property
     def thunderbird_link(self):
         self.wait.until(
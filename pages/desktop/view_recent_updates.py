@@ -6,8 +6,10 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 
+from pages.desktop.base import MeasuredPage
 
-class ViewRecentUpdates(Page):
+
+class ViewRecentUpdates(MeasuredPage, Page):
     _header_name_locator = (By.XPATH, "//h1[contains(text(), 'Manage Your Updates')]")
     _list_section_name_locator = (By.XPATH, "//h2[contains(text(), 'Recent Updates')]")
 
@@ -3,6 +3,20 @@ from pypom import Region
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 
+from scripts.region_snapshot import SnapshotMixin, snapshot_regions
+
+
+class ShelfSnapshotMixin:
+    """Adds `snapshot_list()` to the shelf regions, whose `list` holds their
+    add-on items (SnapshotMixin regions with a name, icon and users count)"""
+
+    def snapshot_list(self):
+        """Snapshots of all the shelf items, taken in a single round-trip
+        once every item displays its name, icon and users count"""
+        return snapshot_regions(
+            self.list, wait_for=['addon_name', 'addon_icon', 'addon_users']
+        )
+
 
 class Shelves(Region):
 
@@ -28,7 +42,7 @@ class Shelves(Region):
         el = self.find_element(*self._trending_addons_locator)
         return self.ShelfList(self, el)
 
-    class ShelfList(Region):
+    class ShelfList(ShelfSnapshotMixin, Region):
         _addon_item_locator = (By.CLASS_NAME, 'SearchResult')
         _promo_card_header_locator = (By.CLASS_NAME, 'Card-header')
         _browse_all_locator = (By.CSS_SELECTOR, '.Card-footer-link > a')
@@ -52,7 +66,7 @@ class Shelves(Region):
             search = Search(self.driver, self.page)
             return search.wait_for_page_to_load()
 
-        class ShelfDetail(Region):
+        class ShelfDetail(SnapshotMixin, Region):
             _addon_name_locator = (By.CLASS_NAME, 'SearchResult-name')
             _addon_icon_locator = (By.CLASS_NAME, 'SearchResult-icon')
             _addon_users_locator = (By.CSS_SELECTOR, 'span[class="SearchResult-users-text"]')
@@ -0,0 +1,58 @@
+"""Leases one account per role to every test process.
+
+A role (e.g. "submissions_user") can have several accounts, so suites that
+change the state of their user can run on several xdist workers at once. The
+first time a process needs a role it leases a free account of that role and
+keeps it until the process exits:
+
+* the lease is a lock on '.sessions/leases/<role>-<n>.lock', which the OS
+  releases when the process ends, even if it crashes
+* when every account of a role is already leased (more workers than accounts),
+  the process shares an account with another worker, like every worker did
+  before there was a pool
+"""
+
+import os
+import warnings
+
+from scripts.file_lock import try_lock
+
+
+class AccountPool:
+    def __init__(self, sizes, directory=os.path.join(".sessions", "leases")):
+        # the number of accounts of every role
+        self.sizes = sizes
+        self.directory = directory
+        self.slots = {}
+        # the open lock files, which hold the leases for the life of the process
+        self._leases = []
+
+    def slot(self, role):
+        """The index of the account of `role` leased by this process"""
+        if role not in self.slots:
+            self.slots[role] = self._lease(role)
+        return self.slots[role]
+
+    def name(self, role):
+        """The name of the leased account, e.g. for its stored session; the
+        first account of a role keeps the role name"""
+        slot = self.slot(role)
+        return role if slot == 0 else f"{role}-{slot + 1}"
+
+    def _lease(self, role):
+        size = self.sizes.get(role, 1)
+        if size == 1:
+            return 0
+        os.makedirs(self.directory, exist_ok=True)
+        for slot in range(size):
+            file = open(os.path.join(self.directory, f"{role}-{slot + 1}.lock"), "a+")
+            if try_lock(file):
+                self._leases.append(file)
+                return slot
+            file.close()
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+        slot = int(worker.lstrip("gw") or 0) % size
+        warnings.warn(
+            f'All {size} "{role}" accounts are in use, sharing account {slot + 1}'
+        )
+        return slot
@@ -0,0 +1,120 @@
+"""A pytest-xdist scheduler that runs `serial` tests in parallel when they
+don't share an account.
+
+The `serial` tests change the state of the user accounts they log in with
+(collections, ratings, submissions ...), so they can't run at the same time
+as another test using the same account. Without this scheduler they run on a
+single worker. With ``--account-scheduling`` every `serial` test locks:
+
+* the accounts of its `login` and `create_session` markers ("user:<name>")
+* any other resource named by a `locks` marker, e.g.
+  ``@pytest.mark.locks("collection:my-collection", "addon:my-addon")``
+* its module, since the tests of a serial module often depend on each other
+
+Tests that lock a common resource, directly or through other tests, form one
+work unit which runs on a single worker in collection order; units that hold
+disjoint resources run in parallel. Tests that are not `serial` lock nothing
+and are load balanced as usual. Tests whose locks the workers couldn't save
+(e.g. with the cache provider disabled) all run in one unit, as without the
+scheduler.
+"""
+
+import warnings
+
+import pytest
+
+from xdist.scheduler import LoadScopeScheduling
+
+
+# the work unit of the tests whose locks are unknown
+_UNSCHEDULED = "account_scheduler:unscheduled"
+
+
+def _cache_key(testrunuid):
+    return f"account_scheduler/{testrunuid}"
+
+
+def item_locks(item):
+    """The resources locked by a test item"""
+    if item.get_closest_marker("serial") is None:
+        return []
+    locks = {f"module:{item.nodeid.split('::')[0]}"}
+    for name in ("login", "create_session"):
+        for marker in item.iter_markers(name):
+            locks.update(f"user:{user}" for user in marker.args)
+    for marker in item.iter_markers("locks"):
+        locks.update(marker.args)
+    return sorted(locks)
+
+
+def work_units(locks):
+    """Groups the test ids of `locks` (test id -> resources) that share a
+    resource, directly or transitively; returns the work unit name of every
+    test that locks something"""
+    parent = {}
+
+    def find(resource):
+        parent.setdefault(resource, resource)
+        while parent[resource] != resource:
+            parent[resource] = parent[parent[resource]]
+            resource = parent[resource]
+        return resource
+
+    for resources in locks.values():
+        for resource in resources[1:]:
+            parent[find(resource)] = find(resources[0])
+    return {
+        nodeid: find(resources[0]) for nodeid, resources in locks.items() if resources
+    }
+
+
+class AccountScheduling(LoadScopeScheduling):
+    """LoadScopeScheduling with the work units built from the test locks.
+
+    The controller process doesn't collect the tests, so the workers save the
+    locks of their items to the pytest cache before reporting their collection
+    and the scheduler reads them once every worker has reported."""
+
+    def __init__(self, config, log=None):
+        super().__init__(config, log)
+        self.testrunuid = None
+        self.locks = None
+        self.units = None
+        self.missing_locks = False
+
+    def add_node_collection(self, node, collection):
+        super().add_node_collection(node, collection)
+        self.testrunuid = node.workerinput["testrunuid"]
+
+    def _split_scope(self, nodeid):
+        if self.units is None:
+            self.locks = self.config.cache.get(_cache_key(self.testrunuid), {})
+            self.units = work_units(self.locks)
+        if nodeid not in self.locks:
+            # without its locks (e.g. the cache is disabled or can't be written)
+            # a test could be serial, so every such test runs in one unit
+            if not self.missing_locks:
+                warnings.warn(
+                    "The account scheduler found no locks for some tests, they "
+                    "run one after the other on a single worker"
+                )
+            self.missing_locks = True
+            return _UNSCHEDULED
+        return self.units.get(nodeid, nodeid)
+
+
+class AccountSchedulerPlugin:
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        return AccountScheduling(config, log)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection_finish(self, session):
+        # runs on the workers, before xdist sends the collection to the controller
+        workerinput = getattr(session.config, "workerinput", None)
+        if workerinput is None:
+            return
+        session.config.cache.set(
+            _cache_key(workerinput["testrunuid"]),
+            {item.nodeid: item_locks(item) for item in session.items},
+        )
@@ -8,9 +8,193 @@ update flow we need a way to start the install of an arbitrary version
 ``AddonManager.installAddonFromAOM`` does. This helper triggers it from
 Marionette's chrome context, leaving the standard install confirmation
 door-hanger for foxpuppet to drive.
+
+:func:`installed_addons` reads the state of every installed add-on from the
+``AddonManager`` with a single chrome-context call, for tests that need to
+check what is installed rather than how ``about:addons`` renders it.
+"""
+
+from collections import namedtuple
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from pages.desktop.base import ensure_script_timeout
+
+# the add-on types a test can install; built-in and system add-ons are
+# never touched by the reset
+ADDON_TYPES = ("extension", "theme", "locale", "dictionary")
+DEFAULT_THEME_ID = "default-theme@mozilla.org"
+# update prefs changed by the webext suites through the about:addons Options
+# menu ("Update Add-ons Automatically"); the update urls set by conftest are
+# left alone
+_UPDATE_PREFS = ["extensions.update.enabled", "extensions.update.autoUpdateDefault"]
+
+# `updates` is the "Allow automatic updates" setting of the add-on: "default",
+# "enabled" or "disabled"; `permissions` holds both the API permissions and the
+# host permissions granted to an extension
+InstalledAddon = namedtuple(
+    "InstalledAddon",
+    [
+        "id",
+        "name",
+        "creator",
+        "version",
+        "type",
+        "active",
+        "builtin",
+        "updates",
+        "pending_upgrade",
+        "permissions",
+    ],
+)
+
+_INSTALLED_ADDONS_SCRIPT = """
+const callback = arguments[arguments.length - 1];
+const [addonTypes] = arguments;
+(async () => {
+    try {
+        const { AddonManager } = ChromeUtils.importESModule(
+            "resource://gre/modules/AddonManager.sys.mjs"
+        );
+        const updates = {
+            [AddonManager.AUTOUPDATE_DISABLE]: "disabled",
+            [AddonManager.AUTOUPDATE_DEFAULT]: "default",
+            [AddonManager.AUTOUPDATE_ENABLE]: "enabled",
+        };
+        const addons = [];
+        for (const addon of await AddonManager.getAddonsByTypes(addonTypes)) {
+            // add-ons pending uninstall have no card in about:addons either
+            if (addon.isSystem || addon.hidden ||
+                addon.pendingOperations & AddonManager.PENDING_UNINSTALL) {
+                continue;
+            }
+            const permissions = addon.userPermissions || {};
+            addons.push([
+                addon.id,
+                addon.name,
+                addon.creator ? addon.creator.name : null,
+                addon.version,
+                addon.type,
+                addon.isActive,
+                addon.isBuiltin,
+                updates[addon.applyBackgroundUpdates] || null,
+                Boolean(addon.pendingUpgrade),
+                [...(permissions.permissions || []), ...(permissions.origins || [])],
+            ]);
+        }
+        callback({ addons });
+    } catch (e) {
+        callback({ error: e.message });
+    }
+})();
 """
 
 
+class InstalledAddons(tuple):
+    """The add-ons returned by :func:`installed_addons`, in AddonManager order"""
+
+    def of_type(self, addon_type):
+        return InstalledAddons(addon for addon in self if addon.type == addon_type)
+
+    @property
+    def ids(self):
+        return [addon.id for addon in self]
+
+    @property
+    def names(self):
+        return [addon.name for addon in self]
+
+    def get(self, addon_id):
+        return next((addon for addon in self if addon.id == addon_id), None)
+
+    @property
+    def active_theme(self):
+        return next(
+            (addon for addon in self if addon.type == "theme" and addon.active), None
+        )
+
+
+def installed_addons(driver, addon_types=ADDON_TYPES):
+    """Return an :class:`InstalledAddons` snapshot of the add-ons of
+    ``addon_types`` known to the AddonManager, read with one async call in
+    Marionette's chrome context. System and hidden add-ons are left out;
+    built-in ones (e.g. the default themes) are flagged with ``builtin``."""
+    with driver.context(driver.CONTEXT_CHROME):
+        result = driver.execute_async_script(
+            _INSTALLED_ADDONS_SCRIPT, list(addon_types)
+        )
+    if "error" in result:
+        raise WebDriverException(f"Could not read the installed add-ons: {result['error']}")
+    return InstalledAddons(InstalledAddon(*addon) for addon in result["addons"])
+
+
+_RESET_ADDONS_SCRIPT = """
+const callback = arguments[arguments.length - 1];
+const [keepIds, addonTypes, defaultThemeId, updatePrefs] = arguments;
+(async () => {
+    try {
+        const { AddonManager } = ChromeUtils.importESModule(
+            "resource://gre/modules/AddonManager.sys.mjs"
+        );
+        // installs still downloading or waiting behind a door-hanger
+        const cancelled = [];
+        for (const install of await AddonManager.getAllInstalls()) {
+            if (install.state === AddonManager.STATE_INSTALLED ||
+                install.state === AddonManager.STATE_CANCELLED) {
+                continue;
+            }
+            try {
+                install.cancel();
+                cancelled.push(install.sourceURI ? install.sourceURI.spec : null);
+            } catch (e) {
+                // the install finished in the meantime; it's uninstalled below
+            }
+        }
+        const uninstalled = [];
+        for (const addon of await AddonManager.getAddonsByTypes(addonTypes)) {
+            if (keepIds.includes(addon.id) || addon.isBuiltin || addon.isSystem) {
+                continue;
+            }
+            await addon.uninstall();
+            uninstalled.push(addon.id);
+        }
+        // removing the active theme enables the default one, but a test can
+        // also switch between the built-in themes
+        const defaultTheme = await AddonManager.getAddonByID(defaultThemeId);
+        if (defaultTheme && !defaultTheme.isActive) {
+            await defaultTheme.enable();
+        }
+        for (const name of updatePrefs) {
+            Services.prefs.clearUserPref(name);
+        }
+        callback({ uninstalled, cancelled });
+    } catch (e) {
+        callback({ error: e.message });
+    }
+})();
+"""
+
+
+def reset_addon_state(driver, keep_ids=()):
+    """Put the AddonManager back into the state of a fresh profile, with one
+    chrome-context call: pending installs are cancelled, every add-on except
+    the built-in ones and ``keep_ids`` (e.g. the WAF bypass add-on) is
+    uninstalled, the default theme is enabled and the update prefs are reset.
+
+    Returns ``{"uninstalled": [ids], "cancelled": [urls]}``."""
+    with driver.context(driver.CONTEXT_CHROME):
+        result = driver.execute_async_script(
+            _RESET_ADDONS_SCRIPT,
+            list(keep_ids),
+            list(ADDON_TYPES),
+            DEFAULT_THEME_ID,
+            _UPDATE_PREFS,
+        )
+    if "error" in result:
+        raise WebDriverException(f"Could not reset the add-ons: {result['error']}")
+    return result
+
+
 def install_from_xpi_url(driver, xpi_url):
     """Kick off a Firefox add-on install for ``xpi_url`` and return when
     the install permission door-hanger is showing.
@@ -67,6 +251,9 @@ def accept_popup_notification(driver, notification, button="primary"):
 
     ``button`` selects which door-hanger button to press: ``"primary"``
     (accept/install), ``"secondary"`` (cancel) or ``"close"``.
+
+    :func:`handle_door_hanger` waits for the door-hanger and presses the
+    button in one command, for tests that don't need the foxpuppet object.
     """
     finder = {
         "primary": notification.find_primary_button,
@@ -85,6 +272,134 @@ def accept_popup_notification(driver, notification, button="primary"):
         )
 
 
+_DIRECT_INSTALL_SCRIPT = """
+const callback = arguments[arguments.length - 1];
+const [url, hash] = arguments;
+(async () => {
+    try {
+        const { AddonManager } = ChromeUtils.importESModule(
+            "resource://gre/modules/AddonManager.sys.mjs"
+        );
+        const install = await AddonManager.getInstallForURL(url, {
+            hash: hash || undefined,
+            telemetryInfo: { source: "test" },
+        });
+        // without a promptHandler the install doesn't ask for permissions
+        const addon = await install.install();
+        if (!addon.isActive) {
+            await addon.enable();
+        }
+        callback({ id: addon.id });
+    } catch (e) {
+        callback({ error: e.message || String(e) });
+    }
+})();
+"""
+
+
+def install_directly(driver, xpi_url, file_hash=None):
+    """Install ``xpi_url`` through ``AddonManager.getInstallForURL`` in chrome
+    context, without any door-hanger, and return the id of the add-on once it
+    is enabled. Meant for tests that only need an add-on as a precondition;
+    the install UI is covered by the install suites.
+
+    ``file_hash`` ("sha256:<hex digest>") makes Firefox verify the download."""
+    with driver.context(driver.CONTEXT_CHROME):
+        result = driver.execute_async_script(
+            _DIRECT_INSTALL_SCRIPT, xpi_url, file_hash
+        )
+    if "error" in result:
+        raise WebDriverException(f"Could not install {xpi_url}: {result['error']}")
+    return result["id"]
+
+
+# the <popupnotification> elements behind the foxpuppet notification classes;
+# Firefox has used different ids for the same door-hanger over time
+DOOR_HANGER_IDS = {
+    "AddOnInstallBlocked": ["addon-install-blocked-notification"],
+    "AddOnInstallConfirmation": [
+        "addon-webext-permissions-notification",
+        "addon-install-confirmation-notification",
+    ],
+    "AddOnInstallComplete": [
+        "addon-installed-notification",
+        "addon-install-complete-notification",
+    ],
+    "AddOnInstallFailed": ["addon-install-failed-notification"],
+}
+
+_DOOR_HANGER_SCRIPT = """
+const callback = arguments[arguments.length - 1];
+const [ids, button, timeout] = arguments;
+const win = Services.wm.getMostRecentWindow("navigator:browser");
+const panel = win.PopupNotifications.panel;
+const buttons = {
+    primary: ".popup-notification-primary-button",
+    secondary: ".popup-notification-secondary-button",
+    close: ".popup-notification-closebutton",
+};
+function shown() {
+    if (panel.state !== "open") return null;
+    return ids
+        .map((id) => win.document.getElementById(id))
+        .find((notification) => notification && !notification.hidden) || null;
+}
+let observer, timer;
+function finish(notification) {
+    observer.disconnect();
+    panel.removeEventListener("popupshown", check);
+    win.clearTimeout(timer);
+    if (!notification) {
+        callback([false, null]);
+        return;
+    }
+    if (button) {
+        // the command handler lives on the inner <button> of a <moz-button>
+        const host = notification.querySelector(buttons[button]);
+        const inner = host.shadowRoot && host.shadowRoot.querySelector("button");
+        (inner || host).click();
+    }
+    callback([true, notification.id]);
+}
+function check() {
+    const notification = shown();
+    if (notification) finish(notification);
+}
+// the panel fires 'popupshown' when it opens; a door-hanger that replaces
+// another one in an open panel only changes its children
+observer = new win.MutationObserver(check);
+observer.observe(panel, { childList: true, subtree: true, attributes: true });
+panel.addEventListener("popupshown", check);
+timer = win.setTimeout(() => finish(null), timeout * 1000);
+check();
+"""
+
+
+def handle_door_hanger(driver, notification, button="primary", timeout=30):
+    """Wait for the `notification` door-hanger and press `button` on it
+    ("primary", "secondary", "close" or ``None`` to only wait), with a single
+    chrome-context command: the script listens for the notification panel
+    instead of polling it from Python like foxpuppet's
+    ``wait_for_notification``.
+
+    `notification` is a foxpuppet notification class (e.g.
+    ``firefox_notifications.AddOnInstallConfirmation``) or a list of
+    <popupnotification> ids. Returns the id of the door-hanger that was shown."""
+    ids = (
+        DOOR_HANGER_IDS[notification.__name__]
+        if isinstance(notification, type)
+        else list(notification)
+    )
+    ensure_script_timeout(driver, timeout)
+    with driver.context(driver.CONTEXT_CHROME):
+        shown, notification_id = driver.execute_async_script(
+            _DOOR_HANGER_SCRIPT, ids, button, timeout
+        )
+    if not shown:
+        raise TimeoutException(f"{', '.join(ids)} was not shown.")
+    return notification_id
+
+
 def install_older_version_via_chrome(driver, xpi_url):
     """Switch into chrome context and call :func:`install_from_xpi_url`.
 
@@ -0,0 +1,211 @@
+"""A session-scoped Firefox pool for the `selenium` fixture.
+
+By default every test starts its own geckodriver + Firefox, installs the
+WAF bypass add-on and only then navigates, which makes browser start-up the
+biggest chunk of a frontend test's wall-clock time. When pytest is started
+with ``--browser-pool``, each xdist worker keeps one warm browser instead and
+the pool puts it back into a clean state between tests:
+
+* extra windows and tabs are closed and the first one is selected
+* cookies, DOM storage and cached logins are cleared for every origin
+* add-ons other than the fixture ones (i.e. the WAF bypass add-on) are
+  uninstalled, pending installs are cancelled, the default theme is enabled
+  and the add-on update prefs are reset (see `addon_install.reset_addon_state`)
+* prefs changed by a test are restored to the values the browser started with
+
+If the browser cannot be reset (e.g. it crashed during the previous test)
+it is quit and replaced with a fresh one.
+"""
+
+import time
+import warnings
+
+import pytest
+
+from selenium.common.exceptions import WebDriverException
+
+from scripts.addon_install import reset_addon_state
+
+# stash keys used to hand the pool statistics over to the reporting hooks;
+# the first one holds the local pool, the second one what xdist workers sent
+BROWSER_POOL_STATS = pytest.StashKey[dict]()
+BROWSER_POOL_WORKERS = pytest.StashKey[list]()
+
+_SNAPSHOT_PREFS_SCRIPT = """
+const prefs = [];
+for (const name of Services.prefs.getChildList("")) {
+    if (!Services.prefs.prefHasUserValue(name)) continue;
+    switch (Services.prefs.getPrefType(name)) {
+        case Services.prefs.PREF_STRING:
+            prefs.push([name, "string", Services.prefs.getStringPref(name)]);
+            break;
+        case Services.prefs.PREF_INT:
+            prefs.push([name, "int", Services.prefs.getIntPref(name)]);
+            break;
+        case Services.prefs.PREF_BOOL:
+            prefs.push([name, "bool", Services.prefs.getBoolPref(name)]);
+            break;
+    }
+}
+return prefs;
+"""
+
+_RESET_PROFILE_SCRIPT = """
+const callback = arguments[arguments.length - 1];
+const [baselinePrefs] = arguments;
+(async () => {
+    try {
+        // cookies, local/session storage and cached http auth for every origin
+        await new Promise((resolve) =>
+            Services.clearData.deleteData(
+                Ci.nsIClearDataService.CLEAR_COOKIES |
+                    Ci.nsIClearDataService.CLEAR_DOM_STORAGES |
+                    Ci.nsIClearDataService.CLEAR_AUTH_TOKENS |
+                    Ci.nsIClearDataService.CLEAR_AUTH_CACHE,
+                resolve
+            )
+        );
+        // restore the prefs to the values captured when the browser started
+        const baseline = new Map(baselinePrefs.map(([name, type, value]) => [name, [type, value]]));
+        for (const name of Services.prefs.getChildList("")) {
+            if (Services.prefs.prefHasUserValue(name) && !baseline.has(name)) {
+                Services.prefs.clearUserPref(name);
+            }
+        }
+        const getters = { string: "getStringPref", int: "getIntPref", bool: "getBoolPref" };
+        const setters = { string: "setStringPref", int: "setIntPref", bool: "setBoolPref" };
+        for (const [name, [type, value]] of baseline) {
+            if (
+                !Services.prefs.prefHasUserValue(name) ||
+                Services.prefs[getters[type]](name) !== value
+            ) {
+                Services.prefs[setters[type]](name, value);
+            }
+        }
+        callback({});
+    } catch (e) {
+        callback({ error: e.message });
+    }
+})();
+"""
+
+
+class BrowserPool:
+    """Hands the same Firefox instance to every test of an xdist worker.
+
+    The browser is started lazily, with the driver class and kwargs that
+    pytest-selenium builds for the first test that needs it, so command line
+    options like `--driver` and `--capability` keep working unchanged."""
+
+    def __init__(self, addons, max_init_attempts=1):
+        # paths of the add-ons that are installed once per browser and survive resets
+        self.addons = addons
+        self.max_init_attempts = max_init_attempts
+        self.driver = None
+        self.addon_ids = []
+        self.baseline_prefs = []
+        self.stats = {
+            "cold_starts": [],
+            "resets": [],
+            "reuses": 0,
+        }
+
+    def acquire(self, request):
+        """Return a clean browser for the current test"""
+        if self.driver is not None:
+            try:
+                start = time.perf_counter()
+                self.reset()
+                self.stats["resets"].append(time.perf_counter() - start)
+                self.stats["reuses"] += 1
+            except WebDriverException as exception:
+                warnings.warn(
+                    f"Could not reset the pooled browser, starting a new one: {exception}"
+                )
+                self.quit()
+        if self.driver is None:
+            self.start(
+                request.getfixturevalue("driver_class"),
+                request.getfixturevalue("driver_kwargs"),
+            )
+        # pytest-selenium looks for the driver on the test item when it
+        # gathers screenshots and logs for the html report
+        request.node._driver = self.driver
+        return self.driver
+
+    def start(self, driver_class, driver_kwargs):
+        start = time.perf_counter()
+        for attempt in range(1, self.max_init_attempts + 1):
+            try:
+                self.driver = driver_class(**driver_kwargs)
+                break
+            except WebDriverException:
+                if attempt == self.max_init_attempts:
+                    raise
+        self.addon_ids = [
+            self.driver.install_addon(addon, temporary=True) for addon in self.addons
+        ]
+        with self.driver.context(self.driver.CONTEXT_CHROME):
+            self.baseline_prefs = self.driver.execute_script(_SNAPSHOT_PREFS_SCRIPT)
+        self.stats["cold_starts"].append(time.perf_counter() - start)
+
+    def reset(self):
+        driver = self.driver
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        # the add-ons go first, since uninstalling one can change prefs
+        reset_addon_state(driver, keep_ids=self.addon_ids)
+        with driver.context(driver.CONTEXT_CHROME):
+            result = driver.execute_async_script(
+                _RESET_PROFILE_SCRIPT, self.baseline_prefs
+            )
+        if "error" in result:
+            raise WebDriverException(f"Pooled browser reset failed: {result['error']}")
+        driver.get("about:blank")
+
+    def quit(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except WebDriverException:
+                pass
+            self.driver = None
+
+    def summary(self):
+        """Returns the pool counters in a form that can travel between
+        xdist workers and the controller process"""
+        cold_starts = self.stats["cold_starts"]
+        return {
+            "cold_starts": len(cold_starts),
+            "cold_start_time": sum(cold_starts),
+            "resets": len(self.stats["resets"]),
+            "reset_time": sum(self.stats["resets"]),
+            "reuses": self.stats["reuses"],
+        }
+
+
+def merge_summaries(summaries):
+    """Adds up the summaries reported by several workers"""
+    total = {
+        "cold_starts": 0,
+        "cold_start_time": 0.0,
+        "resets": 0,
+        "reset_time": 0.0,
+        "reuses": 0,
+    }
+    for summary in summaries:
+        for key in total:
+            total[key] += summary[key]
+    return total
+
+
+def saved_time(summary):
+    """Estimates the start-up time the pool saved: every reuse would have
+    cost an average cold start, but costs a reset instead"""
+    if not summary["cold_starts"]:
+        return 0.0
+    average_start = summary["cold_start_time"] / summary["cold_starts"]
+    return summary["reuses"] * average_start - summary["reset_time"]
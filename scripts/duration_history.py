@@ -0,0 +1,213 @@
+"""Keeps the duration and outcome of every test and uses them to order and
+shard the runs.
+
+Enabled with ``--duration-history``. Every run adds its results to the
+'.test-history.sqlite' database, by environment (the host of the `base_url` in
+the `--variables` files), and later runs use the last passing durations of a
+test as its expected duration:
+
+* the tests are collected longest first, so xdist hands the slow ones out at
+  the start of the run instead of leaving them for the end
+* ``--shard 2/4`` runs the second of four shards of the collected tests; the
+  shards are balanced by expected duration (longest first, each unit to the
+  shard with the least work so far)
+
+The tests of a module marked `serial` depend on each other, so they are kept
+together and in order. Tests without any history are expected to take the
+median duration of the known tests.
+
+The files of ``tests/frontend/test_filenames.txt`` can be split the same way,
+e.g. for a CI matrix:
+
+    pytest $(python -m scripts.duration_history tests/frontend/test_filenames.txt 2/4)
+"""
+
+import json
+import os
+import sqlite3
+import statistics
+import sys
+import time
+
+from urllib.parse import urlparse
+
+import pytest
+
+# the number of passing runs that make the expected duration of a test
+_SAMPLES = 5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    nodeid TEXT NOT NULL,
+    environment TEXT NOT NULL,
+    duration REAL NOT NULL,
+    outcome TEXT NOT NULL,
+    finished REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_by_test ON results (environment, nodeid, finished);
+"""
+
+
+class DurationHistory:
+    def __init__(self, path=".test-history.sqlite"):
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(_SCHEMA)
+
+    def record(self, environment, results):
+        """Adds `results`, (nodeid, duration, outcome) tuples, to the history"""
+        now = time.time()
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO results VALUES (?, ?, ?, ?, ?)",
+                [
+                    (nodeid, environment, duration, outcome, now)
+                    for nodeid, duration, outcome in results
+                ],
+            )
+
+    def expected(self, environment):
+        """The expected duration of every test with passing runs, by node id"""
+        rows = self.connection.execute(
+            "SELECT nodeid, duration FROM results "
+            "WHERE environment = ? AND outcome = 'passed' ORDER BY finished DESC",
+            (environment,),
+        )
+        samples = {}
+        for nodeid, duration in rows:
+            durations = samples.setdefault(nodeid, [])
+            if len(durations) < _SAMPLES:
+                durations.append(duration)
+        return {
+            nodeid: statistics.median(durations)
+            for nodeid, durations in samples.items()
+        }
+
+    def close(self):
+        self.connection.close()
+
+
+def plan_shards(durations, shards):
+    """Splits `durations` (unit -> expected duration) into `shards` lists of
+    units with about the same total duration, longest units first"""
+    plan = [[] for _ in range(shards)]
+    totals = [0.0] * shards
+    for unit in sorted(durations, key=durations.get, reverse=True):
+        shard = totals.index(min(totals))
+        plan[shard].append(unit)
+        totals[shard] += durations[unit]
+    return plan
+
+
+def parse_shard(value):
+    """Parses the "<index>/<count>" of --shard, e.g. "2/4", to (1, 4)"""
+    index, _, count = value.partition("/")
+    index, count = int(index), int(count)
+    if not 1 <= index <= count:
+        raise ValueError(f"Shard {value} does not exist")
+    return index - 1, count
+
+
+def _default_duration(durations):
+    # without any history every unit counts the same, so the shards are
+    # balanced by the number of units
+    durations = list(durations)
+    return statistics.median(durations) if durations else 1.0
+
+
+def _environment(config):
+    """The host of the base url the run is going to use"""
+    base_url = config.getoption("base_url", None)
+    for path in config.getoption("variables", None) or []:
+        with open(path) as file:
+            base_url = json.load(file).get("base_url", base_url)
+    return urlparse(base_url).hostname if base_url else "default"
+
+
+def _unit(item):
+    # the tests of a serial module run together, in order
+    if item.get_closest_marker("serial") is not None:
+        return item.nodeid.split("::")[0]
+    return item.nodeid
+
+
+class DurationHistoryPlugin:
+    def __init__(self, config, path=".test-history.sqlite"):
+        self.config = config
+        self.history = DurationHistory(path)
+        self.environment = _environment(config)
+        # the result of every test of this run, by node id
+        self.results = {}
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        expected = self.history.expected(self.environment)
+        default = _default_duration(expected.values())
+        units = {}
+        for item in items:
+            units.setdefault(_unit(item), []).append(item)
+        durations = {
+            unit: sum(expected.get(item.nodeid, default) for item in unit_items)
+            for unit, unit_items in units.items()
+        }
+        shard = config.getoption("shard")
+        if shard:
+            index, count = parse_shard(shard)
+            selected = plan_shards(durations, count)[index]
+            deselected = [
+                item for unit in units if unit not in selected for item in units[unit]
+            ]
+            if deselected:
+                config.hook.pytest_deselected(items=deselected)
+        else:
+            selected = sorted(units, key=durations.get, reverse=True)
+        items[:] = [item for unit in selected for item in units[unit]]
+
+    def pytest_runtest_logreport(self, report):
+        # the reports of the xdist workers are recorded by the controller
+        if hasattr(self.config, "workerinput"):
+            return
+        if report.when == "setup":
+            # a new test, or a new attempt of a rerun test
+            self.results[report.nodeid] = [0.0, report.outcome]
+        result = self.results.setdefault(report.nodeid, [0.0, report.outcome])
+        result[0] += report.duration
+        if report.when == "call" or report.outcome != "passed":
+            result[1] = report.outcome
+
+    def pytest_sessionfinish(self, session):
+        if self.results:
+            self.history.record(
+                self.environment,
+                [
+                    (nodeid, duration, outcome)
+                    for nodeid, (duration, outcome) in self.results.items()
+                ],
+            )
+        self.history.close()
+
+
+def main(filenames_path, shard, path=".test-history.sqlite", environment=None):
+    """Prints the test files of a shard, balanced by their expected duration"""
+    folder = os.path.dirname(filenames_path)
+    with open(filenames_path) as file:
+        files = [
+            os.path.join(folder, line.strip()).replace(os.sep, "/")
+            for line in file
+            if line.strip()
+        ]
+    history = DurationHistory(path)
+    expected = history.expected(environment or "addons.allizom.org")
+    history.close()
+    known = {}
+    for nodeid, duration in expected.items():
+        module = nodeid.split("::")[0]
+        if module in files:
+            known[module] = known.get(module, 0.0) + duration
+    default = _default_duration(known.values())
+    durations = {file: known.get(file, default) for file in files}
+    index, count = parse_shard(shard)
+    print(" ".join(sorted(plan_shards(durations, count)[index])))
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
@@ -0,0 +1,54 @@
+"""Exclusive file locks shared by the xdist workers, e.g. for the files of the
+session store and the XPI cache and the leases of the account pool.
+
+The OS releases the locks of a process when it ends, even if it crashes.
+"""
+
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def locked(path):
+    """Holds an exclusive lock on `path` (created if needed) while the block runs"""
+    with open(path, "a+") as file:
+        if fcntl:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+        else:
+            file.seek(0)
+            while True:
+                try:
+                    # gives up after ~10 seconds, but a lock can be held longer,
+                    # e.g. while a user logs in
+                    msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+            else:
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def try_lock(file):
+    """Takes an exclusive lock on the open `file` without waiting; False if
+    it's taken"""
+    try:
+        if fcntl:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
@@ -0,0 +1,141 @@
+"""Checks the links and images of a page concurrently, without the browser.
+
+Tests that verify outgoing links used to click every link, or send one request
+per link, and wait for each in turn. The checker instead:
+
+* reads the href/src of all the elements with one script call (`page_urls`,
+  `element_urls`)
+* drops duplicates and links that can't be fetched (mailto:, javascript: ...)
+* sends a HEAD request for every url, falling back to GET for servers that
+  don't answer HEAD, from a bounded pool of threads with a limit per host
+* keeps the results for the whole test session, so a url shared by several
+  pages or tests is only checked once per worker
+
+    results = link_checker.check(page_urls(selenium, page._content_card_links_locator))
+    assert all(result.ok for result in results.values()), link_checker.report(results)
+"""
+
+import threading
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import requests
+
+from requests.adapters import HTTPAdapter
+
+from scripts.region_snapshot import script_locator
+
+_ELEMENT_URLS_SCRIPT = """
+const [elements, locators] = arguments;
+function query([strategy, value]) {
+    if (strategy === "xpath") {
+        const result = document.evaluate(
+            value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        return Array.from({ length: result.snapshotLength }, (_, i) => result.snapshotItem(i));
+    }
+    return Array.from(document.querySelectorAll(value));
+}
+return elements
+    .concat(...locators.map(query))
+    .map((element) => element.href || element.currentSrc || element.src || null);
+"""
+
+
+class LinkResult(namedtuple("LinkResult", ["url", "status", "final_url", "error"])):
+    __slots__ = ()
+
+    @property
+    def ok(self):
+        return self.error is None and self.status < 400
+
+
+def element_urls(driver, elements):
+    """The href (or src, for images) of every element in `elements`"""
+    return [
+        url for url in driver.execute_script(_ELEMENT_URLS_SCRIPT, elements, []) if url
+    ]
+
+
+def page_urls(driver, *locators):
+    """The href (or src) of every element of the page matched by `locators`"""
+    return [
+        url
+        for url in driver.execute_script(
+            _ELEMENT_URLS_SCRIPT,
+            [],
+            [script_locator(*locator) for locator in locators],
+        )
+        if url
+    ]
+
+
+class LinkChecker:
+    def __init__(self, workers=16, per_host=4, timeout=10):
+        self.workers = workers
+        self.per_host = per_host
+        self.timeout = timeout
+        # the result of every url checked during the session
+        self.results = {}
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=per_host)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def _host_limit(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = threading.BoundedSemaphore(self.per_host)
+            return self._hosts[host]
+
+    def _fetch(self, url):
+        with self._host_limit(url):
+            try:
+                response = self.session.head(
+                    url, allow_redirects=True, timeout=self.timeout
+                )
+                if response.status_code < 400:
+                    return LinkResult(url, response.status_code, response.url, None)
+            except requests.RequestException:
+                pass
+            # some servers reject or don't implement HEAD; only the headers of
+            # the GET response are read
+            try:
+                with self.session.get(
+                    url, allow_redirects=True, stream=True, timeout=self.timeout
+                ) as response:
+                    return LinkResult(url, response.status_code, response.url, None)
+            except requests.RequestException as error:
+                return LinkResult(url, None, None, repr(error))
+
+    def check(self, urls):
+        """Checks `urls` and returns their results, by url"""
+        # links like mailto: can't be fetched
+        urls = list(
+            dict.fromkeys(
+                url for url in urls if urlparse(url).scheme in ("http", "https")
+            )
+        )
+        new = [url for url in urls if url not in self.results]
+        if new:
+            workers = min(self.workers, len(new))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                self.results.update(zip(new, executor.map(self._fetch, new)))
+        return {url: self.results[url] for url in urls}
+
+    @staticmethod
+    def report(results):
+        """Describes the failed `results`, for assertion messages"""
+        return "\n".join(
+            f"{result.url}: {result.error or result.status}"
+            for result in results.values()
+            if not result.ok
+        )
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,114 @@
+"""Checks the translated strings of AMO without a browser.
+
+AMO renders its pages on the server, so the strings of the header, the home
+page shelves and the listing pages are already in the html it sends. The sweep
+downloads the pages of every locale in ``translations.json`` concurrently over
+the pooled connections of the AMO client, streams each response through an
+html parser that keeps only the visible text and checks that every expected
+string is part of it:
+
+    missing = sweep(amo_api, base_url, translations)
+
+The browser tests in ``tests/frontend/test_translations.py`` still check a few
+locales as they are displayed; the sweep covers every locale with strings.
+"""
+
+import codecs
+import re
+
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+
+# the page of every section of translations.json
+PAGES = {
+    "header": "/{locale}/firefox/",
+    "home_page": "/{locale}/firefox/",
+    "extensions_page": "/{locale}/firefox/extensions/",
+    "themes_page": "/{locale}/firefox/themes/",
+}
+
+# the middle themes shelf on the homepage is curated content that differs
+# between environments, so its title is not checked
+SKIPPED = {("home_page", "shelf_title_popular_themes")}
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class _TextParser(HTMLParser):
+    """Collects the text of a page, without scripts and styles (the page state
+    AMO embeds in a script holds the strings as well)"""
+
+    _HIDDEN = {"script", "style", "template"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.texts = []
+        self.hidden = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self._HIDDEN:
+            self.hidden += 1
+        # the text of different elements is kept apart; a text node can be
+        # split between several chunks, so the parts of one are not
+        self.texts.append(" ")
+
+    def handle_endtag(self, tag):
+        if tag in self._HIDDEN and self.hidden:
+            self.hidden -= 1
+        self.texts.append(" ")
+
+    def handle_data(self, data):
+        if not self.hidden:
+            self.texts.append(data)
+
+    @property
+    def text(self):
+        return _WHITESPACE.sub(" ", "".join(self.texts))
+
+
+def page_text(client, url):
+    """The visible text of the page at `url`, parsed while it downloads"""
+    response = client.get(url, stream=True)
+    response.raise_for_status()
+    decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")("replace")
+    parser = _TextParser()
+    for chunk in response.iter_content(chunk_size=64 * 1024):
+        parser.feed(decoder.decode(chunk))
+    parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+    response.close()
+    return parser.text
+
+
+def locales(variables):
+    """The locales with strings in the variables, e.g. from translations.json"""
+    return {
+        locale: strings
+        for locale, strings in variables.items()
+        if isinstance(strings, dict) and "header" in strings
+    }
+
+
+def sweep(client, base_url, translations, workers=16):
+    """Checks the strings of every locale of `translations` (locale -> section ->
+    key -> string); returns the (locale, section, key, string, url) of the
+    strings missing from their page"""
+    urls = {
+        (locale, section): f"{base_url}{PAGES[section].format(locale=locale)}"
+        for locale, sections in translations.items()
+        for section in sections
+        if section in PAGES
+    }
+    # the header and the home page shelves share a page, which is only fetched once
+    pages = sorted(set(urls.values()))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = executor.map(lambda url: page_text(client, url), pages)
+        texts = dict(zip(pages, futures))
+    missing = []
+    for (locale, section), url in urls.items():
+        for key, string in translations[locale][section].items():
+            if (section, key) in SKIPPED:
+                continue
+            if _WHITESPACE.sub(" ", string).strip() not in texts[url]:
+                missing.append((locale, section, key, string, url))
+    return missing
@@ -0,0 +1,190 @@
+"""Records the network requests of every test through the WAF bypass extension.
+
+Enabled with ``--capture-network``. The extension the tests install in every
+browser (see the `waf_bypass_addon` fixture) gets `webRequest` listeners that
+log each request with:
+
+* its url, method, type (e.g. "xmlhttprequest", "image") and status
+* the size of the response and whether it came from the cache
+* when it started (ms since the epoch) and how long it took, redirects included
+* the network error, for failed requests
+
+At the end of every test the selenium fixture reads the log of the browser
+through a content script bridge (`network_log`), writes it to
+``network-log/<test id>.jsonl`` and adds the number of requests, the
+transferred bytes and the API requests sent more than once to the test's
+properties. The terminal summary lists the most repeated API requests and the
+largest downloads of the run.
+
+The bridge is a content script, so the log can only be read while a web page
+is open; tests that end on a privileged page (e.g. about:addons) report no
+requests and their log is dropped by the next test.
+"""
+
+import json
+import os
+import re
+
+from urllib.parse import urlparse
+
+from selenium.common.exceptions import WebDriverException
+
+# added to the background script of the extension
+BACKGROUND_SCRIPT = """
+const startTimes = new Map();
+let networkLog = [];
+const allUrls = { urls: ["<all_urls>"] };
+browser.webRequest.onBeforeRequest.addListener((details) => {
+  startTimes.set(details.requestId, details.timeStamp);
+}, allUrls);
+function logRequest(details, error) {
+  const start = startTimes.get(details.requestId) || details.timeStamp;
+  startTimes.delete(details.requestId);
+  networkLog.push({
+    url: details.url,
+    method: details.method,
+    type: details.type,
+    status: details.statusCode || null,
+    size: details.responseSize === undefined ? null : details.responseSize,
+    from_cache: Boolean(details.fromCache),
+    start,
+    duration: details.timeStamp - start,
+    document_url: details.documentUrl || null,
+    error: error || null,
+  });
+}
+browser.webRequest.onCompleted.addListener((details) => logRequest(details), allUrls);
+browser.webRequest.onErrorOccurred.addListener(
+  (details) => logRequest(details, details.error),
+  allUrls
+);
+browser.runtime.onMessage.addListener((message) => {
+  if (message === "amo-tests:network-log") {
+    const log = networkLog;
+    networkLog = [];
+    return Promise.resolve(log);
+  }
+});
+"""
+
+# the content script that hands the log of the background script to the page
+CONTENT_SCRIPT = """
+window.addEventListener("message", (event) => {
+  if (event.source !== window || event.data !== "amo-tests:get-network-log") {
+    return;
+  }
+  browser.runtime.sendMessage("amo-tests:network-log").then((log) => {
+    window.postMessage({ type: "amo-tests:network-log", log }, "*");
+  });
+});
+"""
+
+_NETWORK_LOG_SCRIPT = """
+const callback = arguments[arguments.length - 1];
+let timer;
+function receive(event) {
+    if (event.source === window && event.data && event.data.type === "amo-tests:network-log") {
+        finish(event.data.log);
+    }
+}
+function finish(log) {
+    window.removeEventListener("message", receive);
+    clearTimeout(timer);
+    callback(log);
+}
+window.addEventListener("message", receive);
+// in case the content script isn't there, e.g. on a page that is still loading
+timer = setTimeout(() => finish(null), 2000);
+window.postMessage("amo-tests:get-network-log", "*");
+"""
+
+
+def network_log(driver, since=None):
+    """Returns, and clears, the requests logged by the extension; None if the
+    log can't be read from the current page. `since` (seconds since the epoch)
+    drops the requests that started earlier"""
+    try:
+        # content scripts don't run on about:, view-source: ... pages
+        if urlparse(driver.current_url).scheme not in ("http", "https"):
+            return None
+        log = driver.execute_async_script(_NETWORK_LOG_SCRIPT)
+    except WebDriverException:
+        return None
+    if log is None or since is None:
+        return log
+    return [request for request in log if request["start"] >= since * 1000]
+
+
+def repeated_api_requests(log):
+    """The API requests that were sent more than once, with their count"""
+    counts = {}
+    for request in log:
+        if "/api/" in request["url"] and request["type"] == "xmlhttprequest":
+            key = f"{request['method']} {request['url']}"
+            counts[key] = counts.get(key, 0) + 1
+    return {key: count for key, count in counts.items() if count > 1}
+
+
+class NetworkCapture:
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def save(self, item, driver, since):
+        """Writes the requests `driver` sent since the test started and adds
+        their summary to the properties of the test `item`"""
+        log = network_log(driver, since)
+        if not log:
+            return
+        name = re.sub(r"[^\w.-]+", "_", item.nodeid)
+        with open(os.path.join(self.directory, f"{name}.jsonl"), "w") as file:
+            for request in log:
+                file.write(json.dumps(request) + "\n")
+        largest = sorted(log, key=lambda request: request["size"] or 0)[-5:]
+        item.user_properties.append(
+            (
+                "network",
+                {
+                    "requests": len(log),
+                    "transferred": sum(
+                        request["size"] or 0
+                        for request in log
+                        if not request["from_cache"]
+                    ),
+                    "repeated_api_requests": repeated_api_requests(log),
+                    "largest": [
+                        (request["url"], request["size"])
+                        for request in largest
+                        if request["size"]
+                    ],
+                },
+            )
+        )
+
+    def pytest_terminal_summary(self, terminalreporter, config):
+        summaries = [
+            value
+            for reports in terminalreporter.stats.values()
+            for report in reports
+            if getattr(report, "when", None) == "teardown"
+            for name, value in getattr(report, "user_properties", [])
+            if name == "network"
+        ]
+        if not summaries:
+            return
+        repeated = {}
+        largest = {}
+        for summary in summaries:
+            for key, count in summary["repeated_api_requests"].items():
+                repeated[key] = repeated.get(key, 0) + count
+            largest.update(summary["largest"])
+        terminalreporter.write_sep("-", "network capture")
+        terminalreporter.write_line(
+            f"{sum(summary['requests'] for summary in summaries)} request(s), "
+            f"{sum(summary['transferred'] for summary in summaries) / 2**20:.1f} MB "
+            f"transferred in {len(summaries)} test(s)"
+        )
+        for key, count in sorted(repeated.items(), key=lambda item: -item[1])[:10]:
+            terminalreporter.write_line(f"repeated {count}x: {key}")
+        for url, size in sorted(largest.items(), key=lambda item: -item[1])[:5]:
+            terminalreporter.write_line(f"{size / 1024:.0f} KB: {url}")
@@ -0,0 +1,82 @@
+"""A pytest plugin that reports how fast the pages opened by the tests render.
+
+Enabled with ``--page-metrics``. After every `wait_for_page_to_load` of a page
+object, `pages.desktop.base.record_page_metrics` reads the timings of the
+document (all in ms from the start of the navigation):
+
+* ttfb, dom_content_loaded and load, from Navigation Timing
+* ready, when the page object finished waiting for the page
+* lcp (Largest Contentful Paint) and cls (Cumulative Layout Shift), when the
+  browser reports them
+* resources and transfer_size, the number of resources and the bytes
+  transferred for the document and its resources
+
+The metrics are added to the user properties of every test and written to
+``page-metrics.jsonl``, one line per page, by the controller process.
+
+``--page-budgets <file>`` sets the limits of the metrics by page object class,
+with "*" for every other page, e.g. ``{"Home": {"lcp": 2500}, "*": {"load": 8000}}``.
+A test that passes but opened a page over its budget is reported as failed.
+"""
+
+import json
+
+import pytest
+
+
+def budget_violations(pages, budgets):
+    """The metrics of `pages` that are over their budget, as messages"""
+    violations = []
+    for page in pages:
+        budget = budgets.get(page["page"], budgets.get("*", {}))
+        for metric, limit in budget.items():
+            value = page.get(metric)
+            if value is not None and value > limit:
+                violations.append(
+                    f"{page['page']} {metric} was {value}, over its budget of "
+                    f"{limit} ({page['url']})"
+                )
+    return violations
+
+
+class PageMetricsPlugin:
+    def __init__(self, config, state, path="page-metrics.jsonl", budgets=None):
+        # the page metrics of pages.desktop.base
+        self.state = state
+        self.state["enabled"] = True
+        self.budgets = {}
+        if budgets:
+            with open(budgets) as file:
+                self.budgets = json.load(file)
+        self.file = None
+        if not hasattr(config, "workerinput"):
+            # the metrics of the xdist workers arrive with their reports
+            self.file = open(path, "w")
+
+    def pytest_runtest_setup(self, item):
+        self.state["pages"] = []
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        if call.when != "call" or not self.state["pages"]:
+            return
+        pages = list(self.state["pages"])
+        report.user_properties = [*report.user_properties, ("page_metrics", pages)]
+        violations = budget_violations(pages, self.budgets)
+        if violations and report.passed:
+            report.outcome = "failed"
+            report.longrepr = "Page budgets exceeded:\n" + "\n".join(violations)
+
+    def pytest_runtest_logreport(self, report):
+        if self.file is None or report.when != "call":
+            return
+        for name, value in report.user_properties:
+            if name == "page_metrics":
+                for page in value:
+                    self.file.write(json.dumps({"test": report.nodeid, **page}) + "\n")
+
+    def pytest_unconfigure(self, config):
+        if self.file is not None:
+            self.file.close()
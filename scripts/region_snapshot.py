@@ -0,0 +1,187 @@
+"""Read all the elements of a pypom region in a single WebDriver round-trip.
+
+Region properties usually wait for an element, find it and then read its text,
+which costs at least three round-trips for every field a test checks. A snapshot
+collects the text, visibility and a few attributes of every element matched by
+the `_<name>_locator` attributes of a region with one `execute_script` call and
+returns them as a plain, immutable object:
+
+    stats = addon.stats.snapshot(wait_for=["stats_users"])
+    stats.stats_users.text          # text of the first match
+    stats.stats_users.displayed     # visibility of the first match
+    stats.addon_tags[1].attributes["href"]
+
+`snapshot_regions()` does the same for a list of regions of the same type (e.g.
+the items of a shelf or of a search results page) with a single call as well.
+"""
+
+from collections import namedtuple
+
+from selenium.webdriver.common.by import By
+
+_SNAPSHOT_SCRIPT = """
+const [roots, locators, attributes] = arguments;
+function query(root, [strategy, value]) {
+    if (strategy === "xpath") {
+        const result = document.evaluate(
+            value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        return Array.from({ length: result.snapshotLength }, (_, i) => result.snapshotItem(i));
+    }
+    return Array.from(root.querySelectorAll(value));
+}
+function displayed(element) {
+    const rect = element.getBoundingClientRect();
+    return (
+        rect.width > 0 &&
+        rect.height > 0 &&
+        element.checkVisibility({ opacityProperty: true, visibilityProperty: true })
+    );
+}
+return roots.map((root) => {
+    if (Array.isArray(root)) {
+        // the region is located by its own '_root_locator'
+        root = query(document, root)[0];
+    }
+    root = root || document;
+    const snapshot = {};
+    for (const [name, locator] of Object.entries(locators)) {
+        snapshot[name] = query(root, locator).map((element) => {
+            const isDisplayed = displayed(element);
+            return [
+                isDisplayed ? element.innerText.trim() : "",
+                isDisplayed,
+                Object.fromEntries(attributes.map((attribute) => [attribute, element.getAttribute(attribute)])),
+            ];
+        });
+    }
+    return snapshot;
+});
+"""
+
+ElementSnapshot = namedtuple("ElementSnapshot", ["text", "displayed", "attributes"])
+
+
+class Matches(tuple):
+    """The snapshots of all the elements matched by one locator; `text` and
+    `displayed` refer to the first match, like `find_element` would"""
+
+    @property
+    def text(self):
+        return self[0].text if self else ""
+
+    @property
+    def displayed(self):
+        return bool(self) and self[0].displayed
+
+
+# the locator strategies script_locator can convert
+SCRIPT_STRATEGIES = frozenset(
+    (By.XPATH, By.CSS_SELECTOR, By.CLASS_NAME, By.ID, By.NAME, By.TAG_NAME)
+)
+
+
+def script_locator(strategy, value):
+    """Converts a selenium locator to the css selector or xpath used by the script"""
+    if strategy == By.XPATH:
+        return ["xpath", value]
+    if strategy == By.CSS_SELECTOR:
+        return ["css", value]
+    if strategy == By.CLASS_NAME:
+        return ["css", f".{value}"]
+    if strategy == By.ID:
+        return ["css", f"#{value}"]
+    if strategy == By.NAME:
+        return ["css", f'[name="{value}"]']
+    if strategy == By.TAG_NAME:
+        return ["css", value]
+    raise ValueError(f'Locators using "{strategy}" cannot be part of a snapshot')
+
+
+def _region_locators(region_class):
+    """The '_<name>_locator' attributes of a region class, by name"""
+    locators = {}
+    for attribute in dir(region_class):
+        if (
+            attribute.startswith("_")
+            and attribute.endswith("_locator")
+            and attribute != "_root_locator"
+        ):
+            locator = getattr(region_class, attribute)
+            if isinstance(locator, tuple) and len(locator) == 2:
+                locators[attribute[1 : -len("_locator")]] = locator
+    return locators
+
+
+def _snapshot_class(region_class):
+    # the snapshot type is created once per region class
+    if "_snapshot_class" not in region_class.__dict__:
+        region_class._snapshot_class = namedtuple(
+            f"{region_class.__name__}Snapshot", _region_locators(region_class)
+        )
+    return region_class._snapshot_class
+
+
+def snapshot_regions(regions, wait_for=()):
+    """Takes a snapshot of every region in `regions`, which have to be of the same
+    type, with a single script call. If `wait_for` names any locators, the call is
+    repeated until they are displayed in every region"""
+    if not regions:
+        return []
+    region_class = type(regions[0])
+    locators = _region_locators(region_class)
+    snapshot_class = _snapshot_class(region_class)
+    attributes = list(getattr(region_class, "_snapshot_attributes", ()))
+    roots = [
+        (
+            region._root
+            if region._root is not None or region._root_locator is None
+            else script_locator(*region._root_locator)
+        )
+        for region in regions
+    ]
+    arguments = [
+        roots,
+        {name: script_locator(*locator) for name, locator in locators.items()},
+        attributes,
+    ]
+
+    def take():
+        return [
+            snapshot_class(
+                **{
+                    name: Matches(ElementSnapshot(*element) for element in elements)
+                    for name, elements in result.items()
+                }
+            )
+            for result in regions[0].driver.execute_script(_SNAPSHOT_SCRIPT, *arguments)
+        ]
+
+    if not wait_for:
+        return take()
+
+    def displayed_snapshots(_):
+        snapshots = take()
+        return (
+            all(
+                getattr(snapshot, name).displayed
+                for snapshot in snapshots
+                for name in wait_for
+            )
+            and snapshots
+        )
+
+    return regions[0].wait.until(
+        displayed_snapshots,
+        message=f"{', '.join(wait_for)} not displayed in {region_class.__name__}",
+    )
+
+
+class SnapshotMixin:
+    """Adds `snapshot()` to a pypom Region; the attributes read for every element
+    are set with `_snapshot_attributes`"""
+
+    _snapshot_attributes = ("href", "title", "src")
+
+    def snapshot(self, wait_for=()):
+        return snapshot_regions([self], wait_for)[0]
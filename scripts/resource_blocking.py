@@ -0,0 +1,86 @@
+"""An extension that keeps the browser from downloading what a test doesn't look at.
+
+Tests that only check text and navigation can be marked with
+``@pytest.mark.block_resources``; the selenium fixture then installs an extension
+that cancels the requests of these resource classes:
+
+* "analytics": requests to analytics and tag manager hosts
+* "fonts": web fonts (the pages fall back to the system fonts)
+* "media": audio and video
+* "images": images larger than `image_size` bytes, judged by their
+  Content-Length, e.g. screenshots and theme previews; icons still load
+
+Without arguments the marker blocks every class, with the default image size:
+
+    @pytest.mark.block_resources("analytics", "fonts", image_size=20_000)
+
+Tests that check screenshots, previews or anything else visual don't use the
+marker and load the pages in full. A pooled browser removes the extension
+between tests, like every add-on a test installs.
+"""
+
+import json
+
+ADDON_ID = "resource-blocker@amo-tests.mozilla.org"
+
+# the images up to this size (in bytes) still load
+DEFAULT_IMAGE_SIZE = 50_000
+
+ANALYTICS_HOSTS = (
+    "*://*.google-analytics.com/*",
+    "*://*.googletagmanager.com/*",
+    "*://*.doubleclick.net/*",
+    "*://*.analytics.google.com/*",
+)
+
+RESOURCE_CLASSES = ("analytics", "fonts", "media", "images")
+
+_BACKGROUND_SCRIPT = """
+const [classes, analyticsHosts, imageSize] = %s;
+const cancel = () => ({ cancel: true });
+if (classes.includes("analytics")) {
+  browser.webRequest.onBeforeRequest.addListener(cancel, { urls: analyticsHosts }, ["blocking"]);
+}
+const types = [];
+if (classes.includes("fonts")) {
+  types.push("font");
+}
+if (classes.includes("media")) {
+  types.push("media");
+}
+if (types.length) {
+  browser.webRequest.onBeforeRequest.addListener(cancel, { urls: ["<all_urls>"], types }, ["blocking"]);
+}
+if (classes.includes("images")) {
+  browser.webRequest.onHeadersReceived.addListener(
+    (details) => {
+      const length = details.responseHeaders.find(
+        (header) => header.name.toLowerCase() === "content-length"
+      );
+      return { cancel: Boolean(length) && Number(length.value) > imageSize };
+    },
+    { urls: ["<all_urls>"], types: ["image", "imageset"] },
+    ["blocking", "responseHeaders"]
+  );
+}
+"""
+
+
+def blocker_files(classes=RESOURCE_CLASSES, image_size=DEFAULT_IMAGE_SIZE):
+    """The files of the extension blocking `classes`, by name"""
+    unknown = set(classes) - set(RESOURCE_CLASSES)
+    if unknown:
+        raise ValueError(f"Unknown resource classes: {', '.join(sorted(unknown))}")
+    manifest = {
+        "manifest_version": 2,
+        "name": "Resource Blocker",
+        "version": "1.0",
+        "browser_specific_settings": {"gecko": {"id": ADDON_ID}},
+        "permissions": ["webRequest", "webRequestBlocking", "<all_urls>"],
+        "background": {"scripts": ["background.js"], "persistent": True},
+    }
+    arguments = json.dumps([sorted(classes), ANALYTICS_HOSTS, image_size])
+    return {
+        "manifest.json": json.dumps(manifest),
+        "background.js": _BACKGROUND_SCRIPT % arguments,
+    }
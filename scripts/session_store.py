@@ -0,0 +1,85 @@
+"""A store for the AMO session tokens (the 'sessionid' cookie) of the test users.
+
+Logging in goes through the FxA UI, with 2FA for most users, which is slow and
+can trigger a captcha when it happens too often. The store keeps one token per
+user and environment in the '.sessions' folder and shares it between the xdist
+workers and between runs:
+
+* a stored token is checked against the profile API before it is handed out
+* a user is only logged in when no valid token is stored
+* the token file of a user is locked while it is read or refreshed, so when
+  several workers need the same user at the same time, one of them logs in
+  and the others wait for it and re-use its token
+"""
+
+import os
+
+from urllib.parse import urlparse
+
+from scripts.file_lock import locked
+
+
+class SessionStore:
+    def __init__(self, base_url, amo_api, directory=".sessions", accounts=None):
+        self.amo_api = amo_api
+        # the account pool, when a user can have several accounts; the tokens
+        # are stored by the account leased to this process
+        self.accounts = accounts
+        # tokens of different environments (dev, stage, prod) are kept apart
+        self.directory = os.path.join(directory, urlparse(base_url).hostname)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def path(self, user):
+        account = self.accounts.name(user) if self.accounts else user
+        return os.path.join(self.directory, f"{account}.txt")
+
+    def get(self, user, login=None):
+        """Returns a valid sessionid for `user`. If none is stored, `login` is
+        called to log the user in and return the new sessionid"""
+        path = self.path(user)
+        with locked(f"{path}.lock"):
+            token = self._read(path)
+            if token and self.is_valid(token):
+                return token
+            if login is None:
+                raise LookupError(
+                    f'There is no valid session stored for "{user}"; '
+                    f"it is created by the tests marked with login('{user}')"
+                )
+            token = login()
+            self._write(path, token)
+            return token
+
+    def set(self, user, token):
+        """Stores a sessionid obtained outside the store, e.g. by a test that logs in"""
+        path = self.path(user)
+        with locked(f"{path}.lock"):
+            self._write(path, token)
+
+    def discard(self, user):
+        """Forgets the session of `user`, e.g. after it was deleted"""
+        path = self.path(user)
+        with locked(f"{path}.lock"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def is_valid(self, token):
+        """Checked every time a token is handed out, since tests can end a
+        session (e.g. by deleting the account); the request is cheap compared
+        to a login and re-uses the connections of the API client"""
+        response = self.amo_api.get("/api/v5/accounts/profile/", auth=token)
+        return response.status_code == 200
+
+    @staticmethod
+    def _read(path):
+        if not os.path.exists(path):
+            return None
+        with open(path, "r") as file:
+            return file.read().strip() or None
+
+    @staticmethod
+    def _write(path, token):
+        # write to a temporary file first, so a reader never sees half a token
+        with open(f"{path}.tmp", "w") as file:
+            file.write(token)
+        os.replace(f"{path}.tmp", path)
@@ -6,59 +6,143 @@ lives inside shadow DOM. Marionette does not expose
 ``WebElement.shadow_root`` on Firefox, so any access into a shadow root has
 to go through ``execute_script``. These helpers wrap the JS so test code
 stays readable.
+
+Every single-element helper costs one round-trip. Page objects that inspect
+several controls at once should use :func:`shadow_batch`, which resolves a
+list of ``(host, inner, operation)`` descriptors in one ``execute_script``,
+or :func:`wait_for_shadow`, which waits inside the page until all of them are
+satisfied and then resolves them, still with a single command.
 """
 
+from collections import namedtuple
+
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+from pages.desktop.base import ensure_script_timeout
+
 # All helpers take a Selenium ``driver`` and a host CSS selector that resolves
 # to the *outer* custom element. Pass the **inner** selector relative to the
 # host's ``shadowRoot``.
 
+# ``operation`` is one of:
+# - "query": the first inner element, or ``None``
+# - "query_all": all the inner elements
+# - "visible": whether the inner element has a non-zero bounding box
+# - "text": the ``innerText`` of the inner element, or ``None``
+# - "click": clicks the inner element (the host when ``inner`` is ``None``)
+# ``host`` can also be a WebElement that was already found.
+ShadowOp = namedtuple("ShadowOp", ["host", "inner", "operation"], defaults=["query"])
+# ``found`` is false when the host, its shadow root or the inner element is missing
+ShadowResult = namedtuple("ShadowResult", ["found", "value"])
+
+_SHADOW_BATCH_SCRIPT = """
+const [descriptors, wait, timeout] = arguments;
+const callback = arguments[arguments.length - 1];
+function resolve(host, inner) {
+    host = typeof host === "string" ? document.querySelector(host) : host;
+    if (!host) return [];
+    if (!inner) return [host];
+    if (!host.shadowRoot) return [];
+    return [...host.shadowRoot.querySelectorAll(inner)];
+}
+function visible(element) {
+    const rect = element.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+function satisfied([host, inner, operation]) {
+    const [element] = resolve(host, inner);
+    if (!element) return false;
+    return operation === "visible" || operation === "click" ? visible(element) : true;
+}
+function run([host, inner, operation]) {
+    const elements = resolve(host, inner);
+    const [element] = elements;
+    switch (operation) {
+        case "query_all":
+            return [elements.length > 0, elements];
+        case "visible":
+            return [Boolean(element), Boolean(element) && visible(element)];
+        case "text":
+            return [Boolean(element), element ? element.innerText : null];
+        case "click":
+            if (element) element.click();
+            return [Boolean(element), Boolean(element)];
+        default:
+            return [Boolean(element), element || null];
+    }
+}
+if (!wait) {
+    callback([true, descriptors.map(run)]);
+} else {
+    const deadline = performance.now() + timeout * 1000;
+    const poll = () => {
+        if (descriptors.every(satisfied)) {
+            callback([true, descriptors.map(run)]);
+        } else if (performance.now() > deadline) {
+            callback([false, descriptors.map(satisfied)]);
+        } else {
+            requestAnimationFrame(poll);
+        }
+    };
+    poll();
+}
+"""
+
+
+def _descriptors(descriptors):
+    return [list(ShadowOp(*descriptor)) for descriptor in descriptors]
+
+
+def shadow_batch(driver, descriptors):
+    """Resolve every ``(host, inner, operation)`` descriptor (see ``ShadowOp``)
+    with a single script call and return a ``ShadowResult`` per descriptor, in
+    the same order. Missing elements are reported through ``found`` instead of
+    raising, so one absent control doesn't hide the state of the others."""
+    _, results = driver.execute_async_script(
+        _SHADOW_BATCH_SCRIPT, _descriptors(descriptors), False, 0
+    )
+    return [ShadowResult(*result) for result in results]
+
+
+def wait_for_shadow(driver, descriptors, timeout=10):
+    """Like :func:`shadow_batch`, but first waits, polling inside the page on
+    every animation frame, until every descriptor can be resolved: the inner
+    element exists and, for "visible" and "click", is rendered. Raises
+    ``TimeoutException`` naming the descriptors that were never satisfied."""
+    ensure_script_timeout(driver, timeout)
+    descriptors = _descriptors(descriptors)
+    done, results = driver.execute_async_script(
+        _SHADOW_BATCH_SCRIPT, descriptors, True, timeout
+    )
+    if not done:
+        missing = [
+            f"{host} >> {inner}"
+            for (host, inner, _), satisfied in zip(descriptors, results)
+            if not satisfied
+        ]
+        raise TimeoutException(
+            f"Shadow DOM elements not ready after {timeout}s: {', '.join(missing)}"
+        )
+    return [ShadowResult(*result) for result in results]
+
 
 def shadow_query(driver, host_css, inner_css):
     """Return the first element matching ``inner_css`` inside the shadow root
     of the element matching ``host_css``. Returns ``None`` when the host
     cannot be found or when nothing matches inside its shadow root."""
-    return driver.execute_script(
-        """
-        const host = document.querySelector(arguments[0]);
-        if (!host || !host.shadowRoot) return null;
-        return host.shadowRoot.querySelector(arguments[1]);
-        """,
-        host_css,
-        inner_css,
-    )
+    return shadow_batch(driver, [(host_css, inner_css, "query")])[0].value
 
 
 def shadow_query_all(driver, host_css, inner_css):
     """Return all elements matching ``inner_css`` inside ``host_css``'s shadow
     root. Returns an empty list if the host or shadow root are missing."""
-    return driver.execute_script(
-        """
-        const host = document.querySelector(arguments[0]);
-        if (!host || !host.shadowRoot) return [];
-        return [...host.shadowRoot.querySelectorAll(arguments[1])];
-        """,
-        host_css,
-        inner_css,
-    )
+    return shadow_batch(driver, [(host_css, inner_css, "query_all")])[0].value
 
 
 def shadow_visible(driver, host_css, inner_css):
     """``True`` when ``inner_css`` resolves inside ``host_css``'s shadow root
     and the matched element has a non-zero bounding box."""
-    return bool(
-        driver.execute_script(
-            """
-            const host = document.querySelector(arguments[0]);
-            if (!host || !host.shadowRoot) return false;
-            const el = host.shadowRoot.querySelector(arguments[1]);
-            if (!el) return false;
-            const rect = el.getBoundingClientRect();
-            return rect.width > 0 && rect.height > 0;
-            """,
-            host_css,
-            inner_css,
-        )
-    )
+    return shadow_batch(driver, [(host_css, inner_css, "visible")])[0].value
 
 
 def shadow_click(driver, host_css, inner_css=None):
@@ -68,19 +152,9 @@ def shadow_click(driver, host_css, inner_css=None):
     for components like ``moz-toggle`` whose event wiring lives on the host
     and is bypassed by clicking the inner shadow ``<button>``.
     """
-    return driver.execute_script(
-        """
-        const host = document.querySelector(arguments[0]);
-        if (!host) throw new Error('Host not found: ' + arguments[0]);
-        if (!arguments[1]) {
-            host.click();
-            return true;
-        }
-        const inner = host.shadowRoot && host.shadowRoot.querySelector(arguments[1]);
-        if (!inner) throw new Error('Inner not found: ' + arguments[1]);
-        inner.click();
-        return true;
-        """,
-        host_css,
-        inner_css,
-    )
+    found, _ = shadow_batch(driver, [(host_css, inner_css, "click")])[0]
+    if not found:
+        raise NoSuchElementException(
+            f"Shadow DOM element not found: {host_css} >> {inner_css}"
+        )
+    return True
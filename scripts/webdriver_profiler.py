@@ -0,0 +1,177 @@
+"""A pytest plugin that records every WebDriver command sent by the UI tests.
+
+Enabled with ``--profile-webdriver``. The selenium fixture attaches the profiler
+to its driver, which wraps the driver's command executor and records, for every
+command:
+
+* the command name (e.g. "findElement", "executeScript")
+* the browser context it ran in ("content" or "chrome")
+* its latency
+* the page object (or region) method that issued it, or "test" for commands
+  sent directly by the test function
+* the test phase (setup, call or teardown)
+
+The commands of each test are written to ``webdriver-profile/<test id>.jsonl``.
+The html report gets the number of commands of every test and a table with the
+page object methods that sent the most commands across the whole run.
+"""
+
+import html
+import json
+import os
+import re
+import sys
+import time
+
+import pytest
+
+# the folders holding the page objects, relative to the repository root
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_PAGE_OBJECT_DIRS = tuple(
+    os.path.join(_ROOT, folder) + os.sep for folder in ("pages", "regions")
+)
+_TESTS_DIR = os.path.join(_ROOT, "tests") + os.sep
+# the helpers shared by every page object, e.g. `wait_for_page_to_load`
+_BASE_PAGE = os.path.join(_ROOT, "pages", "desktop", "base.py")
+
+
+def _method_name(frame):
+    module = os.path.relpath(frame.f_code.co_filename, _ROOT)[: -len(".py")]
+    return f"{module.replace(os.sep, '.')}.{frame.f_code.co_qualname}"
+
+
+def _caller():
+    """The page object method closest to the command in the call stack; the
+    shared helpers of the base page are skipped for the page or region method
+    that called them"""
+    frame = sys._getframe(2)
+    base_frame = None
+    test_frame = None
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename == _BASE_PAGE:
+            if base_frame is None:
+                base_frame = frame
+        elif filename.startswith(_PAGE_OBJECT_DIRS):
+            return _method_name(frame)
+        elif test_frame is None and filename.startswith(_TESTS_DIR):
+            test_frame = frame
+        frame = frame.f_back
+    if base_frame is not None:
+        # a helper of the base page called by the test itself
+        return _method_name(base_frame)
+    return "test" if test_frame is not None else "other"
+
+
+class WebDriverProfiler:
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.records = []
+        self.phase = None
+        # commands and time by page object method, for the whole run
+        self.callers = {}
+
+    def attach(self, driver):
+        """Wraps the command executor of `driver`; a driver re-used between
+        tests (see --browser-pool) is only wrapped once"""
+        if getattr(driver, "_webdriver_profiler", None) is self:
+            return
+        executor = driver.command_executor
+        execute = executor.execute
+        state = {"context": "content"}
+
+        def profiled_execute(command, params):
+            caller = _caller()
+            start = time.perf_counter()
+            try:
+                return execute(command, params)
+            finally:
+                self.records.append(
+                    {
+                        "command": command,
+                        "context": state["context"],
+                        "duration": time.perf_counter() - start,
+                        "caller": caller,
+                        "phase": self.phase,
+                    }
+                )
+                if command == "SET_CONTEXT":
+                    state["context"] = params.get("context", state["context"])
+
+        executor.execute = profiled_execute
+        driver._webdriver_profiler = self
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item):
+        self.records = []
+        yield
+        if self.records:
+            name = re.sub(r"[^\w.-]+", "_", item.nodeid)
+            path = os.path.join(self.directory, f"{name}.jsonl")
+            with open(path, "w") as file:
+                for record in self.records:
+                    file.write(json.dumps(record) + "\n")
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        # only user properties reach the controller when running with xdist; the
+        # report shares its list with the test item, so it gets its own copy
+        properties = [
+            *report.user_properties,
+            ("webdriver_commands", len(self.records)),
+        ]
+        if call.when == "teardown":
+            callers = {}
+            for record in self.records:
+                count, duration = callers.get(record["caller"], (0, 0.0))
+                callers[record["caller"]] = (count + 1, duration + record["duration"])
+            properties.append(("webdriver_callers", callers))
+        report.user_properties = properties
+
+    def pytest_runtest_setup(self, item):
+        self.phase = "setup"
+
+    def pytest_runtest_call(self, item):
+        self.phase = "call"
+
+    def pytest_runtest_teardown(self, item):
+        self.phase = "teardown"
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "teardown":
+            return
+        for name, value in report.user_properties:
+            if name == "webdriver_callers":
+                for caller, (count, duration) in value.items():
+                    total = self.callers.get(caller, (0, 0.0))
+                    self.callers[caller] = (total[0] + count, total[1] + duration)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_html_results_table_header(self, cells):
+        cells.insert(2, "<th>WebDriver commands</th>")
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_html_results_table_row(self, report, cells):
+        commands = dict(report.user_properties).get("webdriver_commands", "")
+        cells.insert(2, f"<td>{commands}</td>")
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_html_results_summary(self, prefix, summary, postfix):
+        if not self.callers:
+            return
+        busiest = sorted(
+            self.callers.items(), key=lambda item: item[1][0], reverse=True
+        )
+        rows = "".join(
+            f"<tr><td>{html.escape(caller)}</td>"
+            f"<td>{count}</td><td>{duration:.2f}s</td></tr>"
+            for caller, (count, duration) in busiest[:20]
+        )
+        prefix.append(
+            "<h3>WebDriver commands by page object method</h3>"
+            "<table><tr><th>Method</th><th>Commands</th><th>Time</th></tr>"
+            f"{rows}</table>"
+        )
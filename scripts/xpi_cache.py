@@ -0,0 +1,89 @@
+"""A local cache and loopback server for the XPI files installed by the tests.
+
+The install and update tests download the same XPIs from AMO's CDN in every
+test and every browser, which makes the install latency depend on the CDN.
+When a test is not about the download itself, it can install from the cache
+instead:
+
+    file = amo_api.versions(addon).json()["results"][1]["file"]
+    install_from_xpi_url(driver, xpi_cache.local_url(file["url"], file["hash"]))
+
+* every file is downloaded once and checked against the hash AMO reports for
+  it ("sha256:<hex digest>"); files that don't match are rejected
+* the files are kept in the '.xpi-cache' folder by hash, so they are shared by
+  the xdist workers and re-used by later runs
+* they are served from a http server bound to 127.0.0.1, with the
+  `application/x-xpinstall` content type Firefox expects for add-ons
+"""
+
+import hashlib
+import os
+import threading
+
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from scripts.file_lock import locked
+
+
+class _XPIRequestHandler(SimpleHTTPRequestHandler):
+    extensions_map = {
+        **SimpleHTTPRequestHandler.extensions_map,
+        ".xpi": "application/x-xpinstall",
+    }
+
+    def log_message(self, format, *args):
+        # requests are not interesting in the test output
+        pass
+
+
+class XPICache:
+    def __init__(self, amo_api, directory=".xpi-cache"):
+        self.amo_api = amo_api
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.server = None
+
+    def fetch(self, url, file_hash):
+        """Returns the path of the cached copy of `url`, downloading it first
+        if needed. `file_hash` is the hash AMO reports for the file"""
+        algorithm, _, digest = file_hash.partition(":")
+        path = os.path.join(self.directory, f"{digest}.xpi")
+        with locked(f"{path}.lock"):
+            if os.path.exists(path):
+                return path
+            response = self.amo_api.get(url, stream=True)
+            response.raise_for_status()
+            hasher = hashlib.new(algorithm)
+            with open(f"{path}.tmp", "wb") as file:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    hasher.update(chunk)
+                    file.write(chunk)
+            if hasher.hexdigest() != digest:
+                os.remove(f"{path}.tmp")
+                raise ValueError(
+                    f"{url} does not match the file hash reported by AMO: "
+                    f"expected {file_hash}, got {algorithm}:{hasher.hexdigest()}"
+                )
+            os.replace(f"{path}.tmp", path)
+        return path
+
+    def local_url(self, url, file_hash):
+        """Returns the url of the cached copy of `url` on the loopback server"""
+        name = os.path.basename(self.fetch(url, file_hash))
+        return f"{self.serve()}/{name}"
+
+    def serve(self):
+        """Starts the loopback server on a free port, once, and returns its url"""
+        if self.server is None:
+            handler = partial(_XPIRequestHandler, directory=self.directory)
+            self.server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+            threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        host, port = self.server.server_address
+        return f"http://{host}:{port}"
+
+    def close(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
@@ -1,8 +1,6 @@
 import json
-import time
 
 import pytest
-import requests
 
 from api import payloads, api_helpers
 from pages.desktop.frontend.home import Home
@@ -27,19 +25,15 @@ _addon_create = "/api/v5/addons/addon/"
 
 @pytest.mark.serial
 @pytest.mark.login("api_user")
-def test_upload_listed_extension_tc_id_c4369(base_url, selenium):
+def test_upload_listed_extension_tc_id_c4369(base_url, amo_api, selenium):
     """Verifies the process of uploading a listed add-on.
     The test checks the upload, validates the add-on,
     and ensures the correct registration of the add-on details by using the create API endpoint.
     The uploaded add-on is validated by comparing the response with the expected payload."""
     session_cookie = selenium.get_cookie("sessionid")
-    with open("sample-addons/listed-addon-api.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f'Session {session_cookie["value"]}'},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+    upload = amo_api.upload(
+        "sample-addons/listed-addon-api.zip", "listed", auth=session_cookie["value"]
+    )
     print(f'Session Token: {session_cookie["value"]}')
     print(f"Uploading to: {base_url}{_upload}")
     resp = upload.json()
@@ -49,16 +43,8 @@ def test_upload_listed_extension_tc_id_c4369(base_url, selenium):
     # get the addon uuid generated after upload
     uuid = resp["uuid"]
     payload = payloads.listed_addon_details(uuid)
-    # sleep to allow the first request to be processed
-    time.sleep(10)
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f'Session {session_cookie["value"]}',
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_cookie["value"])
+    create_addon = amo_api.create_addon(payload, auth=session_cookie["value"])
     print(create_addon.json())
     create_addon.raise_for_status()
     response = create_addon.json()
@@ -69,19 +55,12 @@ def test_upload_listed_extension_tc_id_c4369(base_url, selenium):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_listed_addon_details(base_url, session_auth):
+def test_edit_listed_addon_details(amo_api, session_auth):
     """This test checks the process of editing an existing listed add-on's details.
     It uses the patch method to update add-on details
     and verifies that the changes are correctly applied and reflected in the API response."""
     payload = payloads.edit_addon_details
-    edit_addon = requests.patch(
-        url=f"{base_url}{_addon_create}my_sluggish_slug_api/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_addon = amo_api.edit_addon("my_sluggish_slug_api", payload, auth=session_auth)
     edit_addon.raise_for_status()
     response = edit_addon.json()
     print(json.dumps(response, indent=2))
@@ -91,21 +70,16 @@ def test_edit_listed_addon_details(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_extension_add_invalid_categories(base_url, session_auth):
+def test_extension_add_invalid_categories(amo_api, session_auth):
     """Try to upload an addon that has invalid android categories set in the JSON payload"""
-    with open("sample-addons/listed-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+    upload = amo_api.upload(
+        "sample-addons/listed-addon.zip", "listed", auth=session_auth
+    )
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(3)
     print(upload.json())
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     invalid_android_catg = ["", 123, None]
     for item in invalid_android_catg:
         payload = {
@@ -113,14 +87,7 @@ def test_extension_add_invalid_categories(base_url, session_auth):
             "categories": [item],
             "slug": "invalid-cat",
         }
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        create_addon = amo_api.create_addon(payload, auth=session_auth)
         print(
             f'For android category "{item}": Response status is {create_addon.status_code}; {create_addon.text}\n'
         )
@@ -133,21 +100,16 @@ def test_extension_add_invalid_categories(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_extension_one_category_and_other_category(base_url, session_auth):
+def test_extension_one_category_and_other_category(amo_api, session_auth):
     """Try to upload an addon that has invalid android categories set in the JSON payload"""
-    with open("sample-addons/listed-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+    upload = amo_api.upload(
+        "sample-addons/listed-addon.zip", "listed", auth=session_auth
+    )
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(3)
     print(upload.json())
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     invalid_android_catg = ["Appearance"]
     for item in invalid_android_catg:
         payload = {
@@ -155,14 +117,7 @@ def test_extension_one_category_and_other_category(base_url, session_auth):
             "categories": ["Other", item],
             "slug": "invalid-cat",
         }
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        create_addon = amo_api.create_addon(payload, auth=session_auth)
         print(
             f'For android category "{item}": Response status is {create_addon.status_code}; {create_addon.text}\n'
         )
@@ -175,21 +130,16 @@ def test_extension_one_category_and_other_category(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_extension_add_invalid_firefox_categories(base_url, session_auth):
+def test_extension_add_invalid_firefox_categories(amo_api, session_auth):
     """Try to upload an addon that has invalid firefox categories set in the JSON payload"""
-    with open("sample-addons/listed-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+    upload = amo_api.upload(
+        "sample-addons/listed-addon.zip", "listed", auth=session_auth
+    )
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(3)
     print(upload.json())
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     invalid_firefox_catg = ["fashion", "security-privacy", "", 12.3]
     for item in invalid_firefox_catg:
         payload = {
@@ -197,14 +147,7 @@ def test_extension_add_invalid_firefox_categories(base_url, session_auth):
             "categories": {"android": ["performance"], "firefox": [item]},
             "slug": "invalid-firefox-cat",
         }
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        create_addon = amo_api.create_addon(payload, auth=session_auth)
         print(
             f'For firefox category "{item}": Response status is {create_addon.status_code}; {create_addon.text}\n'
         )
@@ -218,21 +161,16 @@ def test_extension_add_invalid_firefox_categories(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_extension_other_category_is_standalone(base_url, session_auth):
+def test_extension_other_category_is_standalone(amo_api, session_auth):
     """Extensions with a category set to 'other' cannot have another category set"""
-    with open("sample-addons/listed-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+    upload = amo_api.upload(
+        "sample-addons/listed-addon.zip", "listed", auth=session_auth
+    )
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(3)
     print(upload.json())
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     payload = {
         **payloads.listed_addon_details(uuid),
         "categories": {
@@ -241,14 +179,7 @@ def test_extension_other_category_is_standalone(base_url, session_auth):
         },
         "slug": "other-category",
     }
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = amo_api.create_addon(payload, auth=session_auth)
     assert (
         create_addon.status_code == 400
     ), f"Actual status code was {create_addon.status_code}"
@@ -260,33 +191,21 @@ def test_extension_other_category_is_standalone(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_extension_invalid_slug(base_url, session_auth):
+def test_extension_invalid_slug(amo_api, session_auth):
     """Addon slugs can be composed only from letters and numbers"""
-    with open("sample-addons/listed-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+    upload = amo_api.upload(
+        "sample-addons/listed-addon.zip", "listed", auth=session_auth
+    )
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(3)
     print(upload.json())
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     invalid_slugs = [102030, "---", "?name", "@#_" ")(", None]
     for item in invalid_slugs:
         # crete a new dictionary from the original payload, with invalid slug values
         payload = {**payloads.listed_addon_details(uuid), "slug": item}
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        create_addon = amo_api.create_addon(payload, auth=session_auth)
         print(
             f'For slug "{item}": Response status is {create_addon.status_code}; {create_addon.text}\n'
         )
@@ -306,21 +225,14 @@ def test_extension_invalid_slug(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_duplicate_slug(base_url, session_auth, variables):
+def test_edit_extension_duplicate_slug(amo_api, session_auth, variables):
     """Use a slug that already belongs to another addon"""
     addon = payloads.edit_addon_details["slug"]
     payload = {
         **payloads.edit_addon_details,
         "slug": variables["approved_addon_with_sources"],
     }
-    edit_addon = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_addon = amo_api.edit_addon(addon, payload, auth=session_auth)
     assert (
         edit_addon.status_code == 400
     ), f"Actual status code was {edit_addon.status_code}"
@@ -331,21 +243,14 @@ def test_edit_extension_duplicate_slug(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_invalid_name(base_url, session_auth):
+def test_edit_extension_invalid_name(amo_api, session_auth):
     """Addon names are required to have at least one letter or number character to be valid"""
     addon = payloads.edit_addon_details["slug"]
     invalid_names = ["", ".", "****", None]
     for item in invalid_names:
         # crete a new dictionary from the original payload, with invalid name values
         payload = {**payloads.edit_addon_details, "name": {"en-US": item}}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = amo_api.edit_addon(addon, payload, auth=session_auth)
         print(
             f'For name "{item}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -381,19 +286,12 @@ def test_edit_extension_invalid_name(base_url, session_auth):
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_with_trademark_in_name(base_url, session_auth, trademark_name):
+def test_edit_extension_with_trademark_in_name(amo_api, session_auth, trademark_name):
     """Verifies that addon names can't be edited to include a Mozilla or Firefox trademark"""
     addon = payloads.edit_addon_details["slug"]
     # crete a new dictionary from the original payload, with variable name values
     name = {**payloads.edit_addon_details, "name": {"en-US": trademark_name}}
-    edit_addon = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(name),
-    )
+    edit_addon = amo_api.edit_addon(addon, name, auth=session_auth)
     print(
         f'For name "{trademark_name}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
     )
@@ -409,7 +307,7 @@ def test_edit_extension_with_trademark_in_name(base_url, session_auth, trademark
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_invalid_summary(base_url, session_auth):
+def test_edit_extension_invalid_summary(amo_api, session_auth):
     """Addon summaries need to be in string format and below 250 characters"""
     addon = payloads.edit_addon_details["slug"]
     over_250_summary = reusables.get_random_string(251)
@@ -417,14 +315,7 @@ def test_edit_extension_invalid_summary(base_url, session_auth):
     # crete a new dictionary from the original payload, with invalid summary values
     for item in summaries:
         payload = {**payloads.edit_addon_details, "summary": {"en-US": item}}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = amo_api.edit_addon(addon, payload, auth=session_auth)
         print(
             f'For summary "{item}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -449,7 +340,7 @@ def test_edit_extension_invalid_summary(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_invalid_homepage(base_url, session_auth):
+def test_edit_extension_invalid_homepage(base_url, amo_api, session_auth):
     """Try to add some invalid and unaccepted homepage urls for an addon"""
     addon = payloads.edit_addon_details["slug"]
     invalid_homepage = [
@@ -464,14 +355,7 @@ def test_edit_extension_invalid_homepage(base_url, session_auth):
     for item in invalid_homepage:
         # crete a new dictionary from the original payload, with variable homepage values
         homepage = {**payloads.edit_addon_details, "homepage": {"en-US": item}}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(homepage),
-        )
+        edit_addon = amo_api.edit_addon(addon, homepage, auth=session_auth)
         print(
             f'For homepage "{item}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -497,21 +381,14 @@ def test_edit_extension_invalid_homepage(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_invalid_support_email(base_url, session_auth):
+def test_edit_extension_invalid_support_email(amo_api, session_auth):
     """Try to add some invalid and unaccepted emails for an addon"""
     addon = payloads.edit_addon_details["slug"]
     invalid_email = ["", ".", "abc123", "mail.com", "abc@defg", 123, None]
     for item in invalid_email:
         # crete a new dictionary from the original payload, with variable email values
         email = {**payloads.edit_addon_details, "support_email": {"en-US": item}}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(email),
-        )
+        edit_addon = amo_api.edit_addon(addon, email, auth=session_auth)
         print(
             f'For email "{item}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -536,7 +413,7 @@ def test_edit_extension_invalid_support_email(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_invalid_experimental_and_payment(base_url, session_auth):
+def test_edit_extension_invalid_experimental_and_payment(amo_api, session_auth):
     """Try to set the 'experimental' and 'requires_payment' fields to other values than boolean"""
     addon = payloads.edit_addon_details["slug"]
     # 'is_experimental' and 'requires_payment' can only be True or False
@@ -548,14 +425,7 @@ def test_edit_extension_invalid_experimental_and_payment(base_url, session_auth)
             "is_experimental": item,
             "requires_payment": item,
         }
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = amo_api.edit_addon(addon, payload, auth=session_auth)
         print(
             f'For email "{item}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -575,7 +445,7 @@ def test_edit_extension_invalid_experimental_and_payment(base_url, session_auth)
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_valid_contribute_domains(base_url, session_auth):
+def test_edit_extension_valid_contribute_domains(amo_api, session_auth):
     """Add a valid contributions url to an addon; requests should be successful"""
     addon = payloads.edit_addon_details["slug"]
     valid_domains = [
@@ -594,14 +464,7 @@ def test_edit_extension_valid_contribute_domains(base_url, session_auth):
     for item in valid_domains:
         # crete a new dictionary from the original payload, with variable domain values
         payload = {**payloads.edit_addon_details, "contributions_url": item}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = amo_api.edit_addon(addon, payload, auth=session_auth)
         print(
             f'For domain "{item}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -612,7 +475,7 @@ def test_edit_extension_valid_contribute_domains(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_invalid_contribute_domains(base_url, session_auth, variables):
+def test_edit_extension_invalid_contribute_domains(amo_api, session_auth, variables):
     """Set an invalid or an unaccepted value as the addon's contribution url;
     accepted domains are predefined and must all start with 'https'"""
     addon = payloads.edit_addon_details["slug"]
@@ -629,14 +492,7 @@ def test_edit_extension_invalid_contribute_domains(base_url, session_auth, varia
     for item in invalid_domains:
         # crete a new dictionary from the original payload, with variable domain values
         payload = {**payloads.edit_addon_details, "contributions_url": item}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = amo_api.edit_addon(addon, payload, auth=session_auth)
         print(
             f'For domain "{item}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -668,7 +524,7 @@ def test_edit_extension_invalid_contribute_domains(base_url, session_auth, varia
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_invalid_addon_tags(base_url, session_auth):
+def test_edit_extension_invalid_addon_tags(amo_api, session_auth):
     """Try to set some invalid or unaccepted tags to an addon; valid tags are predefined"""
     addon = payloads.edit_addon_details["slug"]
     # set some invalid or combinations of invalid tags; for example,
@@ -677,14 +533,7 @@ def test_edit_extension_invalid_addon_tags(base_url, session_auth):
     for item in invalid_tags:
         # crete a new dictionary from the original payload, with variable values
         payload = {**payloads.edit_addon_details, "tags": item}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = amo_api.edit_addon(addon, payload, auth=session_auth)
         print(
             f'For tags "{item}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -719,15 +568,11 @@ def test_edit_extension_invalid_addon_tags(base_url, session_auth):
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_add_valid_icon(base_url, session_auth, icon):
+def test_edit_extension_add_valid_icon(base_url, amo_api, session_auth, icon):
     """Upload a custom icon for an addon; JPG and PNG are the only accepted formats"""
     addon = payloads.edit_addon_details["slug"]
     with open(icon, "rb") as img:
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"icon": img},
-        )
+        edit_addon = amo_api.edit_addon(addon, auth=session_auth, files={"icon": img})
         print(
             f'For icon "{icon}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -765,17 +610,13 @@ def test_edit_extension_add_valid_icon(base_url, session_auth, icon):
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
 def test_edit_extension_add_invalid_icons(
-    base_url, session_auth, count, icon, variables
+    amo_api, session_auth, count, icon, variables
 ):
     """Verify that requests fail if icons do not meet these acceptance criteria:
     PNG or JPG, square images, non-animated images, valid image file"""
     addon = payloads.edit_addon_details["slug"]
     with open(icon, "rb") as img:
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"icon": img},
-        )
+        edit_addon = amo_api.edit_addon(addon, auth=session_auth, files={"icon": img})
         print(
             f'For icon "{icon}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -801,54 +642,40 @@ def test_edit_extension_add_invalid_icons(
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_add_valid_screenshots(base_url, session_auth, count, preview):
+def test_edit_extension_add_valid_screenshots(
+    base_url, amo_api, session_auth, count, preview
+):
     """Set valid preview images for an addon; only JPG and JPG formats are accepted"""
     addon = payloads.edit_addon_details["slug"]
-    with open(preview, "rb") as img:
-        edit_addon = requests.post(
-            url=f"{base_url}{_addon_create}{addon}/previews/",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"image": img},
-            data={
-                "position": count
-            },  # sets the order in which the previews should appear
-        )
-        print(
-            f'For image "{preview}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
-        )
-        assert (
-            edit_addon.status_code == 201
-        ), f"Actual status code was {edit_addon.status_code}"
-        # verify the image has been uploaded by checking the image location (should be '/user_media/'()
-        assert f"{base_url}/user-media/previews/" in edit_addon.json()["image_url"]
-        assert edit_addon.json()["position"] == count
+    edit_addon = amo_api.create_preview(
+        addon, preview, auth=session_auth, position=count
+    )
+    print(
+        f'For image "{preview}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
+    )
+    assert (
+        edit_addon.status_code == 201
+    ), f"Actual status code was {edit_addon.status_code}"
+    # verify the image has been uploaded by checking the image location (should be '/user_media/'()
+    assert f"{base_url}/user-media/previews/" in edit_addon.json()["image_url"]
+    assert edit_addon.json()["position"] == count
 
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_previews_add_caption(base_url, session_auth):
+def test_edit_extension_previews_add_caption(amo_api, session_auth):
     """Adds a short text for each screenshot uploaded for an addon"""
     addon = payloads.edit_addon_details["slug"]
     # capture the preview ids to be used in the PATCH request and add them to a list
     previews_id = []
-    get_addon = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_addon = amo_api.get_addon(addon, auth=session_auth)
     r = get_addon.json()
     for image in r["previews"]:
         previews_id.append(image.get("id"))
     payload = payloads.preview_captions
     # add a caption for all the available previews
     for preview in previews_id:
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/previews/{preview}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = amo_api.edit_preview(addon, preview, payload, auth=session_auth)
         response = edit_addon.json()
         assert (
             edit_addon.json()["caption"] == payload["caption"]
@@ -857,13 +684,10 @@ def test_edit_extension_previews_add_caption(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_no_image_attached(base_url, session_auth):
+def test_edit_extension_no_image_attached(amo_api, session_auth):
     """Send a screenshot upload request without adding an image"""
     addon = payloads.edit_addon_details["slug"]
-    edit_addon = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/previews/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    edit_addon = amo_api.post(f"{_addon_create}{addon}/previews/", auth=session_auth)
     assert (
         edit_addon.status_code == 400
     ), f"Actual status code was {edit_addon.status_code}"
@@ -892,61 +716,47 @@ def test_edit_extension_no_image_attached(base_url, session_auth):
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
 def test_edit_extension_add_invalid_image(
-    base_url, session_auth, count, preview, variables
+    amo_api, session_auth, count, preview, variables
 ):
     """Verify that requests fail if images do not meet these acceptance criteria:
     PNG or JPG, non-animated images, valid image file"""
     addon = payloads.edit_addon_details["slug"]
-    with open(preview, "rb") as img:
-        edit_addon = requests.post(
-            url=f"{base_url}{_addon_create}{addon}/previews/",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"image": img},
-        )
-        print(
-            f'For image "{preview}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
-        )
-        assert (
-            edit_addon.status_code == 400
-        ), f"Actual status code was {edit_addon.status_code}"
-        # check that the validation messages expected for each image type are matching the API response
-        assert variables["image_validation_messages"][count] in edit_addon.text
+    edit_addon = amo_api.create_preview(addon, preview, auth=session_auth)
+    print(
+        f'For image "{preview}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
+    )
+    assert (
+        edit_addon.status_code == 400
+    ), f"Actual status code was {edit_addon.status_code}"
+    # check that the validation messages expected for each image type are matching the API response
+    assert variables["image_validation_messages"][count] in edit_addon.text
 
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_delete_previews(base_url, session_auth):
+def test_edit_extension_delete_previews(amo_api, session_auth):
     """Verify that addon previews can be deleted"""
     addon = payloads.edit_addon_details["slug"]
     # get the preview ids for the available images
     preview_ids = []
-    get_addon = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_addon = amo_api.get_addon(addon, auth=session_auth)
     r = get_addon.json()
     for image in r["previews"]:
         preview_ids.append(image.get("id"))
     for preview_id in preview_ids:
-        delete_image = requests.delete(
-            url=f"{base_url}{_addon_create}{addon}/previews/{preview_id}",
-            headers={"Authorization": f"Session {session_auth}"},
-        )
+        delete_image = amo_api.delete_preview(addon, preview_id, auth=session_auth)
         assert (
             delete_image.status_code == 204
         ), f"Actual status code was {delete_image.status_code}"
     # get the add-on details again
-    get_addon = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_addon = amo_api.get_addon(addon, auth=session_auth)
     # check that there are no screenshots left for this addon
     assert len(get_addon.json()["previews"]) == 0
 
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_default_locale_with_translations(base_url, session_auth):
+def test_edit_default_locale_with_translations(amo_api, session_auth):
     """Change the 'default_locale' of the addon to another locale for which we
     already have translations for the mandatory fields - i.e. 'name' and 'summary'"""
     addon = payloads.edit_addon_details["slug"]
@@ -955,14 +765,7 @@ def test_edit_default_locale_with_translations(base_url, session_auth):
     for locale in available_translations:
         # crete a new dictionary from the original payload, with variable values
         payload = {**payloads.edit_addon_details, "default_locale": locale}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = amo_api.edit_addon(addon, payload, auth=session_auth)
         print(
             f'For locale "{locale}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -976,7 +779,7 @@ def test_edit_default_locale_with_translations(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_default_locale_with_missing_translations(base_url, session_auth):
+def test_edit_default_locale_with_missing_translations(amo_api, session_auth):
     """Change the 'default_locale' of the addon to another locale for which we
     don't have translations for all the required fields - i.e. 'homepage', 'email'"""
     addon = payloads.edit_addon_details["slug"]
@@ -985,14 +788,7 @@ def test_edit_default_locale_with_missing_translations(base_url, session_auth):
     for locale in unavailable_translations:
         # crete a new dictionary from the original payload, with variable values
         payload = {**payloads.edit_addon_details, "default_locale": locale}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = amo_api.edit_addon(addon, payload, auth=session_auth)
         print(
             f'For locale "{locale}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -1008,21 +804,14 @@ def test_edit_default_locale_with_missing_translations(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_default_locale_invalid_values(base_url, session_auth):
+def test_edit_default_locale_invalid_values(amo_api, session_auth):
     """Use some invalid/unaccepted data types for setting a 'default_locale'"""
     addon = payloads.edit_addon_details["slug"]
     invalid_locales = ["foo", 123, None, ["de", "fr"], ""]
     for locale in invalid_locales:
         # crete a new dictionary from the original payload, with variable values
         payload = {**payloads.edit_addon_details, "default_locale": locale}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = amo_api.edit_addon(addon, payload, auth=session_auth)
         print(
             f'For locale "{locale}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -1042,7 +831,7 @@ def test_edit_default_locale_invalid_values(base_url, session_auth):
 
 
 @pytest.mark.serial
-def test_edit_addon_with_incorrect_account(base_url, selenium):
+def test_edit_addon_with_incorrect_account(base_url, amo_api, selenium):
     """Edit the add-on details while being authenticated with a different, non-owner developer account"""
     amo = Home(selenium, base_url).open().wait_for_page_to_load()
     # login with a user that has no authorship over the addon we want to edit
@@ -1051,14 +840,7 @@ def test_edit_addon_with_incorrect_account(base_url, selenium):
     addon = payloads.edit_addon_details["slug"]
     # crete a new dictionary from the original payload, with a different name values
     payload = {**payloads.edit_addon_details, "name": {"en-US": "some_name"}}
-    edit_addon = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={
-            "Authorization": f'Session {session_cookie["value"]}',
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_addon = amo_api.edit_addon(addon, payload, auth=session_cookie["value"])
     assert (
         edit_addon.status_code == 403
     ), f"Actual status code was {edit_addon.status_code}"
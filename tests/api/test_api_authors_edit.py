@@ -1,5 +1,3 @@
-import json
-import requests
 import pytest
 
 from api import payloads
@@ -20,7 +18,7 @@ _addon_create = "/api/v5/addons/addon/"
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_add_new_author(base_url, session_auth, variables):
+def test_addon_add_new_author(amo_api, session_auth, variables):
     """This test verifies the process of adding a new author to an add-on via the API.
     It sends a POST request to the API endpoint with the necessary payload containing
     the new author's details, including their user ID and position in the authors list.
@@ -30,13 +28,10 @@ def test_addon_add_new_author(base_url, session_auth, variables):
     author = variables["api_post_valid_author"]
     # create the payload with the fields required for a new author set-up
     payload = {**payloads.author_stats, "user_id": author, "position": 1}
-    add_author = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
+    add_author = amo_api.post(
+        f"{_addon_create}{addon}/pending-authors/",
+        auth=session_auth,
+        json=payload,
     )
     assert (
         add_author.status_code == 201
@@ -47,28 +42,28 @@ def test_addon_add_new_author(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("staff_user")
-def test_addon_author_decline_invitation(base_url, session_auth):
+def test_addon_author_decline_invitation(amo_api, session_auth):
     """With a user that was invited to become an addon author, decline the invitation received"""
     addon = payloads.edit_addon_details["slug"]
-    decline_invite = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/decline/",
-        headers={"Authorization": f"Session {session_auth}"},
+    decline_invite = amo_api.post(
+        f"{_addon_create}{addon}/pending-authors/decline/",
+        auth=session_auth,
     )
     assert (
         decline_invite.status_code == 200
     ), f"Actual response: {decline_invite.status_code}, {decline_invite.text}"
     # try to re-decline invitation to make sure only once it's possible and there are no unexpected errors raised
-    redecline_invite = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/decline/",
-        headers={"Authorization": f"Session {session_auth}"},
+    redecline_invite = amo_api.post(
+        f"{_addon_create}{addon}/pending-authors/decline/",
+        auth=session_auth,
     )
     assert (
         redecline_invite.status_code == 403
     ), f"Actual response: {decline_invite.status_code}, {decline_invite.text}"
     # After having declined an invitation, try to confirm it; this should not be allowed
-    confirm_declined_invite = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/confirm/",
-        headers={"Authorization": f"Session {session_auth}"},
+    confirm_declined_invite = amo_api.post(
+        f"{_addon_create}{addon}/pending-authors/confirm/",
+        auth=session_auth,
     )
     assert (
         confirm_declined_invite.status_code == 403
@@ -77,18 +72,15 @@ def test_addon_author_decline_invitation(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_add_author_without_display_name(base_url, session_auth, variables):
+def test_addon_add_author_without_display_name(amo_api, session_auth, variables):
     """It is mandatory for a user to have a display name set in order to be accepted as an addon author"""
     addon = payloads.edit_addon_details["slug"]
     author = variables["api_post_author_no_display_name"]
     payload = {"user_id": author, "position": 2}
-    add_author = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
+    add_author = amo_api.post(
+        f"{_addon_create}{addon}/pending-authors/",
+        auth=session_auth,
+        json=payload,
     )
     assert (
         add_author.status_code == 400
@@ -101,18 +93,15 @@ def test_addon_add_author_without_display_name(base_url, session_auth, variables
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_add_restricted_author(base_url, session_auth, variables):
+def test_addon_add_restricted_author(amo_api, session_auth, variables):
     """If a user is added to the email restriction list, it is not possible to add it as an addon author"""
     addon = payloads.edit_addon_details["slug"]
     author = variables["api_post_author_no_dev_agreement"]
     payload = {"user_id": author, "position": 2}
-    add_author = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
+    add_author = amo_api.post(
+        f"{_addon_create}{addon}/pending-authors/",
+        auth=session_auth,
+        json=payload,
     )
     assert (
         add_author.status_code == 400
@@ -125,17 +114,14 @@ def test_addon_add_restricted_author(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_add_invalid_authors(base_url, session_auth):
+def test_addon_add_invalid_authors(amo_api, session_auth):
     """Try to add a non exiting user as an addon author"""
     addon = payloads.edit_addon_details["slug"]
     payload = {**payloads.author_stats, "user_id": 9999999999, "position": 2}
-    add_author = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
+    add_author = amo_api.post(
+        f"{_addon_create}{addon}/pending-authors/",
+        auth=session_auth,
+        json=payload,
     )
     assert (
         add_author.status_code == 400
@@ -147,26 +133,23 @@ def test_addon_add_invalid_authors(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_confirm_invitation_with_wrong_user(base_url, session_auth, variables):
+def test_addon_confirm_invitation_with_wrong_user(amo_api, session_auth, variables):
     """Send an author invitation to a user and try to confirm the invite with a different user"""
     addon = payloads.edit_addon_details["slug"]
     author = variables["api_post_valid_author"]
     payload = {**payloads.author_stats, "user_id": author, "position": 1}
-    add_author = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
+    add_author = amo_api.post(
+        f"{_addon_create}{addon}/pending-authors/",
+        auth=session_auth,
+        json=payload,
     )
     assert (
         add_author.status_code == 201
     ), f"Actual response {add_author.status_code}, {add_author.text}"
     # confirm invitation with a user different from the one invited
-    confirm_invite = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/confirm/",
-        headers={"Authorization": f"Session {session_auth}"},
+    confirm_invite = amo_api.post(
+        f"{_addon_create}{addon}/pending-authors/confirm/",
+        auth=session_auth,
     )
     assert (
         confirm_invite.status_code == 403
@@ -175,14 +158,14 @@ def test_addon_confirm_invitation_with_wrong_user(base_url, session_auth, variab
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_list_pending_authors(base_url, session_auth, variables):
+def test_addon_list_pending_authors(amo_api, session_auth, variables):
     """Check that users invited to become addon authors are listed in the pending authors queue"""
     addon = payloads.edit_addon_details["slug"]
     # this is the author that should be pending for confirmation
     author = variables["api_post_valid_author"]
-    get_pending_authors = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/",
-        headers={"Authorization": f"Session {session_auth}"},
+    get_pending_authors = amo_api.get(
+        f"{_addon_create}{addon}/pending-authors/",
+        auth=session_auth,
     )
     get_pending_authors.raise_for_status()
     assert author == get_pending_authors.json()[0].get("user_id")
@@ -190,14 +173,14 @@ def test_addon_list_pending_authors(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_get_pending_author_details(base_url, session_auth, variables):
+def test_addon_get_pending_author_details(amo_api, session_auth, variables):
     """Check that the author details (role, position, visibility) set up in the request
     are returned in the pending author details API"""
     addon = payloads.edit_addon_details["slug"]
     author = variables["api_post_valid_author"]
-    get_pending_author_details = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/{author}/",
-        headers={"Authorization": f"Session {session_auth}"},
+    get_pending_author_details = amo_api.get(
+        f"{_addon_create}{addon}/pending-authors/{author}/",
+        auth=session_auth,
     )
     get_pending_author_details.raise_for_status()
     pending_author = get_pending_author_details.json()
@@ -209,19 +192,16 @@ def test_addon_get_pending_author_details(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_edit_pending_author(base_url, session_auth, variables):
+def test_addon_edit_pending_author(amo_api, session_auth, variables):
     """As the user who initiated the author request, edit the details (role, visibility) of
     the invite and make sure that the changes are applied correctly"""
     addon = payloads.edit_addon_details["slug"]
     author = variables["api_post_valid_author"]
     payload = {"role": "owner", "listed": True}
-    edit_pending_author_details = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/{author}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
+    edit_pending_author_details = amo_api.patch(
+        f"{_addon_create}{addon}/pending-authors/{author}/",
+        auth=session_auth,
+        json=payload,
     )
     edit_pending_author_details.raise_for_status()
     pending_author = edit_pending_author_details.json()
@@ -233,14 +213,14 @@ def test_addon_edit_pending_author(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_delete_pending_author(base_url, session_auth, variables):
+def test_addon_delete_pending_author(amo_api, session_auth, variables):
     """As the user who initiated the author request, delete the invite before the
     new author had the chance to confirm it"""
     addon = payloads.edit_addon_details["slug"]
     author = variables["api_post_valid_author"]
-    delete_pending_author = requests.delete(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/{author}/",
-        headers={"Authorization": f"Session {session_auth}"},
+    delete_pending_author = amo_api.delete(
+        f"{_addon_create}{addon}/pending-authors/{author}/",
+        auth=session_auth,
     )
     assert (
         delete_pending_author.status_code == 204
@@ -249,12 +229,12 @@ def test_addon_delete_pending_author(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("staff_user")
-def test_addon_author_confirm_deleted_invitation(base_url, session_auth, variables):
+def test_addon_author_confirm_deleted_invitation(amo_api, session_auth, variables):
     """With the author that was invited, try to accept the deleted invite to make sure it is not possible"""
     addon = payloads.edit_addon_details["slug"]
-    confirm_deleted_invite = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/confirm/",
-        headers={"Authorization": f"Session {session_auth}"},
+    confirm_deleted_invite = amo_api.post(
+        f"{_addon_create}{addon}/pending-authors/confirm/",
+        auth=session_auth,
     )
     assert (
         confirm_deleted_invite.status_code == 403
@@ -263,20 +243,17 @@ def test_addon_author_confirm_deleted_invitation(base_url, session_auth, variabl
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_invite_multiple_authors(base_url, session_auth, variables):
+def test_addon_invite_multiple_authors(amo_api, session_auth, variables):
     """Check that an addon owner can invite multiple users to become addon authors
     in addition to the one added previously"""
     addon = payloads.edit_addon_details["slug"]
     # invite the first author
     first_author = variables["api_post_valid_author"]
     payload = {**payloads.author_stats, "user_id": first_author, "position": 1}
-    first_invite = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
+    first_invite = amo_api.post(
+        f"{_addon_create}{addon}/pending-authors/",
+        auth=session_auth,
+        json=payload,
     )
     assert (
         first_invite.status_code == 201
@@ -284,21 +261,18 @@ def test_addon_invite_multiple_authors(base_url, session_auth, variables):
     # invite the second author
     second_author = variables["api_post_additional_author"]
     payload = {**payloads.author_stats, "user_id": second_author, "position": 2}
-    second_invite = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
+    second_invite = amo_api.post(
+        f"{_addon_create}{addon}/pending-authors/",
+        auth=session_auth,
+        json=payload,
     )
     assert (
         second_invite.status_code == 201
     ), f"Actual response: {second_invite.status_code}, {second_invite.text}"
     # verify that both users are present in the pending authors list
-    get_pending_authors = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/",
-        headers={"Authorization": f"Session {session_auth}"},
+    get_pending_authors = amo_api.get(
+        f"{_addon_create}{addon}/pending-authors/",
+        auth=session_auth,
     )
     print("First author is: " + str(get_pending_authors.json()[0].get("user_id")))
     print("Second author is: " + str(get_pending_authors.json()[1].get("user_id")))
@@ -309,18 +283,15 @@ def test_addon_invite_multiple_authors(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_invite_same_author_twice(base_url, session_auth, variables):
+def test_addon_invite_same_author_twice(amo_api, session_auth, variables):
     """Check that an author can only be invited once, if the invitation is still active"""
     addon = payloads.edit_addon_details["slug"]
     author = variables["api_post_additional_author"]
     payload = {**payloads.author_stats, "user_id": author, "position": 2}
-    duplicate_invite = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
+    duplicate_invite = amo_api.post(
+        f"{_addon_create}{addon}/pending-authors/",
+        auth=session_auth,
+        json=payload,
     )
     assert (
         duplicate_invite.status_code == 400
@@ -332,19 +303,19 @@ def test_addon_invite_same_author_twice(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("staff_user")
-def test_addon_confirm_invitation_with_correct_user(base_url, session_auth):
+def test_addon_confirm_invitation_with_correct_user(amo_api, session_auth):
     addon = payloads.edit_addon_details["slug"]
-    accept_invite = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/confirm/",
-        headers={"Authorization": f"Session {session_auth}"},
+    accept_invite = amo_api.post(
+        f"{_addon_create}{addon}/pending-authors/confirm/",
+        auth=session_auth,
     )
     assert (
         accept_invite.status_code == 200
     ), f"Actual response: {accept_invite.status_code}, {accept_invite.text}"
     # try to re-confirm invitation to make sure only once it's possible and there are no unexpected errors
-    reconfirm_invite = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/confirm/",
-        headers={"Authorization": f"Session {session_auth}"},
+    reconfirm_invite = amo_api.post(
+        f"{_addon_create}{addon}/pending-authors/confirm/",
+        auth=session_auth,
     )
     assert (
         reconfirm_invite.status_code == 403
@@ -353,20 +324,17 @@ def test_addon_confirm_invitation_with_correct_user(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("staff_user")
-def test_addon_developer_role_cannot_add_authors(base_url, session_auth, variables):
+def test_addon_developer_role_cannot_add_authors(amo_api, session_auth, variables):
     """Check that an author with a 'developer' role doesn't have the rights to invite other authors
     for an addon; only authors with 'owner' roles have the rights to invite other users
     """
     addon = payloads.edit_addon_details["slug"]
     author = variables["api_post_additional_author"]
     payload = {**payloads.author_stats, "user_id": author, "position": 3}
-    invite_author = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
+    invite_author = amo_api.post(
+        f"{_addon_create}{addon}/pending-authors/",
+        auth=session_auth,
+        json=payload,
     )
     assert (
         invite_author.status_code == 403
@@ -379,7 +347,7 @@ def test_addon_developer_role_cannot_add_authors(base_url, session_auth, variabl
 @pytest.mark.serial
 @pytest.mark.create_session("staff_user")
 def test_addon_developer_role_cannot_edit_pending_author(
-    base_url, session_auth, variables
+    amo_api, session_auth, variables
 ):
     """Check that an author with a 'developer' role doesn't have the rights to edit details
     for other pending authors; only authors with 'owner' roles have the rights to make changes
@@ -387,13 +355,10 @@ def test_addon_developer_role_cannot_edit_pending_author(
     addon = payloads.edit_addon_details["slug"]
     author = variables["api_post_additional_author"]
     payload = {"role": "owner", "listed": True}
-    edit_authors = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/{author}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
+    edit_authors = amo_api.patch(
+        f"{_addon_create}{addon}/pending-authors/{author}/",
+        auth=session_auth,
+        json=payload,
     )
     assert (
         edit_authors.status_code == 403
@@ -403,7 +368,7 @@ def test_addon_developer_role_cannot_edit_pending_author(
 @pytest.mark.serial
 @pytest.mark.create_session("staff_user")
 def test_addon_developer_role_cannot_delete_pending_author(
-    base_url, session_auth, variables
+    amo_api, session_auth, variables
 ):
     """Check that an author with a 'developer' role
     doesn't have the rights to delete other
@@ -411,9 +376,9 @@ def test_addon_developer_role_cannot_delete_pending_author(
     roles have the rights to delete them"""
     addon = payloads.edit_addon_details["slug"]
     author = variables["api_post_additional_author"]
-    delete_author = requests.delete(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/{author}/",
-        headers={"Authorization": f"Session {session_auth}"},
+    delete_author = amo_api.delete(
+        f"{_addon_create}{addon}/pending-authors/{author}/",
+        auth=session_auth,
     )
     assert (
         delete_author.status_code == 403
@@ -422,15 +387,12 @@ def test_addon_developer_role_cannot_delete_pending_author(
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_list_active_authors(base_url, session_auth, variables):
+def test_addon_list_active_authors(amo_api, session_auth, variables):
     """Verify that the list of active addon authors contains only the confirmed users"""
     addon_owner = variables["api_addon_author_owner"]
     additional_author = variables["api_post_valid_author"]
     addon = payloads.edit_addon_details["slug"]
-    get_authors = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/authors/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_authors = amo_api.get(f"{_addon_create}{addon}/authors/", auth=session_auth)
     response = get_authors.json()
     # we should have only two valid authors for this addon
     assert len(response) == 2
@@ -440,18 +402,15 @@ def test_addon_list_active_authors(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_author_owner_is_required(base_url, session_auth, variables):
+def test_addon_author_owner_is_required(amo_api, session_auth, variables):
     """Try to downgrade the current single addon owner to a developer role.
     The request should fail as an addon requires at least one active owner"""
     addon = payloads.edit_addon_details["slug"]
     author = variables["api_addon_author_owner"]
-    edit_author = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/authors/{author}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps({"role": "developer"}),
+    edit_author = amo_api.patch(
+        f"{_addon_create}{addon}/authors/{author}/",
+        auth=session_auth,
+        json={"role": "developer"},
     )
     assert (
         edit_author.status_code == 400
@@ -463,18 +422,15 @@ def test_addon_author_owner_is_required(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_one_listed_author_is_required(base_url, session_auth, variables):
+def test_addon_one_listed_author_is_required(amo_api, session_auth, variables):
     """Check that an addon needs to have at
      least one author listed on the site"""
     addon = payloads.edit_addon_details["slug"]
     author = variables["api_addon_author_owner"]
-    edit_author = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/authors/{author}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps({"listed": False}),
+    edit_author = amo_api.patch(
+        f"{_addon_create}{addon}/authors/{author}/",
+        auth=session_auth,
+        json={"listed": False},
     )
     assert (
         edit_author.status_code == 400
@@ -486,18 +442,15 @@ def test_addon_one_listed_author_is_required(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_change_non_active_author_details(base_url, session_auth):
+def test_addon_change_non_active_author_details(amo_api, session_auth):
     """Try to edit the details of a user
     that is not listed as an addon author
     and make sure no unexpected errors are raised"""
     addon = payloads.edit_addon_details["slug"]
-    edit_author = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/authors/0123/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payloads.author_stats),
+    edit_author = amo_api.patch(
+        f"{_addon_create}{addon}/authors/0123/",
+        auth=session_auth,
+        json=payloads.author_stats,
     )
     assert (
         edit_author.status_code == 404
@@ -506,19 +459,16 @@ def test_addon_change_non_active_author_details(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_unauthorized_user_change_author_details(base_url, session_auth, variables):
+def test_unauthorized_user_change_author_details(amo_api, session_auth, variables):
     """With a user that is not listed
     as an addon author,
     try to edit author details
     and make sure no unexpected errors are raised"""
     author = variables["api_post_valid_author"]
-    edit_author = requests.patch(
-        url=f"{base_url}{_addon_create}staff_user_adoon /authors/{author}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payloads.author_stats),
+    edit_author = amo_api.patch(
+        f"{_addon_create}staff_user_adoon /authors/{author}/",
+        auth=session_auth,
+        json=payloads.author_stats,
     )
     assert (
         edit_author.status_code == 403
@@ -527,14 +477,14 @@ def test_unauthorized_user_change_author_details(base_url, session_auth, variabl
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_delete_owner_author(base_url, session_auth, variables):
+def test_addon_delete_owner_author(amo_api, session_auth, variables):
     """Check that the only owner
     of an addon cannot be deleted"""
     addon = payloads.edit_addon_details["slug"]
     author = variables["api_addon_author_owner"]
-    delete_owner = requests.delete(
-        url=f"{base_url}{_addon_create}{addon}/authors/{author}/",
-        headers={"Authorization": f"Session {session_auth}"},
+    delete_owner = amo_api.delete(
+        f"{_addon_create}{addon}/authors/{author}/",
+        auth=session_auth,
     )
     assert (
         delete_owner.status_code == 400
@@ -546,20 +496,17 @@ def test_addon_delete_owner_author(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("staff_user")
-def test_addon_developer_role_cannot_edit_authors(base_url, session_auth, variables):
+def test_addon_developer_role_cannot_edit_authors(amo_api, session_auth, variables):
     """An author with a developer role should
     not be allowed to edit existing authors,
     like elevating their role to owners for example"""
     addon = payloads.edit_addon_details["slug"]
     author = variables["api_post_valid_author"]
     # send the patch author requests with the developer role
-    edit_author = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/authors/{author}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps({"role": "owner"}),
+    edit_author = amo_api.patch(
+        f"{_addon_create}{addon}/authors/{author}/",
+        auth=session_auth,
+        json={"role": "owner"},
     )
     assert (
         edit_author.status_code == 403
@@ -571,15 +518,15 @@ def test_addon_developer_role_cannot_edit_authors(base_url, session_auth, variab
 
 @pytest.mark.serial
 @pytest.mark.create_session("staff_user")
-def test_addon_developer_role_cannot_delete_authors(base_url, session_auth, variables):
+def test_addon_developer_role_cannot_delete_authors(amo_api, session_auth, variables):
     """An author with a developer role should
     not be allowed to delete existing authors"""
     addon = payloads.edit_addon_details["slug"]
     author = variables["api_post_valid_author"]
     # send the patch author requests with the developer role
-    delete_author = requests.delete(
-        url=f"{base_url}{_addon_create}{addon}/authors/{author}/",
-        headers={"Authorization": f"Session {session_auth}"},
+    delete_author = amo_api.delete(
+        f"{_addon_create}{addon}/authors/{author}/",
+        auth=session_auth,
     )
     assert (
         delete_author.status_code == 403
@@ -591,15 +538,12 @@ def test_addon_developer_role_cannot_delete_authors(base_url, session_auth, vari
 
 @pytest.mark.serial
 @pytest.mark.create_session("staff_user")
-def test_addon_developer_role_cannot_delete_addon(base_url, session_auth):
+def test_addon_developer_role_cannot_delete_addon(amo_api, session_auth):
     """Verify that an addon cannot be deleted
     by an author with a developer role;
     only owners are allowed to delete addons"""
     addon = payloads.edit_addon_details["slug"]
-    delete_addon = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/delete_confirm/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    delete_addon = amo_api.delete_confirm(addon, auth=session_auth)
     assert (
         delete_addon.status_code == 403
     ), f"Actual response: {delete_addon.status_code}, {delete_addon.text}"
@@ -612,16 +556,16 @@ def test_addon_developer_role_cannot_delete_addon(base_url, session_auth):
 @pytest.mark.create_session("staff_user")
 @pytest.mark.clear_session
 def test_addon_developer_role_can_request_author_details(
-    selenium, base_url, variables, session_auth
+    selenium, amo_api, variables, session_auth
 ):
     """Verify that an author with a developer
      role can view details for existing addon authors"""
     addon = payloads.edit_addon_details["slug"]
     author = variables["api_post_valid_author"]
     # send the patch author requests with the developer role
-    get_author_details = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/authors/{author}/",
-        headers={"Authorization": f"Session {session_auth}"},
+    get_author_details = amo_api.get(
+        f"{_addon_create}{addon}/authors/{author}/",
+        auth=session_auth,
     )
     assert (
         get_author_details.status_code == 200
@@ -633,20 +577,17 @@ def test_addon_developer_role_can_request_author_details(
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_change_author_stats(base_url, session_auth, variables):
+def test_addon_change_author_stats(amo_api, session_auth, variables):
     """Change the details - role, visibility,
     position - of an exiting author
     and verify that changes were applied correctly"""
     addon = payloads.edit_addon_details["slug"]
     author = variables["api_post_valid_author"]
     payload = {**payloads.author_stats, "role": "owner", "position": 0, "listed": True}
-    edit_author = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/authors/{author}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
+    edit_author = amo_api.patch(
+        f"{_addon_create}{addon}/authors/{author}/",
+        auth=session_auth,
+        json=payload,
     )
     edit_author.raise_for_status()
     new_stats = edit_author.json()
@@ -657,24 +598,24 @@ def test_addon_change_author_stats(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_delete_all_active_and_pending_authors(base_url, session_auth, variables):
+def test_addon_delete_all_active_and_pending_authors(amo_api, session_auth, variables):
     """As the addon owner, delete all
      additional authors (pending or active)"""
     addon = payloads.edit_addon_details["slug"]
     active_author = variables["api_post_valid_author"]
     pending_author = variables["api_post_additional_author"]
     # delete active author (invitation accepted)
-    delete_active_author = requests.delete(
-        url=f"{base_url}{_addon_create}{addon}/authors/{active_author}/",
-        headers={"Authorization": f"Session {session_auth}"},
+    delete_active_author = amo_api.delete(
+        f"{_addon_create}{addon}/authors/{active_author}/",
+        auth=session_auth,
     )
     assert (
         delete_active_author.status_code == 204
     ), f"Actual response: {delete_active_author.status_code}, {delete_active_author.text}"
     # delete the pending author (invitation not confirmed)
-    delete_pending_author = requests.delete(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/{pending_author}/",
-        headers={"Authorization": f"Session {session_auth}"},
+    delete_pending_author = amo_api.delete(
+        f"{_addon_create}{addon}/pending-authors/{pending_author}/",
+        auth=session_auth,
     )
     assert (
         delete_pending_author.status_code == 204
@@ -1,17 +1,9 @@
-import json
-import time
-
 import pytest
-import requests
 
 from api import payloads, api_helpers
 
 from scripts import reusables
 
-# endpoints used in the version edit tests
-_addon_create = "/api/v5/addons/addon/"
-_upload = "/api/v5/addons/upload/"
-
 # These tests are covering various valid and invalid scenarios for editing
 # addon version details such as: compatibility, license, release notes, source code,
 # uploading new versions, deleting the addons;
@@ -26,24 +18,14 @@ _upload = "/api/v5/addons/upload/"
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_details(base_url, session_auth):
+def test_edit_version_details(amo_api, session_auth):
     """Edit the version specific fields, i.e. 'release_notes', 'license, 'compatibility'"""
     addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = amo_api.get_addon(addon, auth=session_auth)
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = payloads.edit_version_details
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_version = amo_api.edit_version(addon, version, payload, auth=session_auth)
     edit_version.raise_for_status()
     response = edit_version.json()
     # verify that the data we sent has been registered correctly in the response we get
@@ -54,27 +36,17 @@ def test_edit_version_details(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_custom_license_no_text(base_url, session_auth):
+def test_edit_version_custom_license_no_text(amo_api, session_auth):
     """When setting a custom license, it is mandatory for that license to contain a text"""
     addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = amo_api.get_addon(addon, auth=session_auth)
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = {
         **payloads.custom_license,
         "custom_license": {"name": {"en-US": "no-text-provided"}},
     }
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_version = amo_api.edit_version(addon, version, payload, auth=session_auth)
     assert (
         edit_version.status_code == 400
     ), f"Actual status code was {edit_version.status_code}"
@@ -85,25 +57,15 @@ def test_edit_version_custom_license_no_text(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_set_custom_license(base_url, session_auth):
+def test_edit_version_set_custom_license(amo_api, session_auth):
     """Instead of using a predefined addon license provided by AMO, add a
     custom license with 'name' and 'text' defined by the addon author"""
     addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = amo_api.get_addon(addon, auth=session_auth)
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = payloads.custom_license
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_version = amo_api.edit_version(addon, version, payload, auth=session_auth)
     edit_version.raise_for_status()
     response = edit_version.json()
     assert payload["custom_license"]["name"] == response["license"]["name"]
@@ -112,29 +74,18 @@ def test_edit_version_set_custom_license(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_new_listed_version(base_url, session_auth):
+def test_upload_new_listed_version(amo_api, session_auth):
     """Uploads a new listed version for an existing addon"""
-    with open("sample-addons/listed-addon-new-version.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-    time.sleep(5)
+    upload = amo_api.upload(
+        "sample-addons/listed-addon-new-version.zip", "listed", auth=session_auth
+    )
     upload.raise_for_status()
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     addon = payloads.edit_addon_details["slug"]
     payload = payloads.new_version_details(uuid)
-    new_version = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/versions/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    new_version = amo_api.create_version(addon, payload, auth=session_auth)
     new_version.raise_for_status()
     response = new_version.json()
     # verify that the new version was created with the data provided
@@ -146,33 +97,22 @@ def test_upload_new_listed_version(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_new_version_with_existing_version_number(base_url, session_auth):
+def test_upload_new_version_with_existing_version_number(amo_api, session_auth):
     """Uploads a new version with an existing version number; the upload should fail"""
-    with open("sample-addons/listed-addon-new-version.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-    time.sleep(5)
+    upload = amo_api.upload(
+        "sample-addons/listed-addon-new-version.zip", "listed", auth=session_auth
+    )
     print("Post upload json: " + f"{upload}")
     upload.raise_for_status()
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     print("UUID json: " + f"{uuid}")
     addon = payloads.edit_addon_details["slug"]
     print("addon json: " + f"{addon}")
     payload = payloads.new_version_details(uuid)
     print("payload json: " + f"{payload}")
-    new_version = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/versions/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    new_version = amo_api.create_version(addon, payload, auth=session_auth)
     print("payload json: " + f"{new_version}")
     assert (
         new_version.status_code == 409
@@ -184,39 +124,27 @@ def test_upload_new_version_with_existing_version_number(base_url, session_auth)
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_new_unlisted_version_with_put_method(base_url, session_auth):
+def test_upload_new_unlisted_version_with_put_method(amo_api, session_auth):
     """Takes an addon with listed version only and submits an unlisted version;
     this is creating an addon with mixed versions. Use the PUT endpoint in this
      case to check that it also works for a new version submission process"""
     addon = payloads.edit_addon_details["slug"]
     # get the addon guid required for the PUT method
-    get_addon_details = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_addon_details = amo_api.get_addon(addon, auth=session_auth)
     guid = get_addon_details.json()["guid"]
     # upload a new unlisted version
-    with open("sample-addons/mixed-addon-versions.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "unlisted"},
-        )
-    time.sleep(5)
+    upload = amo_api.upload(
+        "sample-addons/mixed-addon-versions.zip", "unlisted", auth=session_auth
+    )
     upload.raise_for_status()
     resp = upload.json()
     # verify that the upload was created as unlisted
     assert "unlisted" in resp["channel"]
     # get the addon uuid generated after upload
     uuid = resp["uuid"]
-    new_version = requests.put(
-        url=f"{base_url}{_addon_create}{guid}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps({"version": {"upload": uuid}}),
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
+    new_version = amo_api.put_addon(
+        guid, {"version": {"upload": uuid}}, auth=session_auth
     )
     new_version.raise_for_status()
     response = new_version.json()
@@ -226,30 +154,17 @@ def test_upload_new_unlisted_version_with_put_method(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_new_version_with_different_addon_type(base_url, session_auth):
+def test_upload_new_version_with_different_addon_type(amo_api, session_auth):
     """Take an exiting addon of type 'extensions' and try to upload a new version
     of type 'statictheme' for it; the submission should fail"""
-    with open("sample-addons/theme.xpi", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-    time.sleep(5)
+    upload = amo_api.upload("sample-addons/theme.xpi", "listed", auth=session_auth)
     upload.raise_for_status()
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     addon = payloads.edit_addon_details["slug"]
     payload = {"upload": uuid}
-    new_version = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/versions/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    new_version = amo_api.create_version(addon, payload, auth=session_auth)
     assert (
         new_version.status_code == 400
     ), f"Actual response: status code = {new_version.status_code}, message = {new_version.text}"
@@ -261,7 +176,7 @@ def test_upload_new_version_with_different_addon_type(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_new_version_with_different_guid(base_url, session_auth):
+def test_upload_new_version_with_different_guid(amo_api, session_auth):
     """Take an exiting addon and submit a new version that has a different GUID
     from what we have on AMO for this addon; the submission should fail"""
     guid = f"random-guid@{reusables.get_random_string(6)}"
@@ -272,28 +187,15 @@ def test_upload_new_version_with_different_guid(base_url, session_auth):
         "name": "New version with different guid",
         "browser_specific_settings": {"gecko": {"id": guid}},
     }
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-    time.sleep(5)
+    addon_file = api_helpers.make_addon(manifest)
+    upload = amo_api.upload(addon_file, "listed", auth=session_auth)
     upload.raise_for_status()
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     addon = payloads.edit_addon_details["slug"]
     payload = {"upload": uuid}
-    new_version = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/versions/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    new_version = amo_api.create_version(addon, payload, auth=session_auth)
     assert (
         new_version.status_code == 400
     ), f"Actual response: status code = {new_version.status_code}, message = {new_version.text}"
@@ -305,33 +207,24 @@ def test_upload_new_version_with_different_guid(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_new_version_with_sources(base_url, session_auth):
+def test_upload_new_version_with_sources(base_url, amo_api, session_auth):
     """Uploads a new version for an exiting addon while also attaching additional source code"""
     manifest = {
         **payloads.minimal_manifest,
         "name": "EN-US Name edited",
         "version": "3.0",
     }
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-    time.sleep(5)
+    addon_file = api_helpers.make_addon(manifest)
+    upload = amo_api.upload(addon_file, "listed", auth=session_auth)
     upload.raise_for_status()
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     addon = payloads.edit_addon_details["slug"]
     # submit the version and attach source code
     with open("sample-addons/listed-addon.zip", "rb") as source:
-        new_version = requests.post(
-            url=f"{base_url}{_addon_create}{addon}/versions/",
-            headers={"Authorization": f"Session {session_auth}"},
-            data={"upload": uuid},
-            files={"source": source},
+        new_version = amo_api.create_version(
+            addon, {"upload": uuid}, auth=session_auth, files={"source": source}
         )
     response = new_version.json()
     new_version.raise_for_status()
@@ -339,7 +232,9 @@ def test_upload_new_version_with_sources(base_url, session_auth):
     assert f"{base_url}/firefox/downloads/source/" in response["source"]
     url = response["source"]
     # compare the actual source file uploaded with the one returned by the API to make sure they match
-    response_source = requests.get(url, cookies={"sessionid": session_auth}, timeout=10)
+    response_source = amo_api.get(
+        url, cookies={"sessionid": session_auth}, timeout=10, stream=True
+    )
     api_helpers.compare_source_files(
         "sample-addons/listed-addon.zip", response_source, "POST"
     )
@@ -347,40 +242,38 @@ def test_upload_new_version_with_sources(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_change_sources(base_url, session_auth):
+def test_edit_version_change_sources(amo_api, session_auth):
     """Upload different source file for an existing version and make sure that changes were applied"""
     addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = amo_api.get_addon(addon, auth=session_auth)
     print("Request addon create: " + f"{request.json()}")
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
-    get_old_source = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_old_source = amo_api.get_version(addon, version, auth=session_auth)
     print("get old source request: " + f"{get_old_source.json()}")
     # download the previous source code attached to the version
-    previous_source = requests.get(
-        get_old_source.json()["source"], cookies={"sessionid": session_auth}, timeout=10
+    previous_source = amo_api.get(
+        get_old_source.json()["source"],
+        cookies={"sessionid": session_auth},
+        timeout=10,
+        stream=True,
     )
     with open("sample-addons/unlisted-addon.zip", "rb") as source:
-        change_source = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"source": source},
+        change_source = amo_api.edit_version(
+            addon, version, auth=session_auth, files={"source": source}
         )
 
-    print("previous source: " + f"{previous_source.json()}")
+    print("previous source: " + f"{previous_source.url}")
     print("change source: " + f"{change_source.json()}")
 
     # download the new source code attached to the  version
-    new_source = requests.get(
-        change_source.json()["source"], cookies={"sessionid": session_auth}, timeout=10
+    new_source = amo_api.get(
+        change_source.json()["source"],
+        cookies={"sessionid": session_auth},
+        timeout=10,
+        stream=True,
     )
-    print("new source: " + f"{new_source.json()}")
+    print("new source: " + f"{new_source.url}")
 
     # compare that the previous source and the new source do not match
     api_helpers.compare_source_files(previous_source, new_source, "PATCH")
@@ -402,20 +295,15 @@ def test_edit_version_change_sources(base_url, session_auth):
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_upload_supported_source_files(base_url, session_auth, file_type):
+def test_edit_version_upload_supported_source_files(amo_api, session_auth, file_type):
     """Upload all the supported source file types and make sure the request is successful"""
     addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = amo_api.get_addon(addon, auth=session_auth)
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     with open(f"sample-addons/{file_type}", "rb") as file:
-        upload_source = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"source": file},
+        upload_source = amo_api.edit_version(
+            addon, version, auth=session_auth, files={"source": file}
         )
     print(upload_source)
     assert (
@@ -424,7 +312,9 @@ def test_edit_version_upload_supported_source_files(base_url, session_auth, file
     # verify that the file upload was successful by comparing the uploaded file with the file returned by the API
     response = upload_source.json()
     url = response["source"]
-    response_source = requests.get(url, cookies={"sessionid": session_auth}, timeout=10)
+    response_source = amo_api.get(
+        url, cookies={"sessionid": session_auth}, timeout=10, stream=True
+    )
     api_helpers.compare_source_files(
         f"sample-addons/{file_type}", response_source, "post"
     )
@@ -433,21 +323,16 @@ def test_edit_version_upload_supported_source_files(base_url, session_auth, file
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
 def test_sources_cannot_be_changed_for_approved_versions(
-    base_url, session_auth, variables
+    amo_api, session_auth, variables
 ):
     """Addons that were Approved by a reviewer can't have their source files changed"""
     addon = variables["approved_addon_with_sources"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = amo_api.get_addon(addon, auth=session_auth)
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     with open("sample-addons/source-img.zip", "rb") as file:
-        upload_source = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"source": file},
+        upload_source = amo_api.edit_version(
+            addon, version, auth=session_auth, files={"source": file}
         )
     assert (
         upload_source.status_code == 400
@@ -479,24 +364,14 @@ def test_sources_cannot_be_changed_for_approved_versions(
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_invalid_license(base_url, session_auth, slug):
+def test_edit_version_invalid_license(amo_api, session_auth, slug):
     """Extension license slugs have to match one of the predefined licenses accepted by AMO"""
     addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = amo_api.get_addon(addon, auth=session_auth)
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = {**payloads.edit_version_details, "license": slug}
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_version = amo_api.edit_version(addon, version, payload, auth=session_auth)
     print(
         f'For license slug "{slug}": Response status is '
         f"{edit_version.status_code}; {edit_version.text}\n"
@@ -516,13 +391,10 @@ def test_edit_version_invalid_license(base_url, session_auth, slug):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_both_license_and_custom_license(base_url, session_auth):
+def test_edit_version_both_license_and_custom_license(amo_api, session_auth):
     """An addon can have either a predefined license or a custom license but not both"""
     addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = amo_api.get_addon(addon, auth=session_auth)
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     # add a custom license besides the 'license' we already have in the edit version payload
@@ -530,14 +402,7 @@ def test_edit_version_both_license_and_custom_license(base_url, session_auth):
         **payloads.edit_version_details,
         "custom_license": {"name": {"en-US": "custom-name"}},
     }
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_version = amo_api.edit_version(addon, version, payload, auth=session_auth)
     assert (
         edit_version.status_code == 400
     ), f"Actual status code was {edit_version.status_code}"
@@ -566,24 +431,14 @@ def test_edit_version_both_license_and_custom_license(base_url, session_auth):
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_invalid_custom_license_format(base_url, session_auth, value):
+def test_edit_version_invalid_custom_license_format(amo_api, session_auth, value):
     """Custom licenses should be a dictionary containing the license name and text; other formats should fail"""
     addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = amo_api.get_addon(addon, auth=session_auth)
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = {**payloads.custom_license, "custom_license": value}
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_version = amo_api.edit_version(addon, version, payload, auth=session_auth)
     print(
         f'For custom_license "{value}": Response status is '
         f"{edit_version.status_code}; {edit_version.text}\n"
@@ -615,29 +470,19 @@ def test_edit_version_invalid_custom_license_format(base_url, session_auth, valu
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
 def test_edit_version_invalid_custom_license_name_and_text(
-    base_url, session_auth, value
+    amo_api, session_auth, value
 ):
     """Custom licenses should be a dictionary containing the license name and text;
     also, the name and text need to be specified in a valid locale"""
     addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = amo_api.get_addon(addon, auth=session_auth)
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = {
         **payloads.custom_license,
         "custom_license": {"name": value, "text": value},
     }
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_version = amo_api.edit_version(addon, version, payload, auth=session_auth)
     print(
         f'For custom_license "{value}": Response status is '
         f"{edit_version.status_code}; {edit_version.text}\n"
@@ -674,24 +519,14 @@ def test_edit_version_invalid_custom_license_name_and_text(
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_invalid_compatibility_format(base_url, session_auth, value):
+def test_edit_version_invalid_compatibility_format(amo_api, session_auth, value):
     """The compatibility field needs to be either a dictionary or a list; other formats should fail"""
     addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = amo_api.get_addon(addon, auth=session_auth)
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = {**payloads.edit_version_details, "compatibility": value}
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_version = amo_api.edit_version(addon, version, payload, auth=session_auth)
     print(
         f'For compatibility "{value}": Response status is '
         f"{edit_version.status_code}; {edit_version.text}\n"
@@ -731,26 +566,16 @@ def test_edit_version_invalid_compatibility_format(base_url, session_auth, value
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
 def test_edit_version_valid_compatibility_values(
-    base_url, session_auth, request_value, response_value
+    amo_api, session_auth, request_value, response_value
 ):
     """Tests the compatibility field with a set of valid values"""
     addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = amo_api.get_addon(addon, auth=session_auth)
     print(request)
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = {**payloads.edit_version_details, "compatibility": request_value}
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_version = amo_api.edit_version(addon, version, payload, auth=session_auth)
     print(edit_version)
     print(
         f'For compatibility "{request_value}": Response status is '
@@ -785,25 +610,15 @@ def test_edit_version_valid_compatibility_values(
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_invalid_compatibility_values(base_url, session_auth, value):
+def test_edit_version_invalid_compatibility_values(amo_api, session_auth, value):
     """Compatibility values should be a combination of valid applications (firefox or android)
     and application versions (existing versions of Firefox for desktop/android)"""
     addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = amo_api.get_addon(addon, auth=session_auth)
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = {**payloads.edit_version_details, "compatibility": value}
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_version = amo_api.edit_version(addon, version, payload, auth=session_auth)
     print(
         f'For compatibility "{value}": Response status is '
         f"{edit_version.status_code}; {edit_version.text}\n"
@@ -828,59 +643,30 @@ def test_edit_version_invalid_compatibility_values(base_url, session_auth, value
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_disable_current_version(base_url, session_auth):
+def test_edit_version_disable_current_version(amo_api, session_auth):
     """Disable then re-enable the current version of an addon as a developer"""
     addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = amo_api.get_addon(addon, auth=session_auth)
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = {"is_disabled": True}
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_version = amo_api.edit_version(addon, version, payload, auth=session_auth)
     assert (
         edit_version.status_code == 200
     ), f"Actual response was: {edit_version.status_code}; {edit_version.text}"
     # verify that the version has been disabled successfully
-    version_status = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-    )
+    version_status = amo_api.get_version(addon, version, auth=session_auth)
     assert (
         version_status.json()["is_disabled"] is True
     ), f"Actual response was: {version_status.json()}"
     # re-enable the version
     payload = {"is_disabled": False}
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_version = amo_api.edit_version(addon, version, payload, auth=session_auth)
     assert (
         edit_version.status_code == 200
     ), f"Actual response was: {edit_version.status_code}; {edit_version.text}"
     # verify that the version has been re-enabled successfully
-    version_status = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-    )
+    version_status = amo_api.get_version(addon, version, auth=session_auth)
     assert (
         version_status.json()["is_disabled"] is False
     ), f"Actual response was: {version_status.json()}"
@@ -888,13 +674,10 @@ def test_edit_version_disable_current_version(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_delete_extension_non_existent_addon(base_url, session_auth):
+def test_delete_extension_non_existent_addon(amo_api, session_auth):
     """Try to obtain a delete token for a non-existent addon"""
     addon = "rand-om123"
-    get_delete_confirm = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/delete_confirm/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_delete_confirm = amo_api.delete_confirm(addon, auth=session_auth)
     assert (
         get_delete_confirm.status_code == 404
     ), f"Actual response: {get_delete_confirm.status_code}, {get_delete_confirm.text}"
@@ -902,13 +685,10 @@ def test_delete_extension_non_existent_addon(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_delete_extension_from_another_author(base_url, session_auth, variables):
+def test_delete_extension_from_another_author(amo_api, session_auth, variables):
     """Try to delete someone else's addon; the request should fail"""
     addon = variables["detail_extension_slug"]
-    get_delete_confirm = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/delete_confirm/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_delete_confirm = amo_api.delete_confirm(addon, auth=session_auth)
     assert (
         get_delete_confirm.status_code == 403
     ), f"Actual response: {get_delete_confirm.status_code}, {get_delete_confirm.text}"
@@ -935,14 +715,10 @@ def test_delete_extension_from_another_author(base_url, session_auth, variables)
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_delete_extension_with_invalid_tokens(base_url, session_auth, token):
+def test_delete_extension_with_invalid_tokens(amo_api, session_auth, token):
     """Use invalid formats or data types for the token required to delete an addon"""
     addon = payloads.edit_addon_details["slug"]
-    delete_addon = requests.delete(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={"Authorization": f"Session {session_auth}"},
-        params={"delete_confirm": token},
-    )
+    delete_addon = amo_api.delete_addon(addon, token, auth=session_auth)
     assert (
         delete_addon.status_code == 400
     ), f'For token "{token}", status code = {delete_addon.status_code}, message = {delete_addon.text}'
@@ -959,27 +735,17 @@ def test_delete_extension_with_invalid_tokens(base_url, session_auth, token):
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
 @pytest.mark.clear_session
-def test_delete_extension_valid_token(selenium, base_url, session_auth, variables):
+def test_delete_extension_valid_token(selenium, amo_api, session_auth, variables):
     addon = payloads.edit_addon_details["slug"]
-    get_delete_confirm = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/delete_confirm/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_delete_confirm = amo_api.delete_confirm(addon, auth=session_auth)
     get_delete_confirm.raise_for_status()
     r = get_delete_confirm.json()
     token = r["delete_confirm"]
-    delete_addon = requests.delete(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={"Authorization": f"Session {session_auth}"},
-        params={"delete_confirm": token},
-    )
+    delete_addon = amo_api.delete_addon(addon, token, auth=session_auth)
     assert (
         delete_addon.status_code == 204
     ), f"Actual status code was {delete_addon.status_code}"
-    get_addon = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_addon = amo_api.get_addon(addon, auth=session_auth)
     assert (
         get_addon.status_code == 404
     ), f"Actual status code was {get_addon.status_code}"
@@ -1,26 +1,14 @@
-import json
-
 import pytest
-import requests
 
 from api import payloads, api_helpers, responses
 
 
-# endpoints used in the post abuse report tests
-_post_abuse_report = "/api/v5/abuse/report/addon/"
-
 @pytest.mark.skip(reason="Skipped for the moment due to throttle in place, to be removed with next pr")
-def test_abuse_report_unauthenticated_post(base_url, selenium):
+def test_abuse_report_unauthenticated_post(amo_api, selenium):
     """Verifies that an unauthenticated user can successfully
     submit an abuse report and receive the correct response."""
     payload = payloads.abuse_report_full_body
-    create_abuse_report = requests.post(
-        url=f"{base_url}{_post_abuse_report}",
-        headers={
-            "Content-Type": "application/json"
-        },
-        data=json.dumps(payload)
-    )
+    create_abuse_report = amo_api.report_addon_abuse(payload)
     assert (
             create_abuse_report.status_code == 201
     ), f"Actual response: {create_abuse_report.status_code}, {create_abuse_report.text}"
@@ -31,18 +19,13 @@ def test_abuse_report_unauthenticated_post(base_url, selenium):
 
 
 @pytest.mark.login("api_user")
-def test_abuse_report_authenticated(base_url, selenium):
+def test_abuse_report_authenticated(amo_api, selenium):
     """Ensures that an authenticated user can submit an
     abuse report with the correct authorization and receive the correct response."""
     payload = payloads.abuse_report_full_body
     session_cookie = selenium.get_cookie("sessionid")
-    create_abuse_report = requests.post(
-        url=f"{base_url}{_post_abuse_report}",
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f'Session {session_cookie["value"]}'
-        },
-        data=json.dumps(payload)
+    create_abuse_report = amo_api.report_addon_abuse(
+        payload, auth=session_cookie["value"]
     )
     assert (
             create_abuse_report.status_code == 201
@@ -53,20 +36,13 @@ def test_abuse_report_authenticated(base_url, selenium):
     ), f"Actual response: {create_abuse_report.json()}"
 
 @pytest.mark.create_session("api_user")
-def test_abuse_report_minimal_details(base_url, selenium, session_auth):
+def test_abuse_report_minimal_details(amo_api, selenium, session_auth):
     """Tests the submission of an abuse report with minimal details and verifies the correct response."""
     payload = {
         "addon": "{446900e4-71c2-419f-a6a7-df9c091e268b}",
         "message": "test from the API,both"
     }
-    create_abuse_report = requests.post(
-        url=f"{base_url}{_post_abuse_report}",
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Session {session_auth}"
-        },
-        data=json.dumps(payload)
-    )
+    create_abuse_report = amo_api.report_addon_abuse(payload, auth=session_auth)
     assert (
             create_abuse_report.status_code == 201
     ), f"Actual response: {create_abuse_report.status_code}, {create_abuse_report.text}";
@@ -87,18 +63,13 @@ def test_abuse_report_minimal_details(base_url, selenium, session_auth):
     ]
 )
 @pytest.mark.create_session("api_user")
-def test_addon_install_method_parameter(base_url, selenium, session_auth, addon_install_method):
+def test_addon_install_method_parameter(
+    amo_api, selenium, session_auth, addon_install_method
+):
     """Validates the handling of accepted and
     unsupported values for the addon_install_method field in the abuse report."""
     payload = payloads.abuse_report_body(f"{addon_install_method}", "amo", "settings", "signed", "menu", "amo")
-    create_abuse_report = requests.post(
-        url=f"{base_url}{_post_abuse_report}",
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Session {session_auth}"
-        },
-        data=json.dumps(payload)
-    )
+    create_abuse_report = amo_api.report_addon_abuse(payload, auth=session_auth)
     if addon_install_method == "random_text":
         assert (
                 create_abuse_report.status_code == 201
@@ -127,17 +98,12 @@ def test_addon_install_method_parameter(base_url, selenium, session_auth, addon_
     ]
 )
 @pytest.mark.create_session("api_user")
-def test_addon_install_source_parameter(base_url, selenium, session_auth, addon_install_source):
+def test_addon_install_source_parameter(
+    amo_api, selenium, session_auth, addon_install_source
+):
     """Ensures that the addon_install_source field accepts valid values and rejects unsupported ones."""
     payload = payloads.abuse_report_body("link", f"{addon_install_source}", "settings", "signed", "menu", "amo")
-    create_abuse_report = requests.post(
-        url=f"{base_url}{_post_abuse_report}",
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Session {session_auth}"
-        },
-        data=json.dumps(payload)
-    )
+    create_abuse_report = amo_api.report_addon_abuse(payload, auth=session_auth)
     if addon_install_source == "random_text":
         assert (
                 create_abuse_report.status_code == 201
@@ -166,17 +132,10 @@ def test_addon_install_source_parameter(base_url, selenium, session_auth, addon_
     ]
 )
 @pytest.mark.create_session("api_user")
-def test_reason_parameter(base_url, selenium, session_auth, reason):
+def test_reason_parameter(amo_api, selenium, session_auth, reason):
     """Verifies the acceptance of valid reasons for abuse reports and rejection of invalid ones."""
     payload = payloads.abuse_report_body("link", "amo", f"{reason}", "signed", "menu", "amo")
-    create_abuse_report = requests.post(
-        url=f"{base_url}{_post_abuse_report}",
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Session {session_auth}"
-        },
-        data=json.dumps(payload)
-    )
+    create_abuse_report = amo_api.report_addon_abuse(payload, auth=session_auth)
     if reason == "random_text":
         assert (
                 create_abuse_report.status_code == 400
@@ -205,18 +164,11 @@ def test_reason_parameter(base_url, selenium, session_auth, reason):
     ]
 )
 @pytest.mark.create_session("api_user")
-def test_addon_signature_parameter(base_url, selenium, session_auth, addon_signature):
+def test_addon_signature_parameter(amo_api, selenium, session_auth, addon_signature):
     """Tests the handling of valid and invalid values for the addon_signature field in an abuse report."""
     payload = payloads.abuse_report_body("installtrigger", "about_preferences", "broken", f"{addon_signature}",
                                          "uninstall", "addon")
-    create_abuse_report = requests.post(
-        url=f"{base_url}{_post_abuse_report}",
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Session {session_auth}"
-        },
-        data=json.dumps(payload)
-    )
+    create_abuse_report = amo_api.report_addon_abuse(payload, auth=session_auth)
     if addon_signature == "random_text":
         assert (
                 create_abuse_report.status_code == 400
@@ -245,18 +197,13 @@ def test_addon_signature_parameter(base_url, selenium, session_auth, addon_signa
     ]
 )
 @pytest.mark.create_session("api_user")
-def test_report_entry_point_parameter(base_url, selenium, session_auth, report_entry_point):
+def test_report_entry_point_parameter(
+    amo_api, selenium, session_auth, report_entry_point
+):
     """Ensures the report_entry_point field accepts valid entries and rejects invalid ones."""
     payload = payloads.abuse_report_body("drag_and_drop", "app_profile", "policy", "preliminary",
                                          f"{report_entry_point}", "addon")
-    create_abuse_report = requests.post(
-        url=f"{base_url}{_post_abuse_report}",
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Session {session_auth}"
-        },
-        data=json.dumps(payload)
-    )
+    create_abuse_report = amo_api.report_addon_abuse(payload, auth=session_auth)
     if report_entry_point == "random_text":
         assert (
                 create_abuse_report.status_code == 400
@@ -285,17 +232,10 @@ def test_report_entry_point_parameter(base_url, selenium, session_auth, report_e
     ]
 )
 @pytest.mark.create_session("api_user")
-def test_location_parameter(base_url, selenium, session_auth, location):
+def test_location_parameter(amo_api, selenium, session_auth, location):
     """Validates the handling of accepted and unsupported values for the location field in an abuse report."""
     payload = payloads.abuse_report_body("link", "amo", "settings", "signed", "menu", f"{location}")
-    create_abuse_report = requests.post(
-        url=f"{base_url}{_post_abuse_report}",
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Session {session_auth}"
-        },
-        data=json.dumps(payload)
-    )
+    create_abuse_report = amo_api.report_addon_abuse(payload, auth=session_auth)
     if location == "random_text":
         assert (
                 create_abuse_report.status_code == 400
@@ -1,8 +1,6 @@
 import json
-import time
 
 import pytest
-import requests
 
 from api import payloads, api_helpers
 from pages.desktop.frontend.home import Home
@@ -22,15 +20,53 @@ _addon_create = "/api/v5/addons/addon/"
 # verify upload details: https://addons-server.readthedocs.io/en/latest/topics/api/addons.html#upload-detail
 # create an upload using PUT: https://addons-server.readthedocs.io/en/latest/topics/api/addons.html#put-create-or-edit
 
+# sample files that can't be used for a submission; they are uploaded together,
+# by the 'invalid_uploads' fixture, and each test checks the result of its own file;
+# "manifest.json" is not in 'sample-addons', the fixture writes it
+_unsupported_file_types = [
+    "7z-ext.7z",
+    "tgz-ext.tgz",
+    "tar-gz-ext.tar.gz",
+    "manifest.json",
+]
+_broken_archives = [
+    "tar-renamed-as-zip.zip",
+    "broken-archive.zip",
+]
+
+
+@pytest.fixture(scope="module")
+def invalid_upload_batch():
+    """The uploads of the 'invalid_uploads' fixture, kept for the whole module"""
+    return {}
+
+
+@pytest.fixture
+def invalid_uploads(amo_api, session_auth, invalid_upload_batch):
+    """Uploads all the unsupported and broken sample files in parallel, the first
+    time a test needs them, and waits until AMO has processed every one of them;
+    the tests using it log in as "api_user" with the `create_session` marker, so
+    `session_auth` logs the user in if no session is stored yet"""
+    if not invalid_upload_batch:
+        file_paths = {
+            file_type: f"sample-addons/{file_type}"
+            for file_type in _unsupported_file_types + _broken_archives
+        }
+        file_paths["manifest.json"] = api_helpers.make_manifest(
+            payloads.minimal_manifest
+        )
+        uploads = api_helpers.upload_batch(
+            amo_api, file_paths.values(), "unlisted", session_auth
+        )
+        invalid_upload_batch.update(
+            {file_type: uploads[path] for file_type, path in file_paths.items()}
+        )
+    return invalid_upload_batch
+
 
 @pytest.mark.serial
-def test_unauthenticated_addon_upload(base_url):
-    with open("sample-addons/unlisted-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            files={"upload": file},
-            data={"channel": "unlisted"},
-        )
+def test_unauthenticated_addon_upload(amo_api):
+    upload = amo_api.upload("sample-addons/unlisted-addon.zip", "unlisted")
     assert upload.status_code == 401, f"Actual status code was {upload.status_code}"
     assert (
         "Authentication credentials were not provided." in upload.text
@@ -38,18 +74,14 @@ def test_unauthenticated_addon_upload(base_url):
 
 
 @pytest.mark.serial
-def test_upload_addon_without_dev_agreement(base_url, selenium):
+def test_upload_addon_without_dev_agreement(base_url, amo_api, selenium):
     """Try to upload add-on with a user that hasn't accepted the dev agreements"""
     amo = Home(selenium, base_url).open().wait_for_page_to_load()
     amo.login("regular_user")
     session_cookie = selenium.get_cookie("sessionid")
-    with open("sample-addons/unlisted-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f'Session {session_cookie["value"]}'},
-            files={"upload": file},
-            data={"channel": "unlisted"},
-        )
+    upload = amo_api.upload(
+        "sample-addons/unlisted-addon.zip", "unlisted", auth=session_cookie["value"]
+    )
     assert upload.status_code == 403, f"Actual status code was {upload.status_code}"
     assert (
         "Please read and accept our Firefox Add-on Distribution Agreement as well as our Review Policies and Rules"
@@ -59,14 +91,12 @@ def test_upload_addon_without_dev_agreement(base_url, selenium):
 
 @pytest.mark.serial
 @pytest.mark.login("api_user")
-def test_bad_authentication_addon_upload(base_url,session_auth):
-    with open("sample-addons/unlisted-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session q7e50318gibhehbw1gl1k57ofckb4f94"},
-            files={"upload": file},
-            data={"channel": "unlisted"},
-        )
+def test_bad_authentication_addon_upload(base_url, amo_api,session_auth):
+    upload = amo_api.upload(
+        "sample-addons/unlisted-addon.zip",
+        "unlisted",
+        auth="q7e50318gibhehbw1gl1k57ofckb4f94",
+    )
     print(f"Session Token: {session_auth}")
     print(f"Uploading to: {base_url}{_upload}")
     assert upload.status_code == 401, f"Actual status code was {upload.status_code}"
@@ -78,30 +108,16 @@ def test_bad_authentication_addon_upload(base_url,session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_addon_crx_archive(base_url, session_auth):
+def test_upload_addon_crx_archive(base_url, amo_api, session_auth):
     """Use a .crx file to upload an addon and make sure the submission is successful"""
-    with open("sample-addons/crx_ext.crx", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "unlisted"},
-        )
+    upload = amo_api.upload("sample-addons/crx_ext.crx", "unlisted", auth=session_auth)
     print(f"Session Token: {session_auth}")
     print(f"Uploading to: {base_url}{_upload}")
-    time.sleep(5)
     upload.raise_for_status()
     uuid = upload.json()["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     payload = payloads.listed_addon_minimal(uuid)
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
-    time.sleep(5)
+    create_addon = amo_api.create_addon(payload, auth=session_auth)
     create_addon.raise_for_status()
     assert (
         create_addon.status_code == 201
@@ -110,12 +126,7 @@ def test_upload_addon_crx_archive(base_url, session_auth):
 
 @pytest.mark.parametrize(
     "file_type",
-    [
-        "7z-ext.7z",
-        "tgz-ext.tgz",
-        "tar-gz-ext.tar.gz",
-        "manifest.json",
-    ],
+    _unsupported_file_types,
     ids=[
         'Archive in "7z" format',
         'Archive in "tgz" format',
@@ -125,48 +136,27 @@ def test_upload_addon_crx_archive(base_url, session_auth):
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_addon_unsupported_file_types(base_url, session_auth, file_type):
+def test_upload_addon_unsupported_file_types(
+    amo_api, session_auth, invalid_uploads, file_type
+):
     """Try to upload unsupported archive types or files as extensions; AMO is supporting
     only three file types for addon uploads: .zip, .xpi, .crx"""
-    with open(f"sample-addons/{file_type}", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "unlisted"},
-        )
-    time.sleep(5)
-    upload.raise_for_status()
-    uuid = upload.json()["uuid"]
-    payload = payloads.listed_addon_minimal(uuid)
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    # the processed upload also holds the validation messages returned by the linter
+    upload_details = invalid_uploads[file_type].result()
+    payload = payloads.listed_addon_minimal(upload_details["uuid"])
+    create_addon = amo_api.create_addon(payload, auth=session_auth)
     assert (
         create_addon.status_code == 400
     ), f"Actual response: {create_addon.status_code}, {create_addon.text}"
-    # get the validation messages returned by the API
-    validation = requests.get(
-        url=f"{base_url}{_upload}{uuid}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
     assert (
         "Unsupported file type, please upload a supported file (.crx, .xpi, .zip)."
-        in validation.json()["validation"]["messages"][0]["message"]
-    ), f'Actual response for "{file_type}" was {validation.json()["validation"]}'
+        in upload_details["validation"]["messages"][0]["message"]
+    ), f'Actual response for "{file_type}" was {upload_details["validation"]}'
 
 
 @pytest.mark.parametrize(
     "file_type",
-    [
-        "tar-renamed-as-zip.zip",
-        "broken-archive.zip",
-    ],
+    _broken_archives,
     ids=[
         'A "tar" compression renamed as "zip"',
         "Corrupt archive",
@@ -174,53 +164,31 @@ def test_upload_addon_unsupported_file_types(base_url, session_auth, file_type):
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_addon_with_broken_archives(base_url, session_auth, file_type):
+def test_upload_addon_with_broken_archives(
+    amo_api, session_auth, invalid_uploads, file_type
+):
     """Try to upload an addon with a corrupt or invalid archive and check that the
     validation message identifies them as such; for example, a 'tar' compression
     renamed to look as a 'zip' file should be detected as invalid"""
-    with open(f"sample-addons/{file_type}", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "unlisted"},
-        )
-    time.sleep(5)
-    upload.raise_for_status()
-    uuid = upload.json()["uuid"]
-    payload = payloads.listed_addon_minimal(uuid)
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    # the processed upload also holds the validation messages returned by the linter
+    upload_details = invalid_uploads[file_type].result()
+    payload = payloads.listed_addon_minimal(upload_details["uuid"])
+    create_addon = amo_api.create_addon(payload, auth=session_auth)
     assert (
         create_addon.status_code == 400
     ), f"Actual response: {create_addon.status_code}, {create_addon.text}"
-    # get the validation messages returned by the API
-    validation = requests.get(
-        url=f"{base_url}{_upload}{uuid}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
     assert (
         "Invalid or corrupt add-on file."
-        in validation.json()["validation"]["messages"][0]["message"]
-    ), f'Actual response for "{file_type}" was {validation.json()["validation"]}'
+        in upload_details["validation"]["messages"][0]["message"]
+    ), f'Actual response for "{file_type}" was {upload_details["validation"]}'
 
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_unlisted_extension(base_url, session_auth):
-    with open("sample-addons/unlisted-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "unlisted"},
-        )
+def test_upload_unlisted_extension(amo_api, session_auth):
+    upload = amo_api.upload(
+        "sample-addons/unlisted-addon.zip", "unlisted", auth=session_auth
+    )
     upload.raise_for_status()
     resp = upload.json()
     # print the response for debugging purposes
@@ -229,29 +197,21 @@ def test_upload_unlisted_extension(base_url, session_auth):
     # get the addon uuid generated after upload
     uuid = resp["uuid"]
     data = {"version": {"upload": uuid}}
-    # sleep to allow the first request to be processed
-    time.sleep(5)
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(data),
-    )
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
+    create_addon = amo_api.create_addon(data, auth=session_auth)
     create_addon.raise_for_status()
     resp = create_addon.json()
     print(json.dumps(resp, indent=2))
     # verify the addon status ("incomplete" for unlisted)
     assert "incomplete" in resp["status"]
     # get the edit url for the add-on to verify that it was created and visible in devhub
-    r = requests.get(resp["edit_url"], cookies={"sessionid": session_auth}, timeout=10)
+    r = amo_api.get(resp["edit_url"], cookies={"sessionid": session_auth}, timeout=10)
     assert r.status_code == 200
 
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_submit_extension_with_invalid_uuid_format(base_url, session_auth):
+def test_submit_extension_with_invalid_uuid_format(amo_api, session_auth):
     """The UUID format doesn't match the expected format for the uuid value"""
     uuid = [
         "some-invalid-uuid",
@@ -261,14 +221,7 @@ def test_submit_extension_with_invalid_uuid_format(base_url, session_auth):
     ]
     for item in uuid:
         data = {"version": {"upload": item}}
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(data),
-        )
+        create_addon = amo_api.create_addon(data, auth=session_auth)
         # capture the response details to ease debugging
         print(
             f'For UUID "{item}": Response status is '
@@ -290,19 +243,12 @@ def test_submit_extension_with_invalid_uuid_format(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_submit_extension_with_incorrect_uuid(base_url, session_auth):
+def test_submit_extension_with_incorrect_uuid(amo_api, session_auth):
     """The UUID format is accepted but there is no valid upload found for the given uuid"""
     uuid = ["d4ce752a971b4a5aafcd175122726431", 12345]
     for item in uuid:
         data = {"version": {"upload": item}}
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(data),
-        )
+        create_addon = amo_api.create_addon(data, auth=session_auth)
         print(
             f'For UUID "{item}": Response status is '
             f"{create_addon.status_code}; {create_addon.text}\n"
@@ -325,34 +271,20 @@ def test_submit_extension_with_incorrect_uuid(base_url, session_auth):
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
 def test_submit_xpi_with_trademark_restricted_user(
-    base_url, session_auth, trademark_name
+    amo_api, session_auth, trademark_name
 ):
     """Upload an addon that includes the 'Firefox' or 'Mozilla' names;
     regular users are not allowed to submit such addons"""
     # create a minimal manifest with a trademark name
     manifest = {**payloads.minimal_manifest, "name": trademark_name}
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+    addon_file = api_helpers.make_addon(manifest)
+    upload = amo_api.upload(addon_file, "listed", auth=session_auth)
     upload.raise_for_status()
     resp = upload.json()
-    # sleep to allow the upload  request to be processed
-    time.sleep(5)
     uuid = resp["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     payload = payloads.listed_addon_minimal(uuid)
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = amo_api.create_addon(payload, auth=session_auth)
     assert (
         create_addon.status_code == 400
     ), f"Actual status code was {create_addon.status_code}"
@@ -380,36 +312,22 @@ def test_submit_xpi_with_trademark_restricted_user(
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_submit_addon_with_reserved_guid(base_url, session_auth, guid):
+def test_submit_addon_with_reserved_guid(amo_api, session_auth, guid):
     """Upload an addon that has a reserved guid suffix, unavailable for regular users"""
     manifest = {
         **payloads.minimal_manifest,
         "name": "Reserved guid",
         "browser_specific_settings": {"gecko": {"id": guid}},
     }
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+    addon_file = api_helpers.make_addon(manifest)
+    upload = amo_api.upload(addon_file, "listed", auth=session_auth)
     upload.raise_for_status()
-    # sleep to allow the upload  request to be processed
-    time.sleep(5)
     resp = upload.json()
     print(resp)
     uuid = resp["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     payload = payloads.listed_addon_minimal(uuid)
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = amo_api.create_addon(payload, auth=session_auth)
     assert (
         create_addon.status_code == 400
     ), f'For guid "{guid}": response status was {create_addon.status_code}, {create_addon.text}'
@@ -421,7 +339,7 @@ def test_submit_addon_with_reserved_guid(base_url, session_auth, guid):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_extension_with_duplicate_guid(base_url, session_auth, variables):
+def test_upload_extension_with_duplicate_guid(amo_api, session_auth, variables):
     """Addon guids are unique and cannot be re-used for new addon submissions"""
     guid = variables["duplicate_guid"]
     # make an add-on with an already existing guid
@@ -430,28 +348,14 @@ def test_upload_extension_with_duplicate_guid(base_url, session_auth, variables)
         "name": "Duplicate guid",
         "browser_specific_settings": {"gecko": {"id": guid}},
     }
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+    addon_file = api_helpers.make_addon(manifest)
+    upload = amo_api.upload(addon_file, "listed", auth=session_auth)
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(5)
     resp = upload.json()
     uuid = resp["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     payload = payloads.listed_addon_minimal(uuid)
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = amo_api.create_addon(payload, auth=session_auth)
     assert (
         create_addon.status_code == 409
     ), f"Actual status code was {create_addon.status_code}"
@@ -462,32 +366,20 @@ def test_upload_extension_with_duplicate_guid(base_url, session_auth, variables)
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_extension_without_name_in_manifest(base_url, session_auth):
+def test_upload_extension_without_name_in_manifest(amo_api, session_auth):
     """The 'name' key is mandatory for successful submissions; uploading an
     addon with a manifest that misses a 'name' key should fail"""
     # create a manifest that doesn't include the mandatory 'name' key
     manifest = {**payloads.minimal_manifest}
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+    addon_file = api_helpers.make_addon(manifest)
+    upload = amo_api.upload(addon_file, "listed", auth=session_auth)
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(5)
     resp = upload.json()
     print(resp)
     uuid = resp["uuid"]
     # we need to inspect the validation results returned by the linter
     # to check if the 'name' field has produced a validation error
-    get_upload_details = requests.get(
-        url=f"{base_url}{_upload}{uuid}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
-    error = get_upload_details.json()
+    error = api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     # pull the validation messages and check the 'name' field error
     assert (
         "must have required property 'name'"
@@ -495,14 +387,7 @@ def test_upload_extension_without_name_in_manifest(base_url, session_auth):
     )
     payload = payloads.listed_addon_minimal(uuid)
     # try to upload the add-on without a name anyway; it should fail
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = amo_api.create_addon(payload, auth=session_auth)
     assert (
         create_addon.status_code == 400
     ), f"Actual status code was {create_addon.status_code}"
@@ -510,35 +395,21 @@ def test_upload_extension_without_name_in_manifest(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_extension_without_summary(base_url, session_auth):
+def test_upload_extension_without_summary(amo_api, session_auth):
     """An addon summary is mandatory for successful submissions; uploading an addon without a
     'description' key and no 'summary' included in the JSON payload should fail"""
     # create a minimal manifest, without adding a 'description' field
     manifest = {**payloads.minimal_manifest, "name": "Addon without Summary"}
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+    addon_file = api_helpers.make_addon(manifest)
+    upload = amo_api.upload(addon_file, "listed", auth=session_auth)
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(5)
     resp = upload.json()
     print(resp)
     uuid = resp["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     payload = payloads.listed_addon_minimal(uuid)
     # try to upload the addon without a summary anyway; it should fail
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = amo_api.create_addon(payload, auth=session_auth)
     assert (
         create_addon.status_code == 400
     ), f"Actual status code was {create_addon.status_code}"
@@ -550,7 +421,7 @@ def test_upload_extension_without_summary(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_extension_with_incorrect_version_number(base_url, session_auth):
+def test_upload_extension_with_incorrect_version_number(amo_api, session_auth):
     """The addon version number is defined in the manifest and needs to follow some naming rules"""
     # create a minimal manifest, with an invalid 'version'
     manifest = {
@@ -558,26 +429,14 @@ def test_upload_extension_with_incorrect_version_number(base_url, session_auth):
         "name": "Addon with invalid version",
         "version": "1abc.1.1a#c",
     }
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+    addon_file = api_helpers.make_addon(manifest)
+    upload = amo_api.upload(addon_file, "listed", auth=session_auth)
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(5)
     resp = upload.json()
     uuid = resp["uuid"]
     # we need to inspect the validation results returned by the linter
     # to check if the 'version' field has produced a validation error
-    get_upload_details = requests.get(
-        url=f"{base_url}{_upload}{uuid}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
-    error = get_upload_details.json()
+    error = api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     # check the upload validation results for 'version' field errors
     assert (
         "The version string should be simplified."
@@ -585,14 +444,7 @@ def test_upload_extension_with_incorrect_version_number(base_url, session_auth):
     )
     payload = payloads.listed_addon_minimal(uuid)
     # try to upload the add-on with the invalid version; it should fail
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = amo_api.create_addon(payload, auth=session_auth)
     assert (
         create_addon.status_code == 400
     ), f"Actual status code was {create_addon.status_code}"
@@ -600,7 +452,7 @@ def test_upload_extension_with_incorrect_version_number(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_extension_with_put_method(base_url, session_auth):
+def test_upload_extension_with_put_method(amo_api, session_auth):
     """Use the PUT method to create a new addon; unlike POST,
     PUT requires the addon guid to be specified in the request"""
     guid = f"random-guid@{reusables.get_random_string(6)}"
@@ -613,32 +465,18 @@ def test_upload_extension_with_put_method(base_url, session_auth):
         "name": name,
         "browser_specific_settings": {"gecko": {"id": guid}},
     }
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+    addon_file = api_helpers.make_addon(manifest)
+    upload = amo_api.upload(addon_file, "listed", auth=session_auth)
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(5)
     resp = upload.json()
     print(resp)
     uuid = resp["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     payload = {
         **payloads.listed_addon_minimal(uuid),
         "summary": {"en-US": "Addon summary"},
     }
-    create_addon = requests.put(
-        url=f"{base_url}{_addon_create}{guid}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = amo_api.put_addon(guid, payload, auth=session_auth)
     response = create_addon.json()
     print(json.dumps(response, indent=2))
     # check that the addon was created with the guid set
@@ -647,7 +485,7 @@ def test_upload_extension_with_put_method(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_extension_with_put_guid_mismatch(base_url, session_auth):
+def test_upload_extension_with_put_guid_mismatch(amo_api, session_auth):
     """The PUT method requires the same guid to be specified in the manifest and in the request url;
     this test verifies that the submission fails if there is a guid mismatch between the two
     """
@@ -658,29 +496,15 @@ def test_upload_extension_with_put_guid_mismatch(base_url, session_auth):
         "name": "PUT-guid-mismatch",
         "browser_specific_settings": {"gecko": {"id": guid}},
     }
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+    addon_file = api_helpers.make_addon(manifest)
+    upload = amo_api.upload(addon_file, "listed", auth=session_auth)
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(5)
     resp = upload.json()
     print(resp)
     uuid = resp["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     payload = payloads.listed_addon_minimal(uuid)
-    create_addon = requests.put(
-        url=f"{base_url}{_addon_create}mismatch-guid@foobar/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = amo_api.put_addon("mismatch-guid@foobar", payload, auth=session_auth)
     assert (
         create_addon.status_code == 400
     ), f"Actual status code was {create_addon.status_code}"
@@ -691,30 +515,20 @@ def test_upload_extension_with_put_guid_mismatch(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_extension_with_put_no_guid_in_manifest(base_url, session_auth):
+def test_upload_extension_with_put_no_guid_in_manifest(amo_api, session_auth):
     """The PUT method requires a guid to be specified in the manifest;
     if no guid is specified, the request should fail"""
-    with open("sample-addons/listed-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+    upload = amo_api.upload(
+        "sample-addons/listed-addon.zip", "listed", auth=session_auth
+    )
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(5)
     resp = upload.json()
     print(resp)
     uuid = resp["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     payload = payloads.listed_addon_minimal(uuid)
-    create_addon = requests.put(
-        url=f"{base_url}{_addon_create}manifest-no-guid@foobar/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
+    create_addon = amo_api.put_addon(
+        "manifest-no-guid@foobar", payload, auth=session_auth
     )
     assert (
         create_addon.status_code == 400
@@ -726,7 +540,7 @@ def test_upload_extension_with_put_no_guid_in_manifest(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_extension_with_put_no_guid_in_request(base_url, session_auth):
+def test_upload_extension_with_put_no_guid_in_request(amo_api, session_auth):
     """The PUT method requires a guid to be specified in the request;
     if no guid is specified in the url, the request should fail"""
     guid = f"random-guid@{reusables.get_random_string(6)}"
@@ -736,28 +550,14 @@ def test_upload_extension_with_put_no_guid_in_request(base_url, session_auth):
         "name": "PUT-no-guid-in-request-url",
         "browser_specific_settings": {"gecko": {"id": guid}},
     }
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+    addon_file = api_helpers.make_addon(manifest)
+    upload = amo_api.upload(addon_file, "listed", auth=session_auth)
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(5)
     resp = upload.json()
     uuid = resp["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     payload = payloads.listed_addon_minimal(uuid)
-    create_addon = requests.put(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = amo_api.put(_addon_create, auth=session_auth, json=payload)
     # the request sent is valid with a POST request; with PUT is not accepted
     assert (
         create_addon.status_code == 405
@@ -769,7 +569,7 @@ def test_upload_extension_with_put_no_guid_in_request(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_extension_with_put_invalid_guid_format(base_url, session_auth):
+def test_upload_extension_with_put_invalid_guid_format(amo_api, session_auth):
     """Uploading an addon with an invalid guid format should fail the PUT request"""
     guid = f"invalid-{reusables.get_random_string(6)}"  # creates an invalid guid
     manifest = {
@@ -777,40 +577,21 @@ def test_upload_extension_with_put_invalid_guid_format(base_url, session_auth):
         "name": "Invalid guid format",
         "browser_specific_settings": {"gecko": {"id": guid}},
     }
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+    addon_file = api_helpers.make_addon(manifest)
+    upload = amo_api.upload(addon_file, "listed", auth=session_auth)
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(5)
     resp = upload.json()
     print(resp)
     uuid = resp["uuid"]
     # check that the upload validation results point at a faulty guid
-    get_upload_details = requests.get(
-        url=f"{base_url}{_upload}{uuid}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
-    error = get_upload_details.json()
+    error = api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     assert (
         "/browser_specific_settings/gecko/id"
         in error["validation"]["messages"][0]["instancePath"]
     )
     # try to submit the addon with an invalid guid anyway; it should fail
     payload = payloads.listed_addon_minimal(uuid)
-    create_addon = requests.put(
-        url=f"{base_url}{_addon_create}{guid}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = amo_api.put_addon(guid, payload, auth=session_auth)
     assert (
         create_addon.status_code == 404
     ), f"Actual status code was {create_addon.status_code}"
@@ -818,22 +599,17 @@ def test_upload_extension_with_put_invalid_guid_format(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_extension_default_locale_has_no_translations(base_url, session_auth):
+def test_upload_extension_default_locale_has_no_translations(amo_api, session_auth):
     """Try to upload an addon while setting a 'default_locale' for which there are no
     available translations in the mandatory fields, i.e. 'name' and 'summary'"""
-    with open("sample-addons/localizations.xpi", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-    # sleep to allow the first request to be processed
-    time.sleep(5)
+    upload = amo_api.upload(
+        "sample-addons/localizations.xpi", "listed", auth=session_auth
+    )
     upload.raise_for_status()
     resp = upload.json()
     # get the addon uuid generated after upload
     uuid = resp["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     slug = reusables.get_random_string(10)
     # set a default locale that doesn't have any translations in the xpi or the request JSON
     payload = {
@@ -841,14 +617,7 @@ def test_upload_extension_default_locale_has_no_translations(base_url, session_a
         "slug": slug,
         "default_locale": "ja",
     }
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = amo_api.create_addon(payload, auth=session_auth)
     assert (
         create_addon.status_code == 400
     ), f"Actual status code was {create_addon.status_code}"
@@ -862,33 +631,21 @@ def test_upload_extension_default_locale_has_no_translations(base_url, session_a
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_extension_with_localizations_in_xpi(base_url, session_auth, variables):
+def test_upload_extension_with_localizations_in_xpi(amo_api, session_auth, variables):
     """Addon translations set in a 'locales' file in the .xpi should be reflected
     in the API response returned after the addon is successfully created"""
-    with open("sample-addons/localizations.xpi", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-    # sleep to allow the first request to be processed
-    time.sleep(5)
+    upload = amo_api.upload(
+        "sample-addons/localizations.xpi", "listed", auth=session_auth
+    )
     resp = upload.json()
     upload.raise_for_status()
     # get the addon uuid generated after upload
     uuid = resp["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     # set a unique addon slug to make sure we don't run into duplicates
     slug = reusables.get_random_string(10)
     payload = {**payloads.listed_addon_minimal(uuid), "slug": slug}
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = amo_api.create_addon(payload, auth=session_auth)
     create_addon.raise_for_status()
     response = create_addon.json()
     # verify that the translations from the xpi are reflected in the api response
@@ -899,23 +656,18 @@ def test_upload_extension_with_localizations_in_xpi(base_url, session_auth, vari
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_localized_extension_json_overwrite(base_url, session_auth):
+def test_upload_localized_extension_json_overwrite(amo_api, session_auth):
     """If an addon with a 'locales' file defined in the .xpi sets different translations
     in the request JSON object, the JSON values should override the locales file from the .xpi
     """
-    with open("sample-addons/localizations.xpi", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-    # sleep to allow the first request to be processed
-    time.sleep(5)
+    upload = amo_api.upload(
+        "sample-addons/localizations.xpi", "listed", auth=session_auth
+    )
     upload.raise_for_status()
     resp = upload.json()
     # get the addon uuid generated after upload
     uuid = resp["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     # set a unique addon slug to make sure we don't run into duplicates
     slug = reusables.get_random_string(10)
     payload = {
@@ -923,14 +675,7 @@ def test_upload_localized_extension_json_overwrite(base_url, session_auth):
         "slug": slug,
         "default_locale": "en-US",
     }
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = amo_api.create_addon(payload, auth=session_auth)
     create_addon.raise_for_status()
     response = create_addon.json()
     # verify that xpi translations have been overwritten by the JSON payload translations
@@ -941,7 +686,7 @@ def test_upload_localized_extension_json_overwrite(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_addon_with_guid_from_deleted_addon(base_url, session_auth):
+def test_upload_addon_with_guid_from_deleted_addon(amo_api, session_auth):
     """Create an addon, delete it and then try to reuse the GUID to submit a
     new addon; the request should fail since GUIDs cannot be reused"""
     guid = f"reused-guid@{reusables.get_random_string(6)}"
@@ -951,66 +696,35 @@ def test_upload_addon_with_guid_from_deleted_addon(base_url, session_auth):
         "name": "Reuse GUID of deleted addon",
         "browser_specific_settings": {"gecko": {"id": guid}},
     }
-    api_helpers.make_addon(manifest)
+    addon_file = api_helpers.make_addon(manifest)
     # upload the addon with the custom GUID for the first time
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "unlisted"},
-        )
-    time.sleep(5)
+    upload = amo_api.upload(
+        addon_file, "unlisted", auth=session_auth
+    )
     upload.raise_for_status()
     uuid = upload.json()["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     payload = payloads.listed_addon_minimal(uuid)
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = amo_api.create_addon(payload, auth=session_auth)
     assert (
         create_addon.status_code == 200,
         f"Upload response: status code = {create_addon.status_code}; message: {create_addon.text}",
     )
     # get the token that would allow the actual delete request to be sent
-    get_delete_confirm = requests.get(
-        url=f"{base_url}{_addon_create}{guid}/delete_confirm/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_delete_confirm = amo_api.delete_confirm(guid, auth=session_auth)
     token = get_delete_confirm.json()["delete_confirm"]
     # delete the addon and verify that the delete request was successful
-    delete_addon = requests.delete(
-        url=f"{base_url}{_addon_create}{guid}/",
-        headers={"Authorization": f"Session {session_auth}"},
-        params={"delete_confirm": token},
-    )
+    delete_addon = amo_api.delete_addon(guid, token, auth=session_auth)
     assert (
         delete_addon.status_code == 204
     ), f"Actual response: {delete_addon.status_code}, {delete_addon.text}"
     # upload the addon using the same custom GUID for the second time
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-    time.sleep(5)
+    upload = amo_api.upload(addon_file, "listed", auth=session_auth)
     upload.raise_for_status()
     uuid = upload.json()["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     payload = payloads.listed_addon_minimal(uuid)
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = amo_api.create_addon(payload, auth=session_auth)
     # verify that the submission fails because it uses a duplicate GUID
     assert (
         create_addon.status_code == 409
@@ -1022,107 +736,70 @@ def test_upload_addon_with_guid_from_deleted_addon(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_theme(base_url, session_auth):
-    with open("sample-addons/theme.xpi", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-        time.sleep(5)
-        assert (
-            upload.status_code == 200,
-            f"Upload response: status code = {upload.status_code}; message: {upload.text}",
-        )
-        # get the addon uuid generated after upload
-        uuid = upload.json()["uuid"]
-        # set a license type specific for themes
-        theme_license = "CC-BY-3.0"
-        payload = {
-            **payloads.theme_details(uuid, theme_license),
-            "slug": f"theme-{reusables.get_random_string(10)}",
-        }
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
-        assert (
-            create_addon.status_code == 200,
-            f"Upload response: status code = {create_addon.status_code}; message: {create_addon.text}",
-        )
-        # verify that the addon has been submitted as a theme by checking the 'type' property
-        assert create_addon.json()["type"] == "statictheme"
+def test_upload_theme(amo_api, session_auth):
+    upload = amo_api.upload("sample-addons/theme.xpi", "listed", auth=session_auth)
+    assert (
+        upload.status_code == 200,
+        f"Upload response: status code = {upload.status_code}; message: {upload.text}",
+    )
+    # get the addon uuid generated after upload
+    uuid = upload.json()["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
+    # set a license type specific for themes
+    theme_license = "CC-BY-3.0"
+    payload = {
+        **payloads.theme_details(uuid, theme_license),
+        "slug": f"theme-{reusables.get_random_string(10)}",
+    }
+    create_addon = amo_api.create_addon(payload, auth=session_auth)
+    assert (
+        create_addon.status_code == 200,
+        f"Upload response: status code = {create_addon.status_code}; message: {create_addon.text}",
+    )
+    # verify that the addon has been submitted as a theme by checking the 'type' property
+    assert create_addon.json()["type"] == "statictheme"
 
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_theme_with_wrong_license(base_url, session_auth):
+def test_upload_theme_with_wrong_license(amo_api, session_auth):
     """Try to upload a theme while using a license that is specific for extensions"""
-    with open("sample-addons/theme.xpi", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-        time.sleep(5)
-        upload.raise_for_status()
-        # get the addon uuid generated after upload
-        uuid = upload.json()["uuid"]
-        # set a license slug that is allowed only for extension submissions
-        ext_license = "MPL-2.0"
-        payload = {
-            **payloads.theme_details(uuid, ext_license),
-            "slug": f"theme-{reusables.get_random_string(10)}",
-        }
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
-        assert (
-            create_addon.status_code == 400
-        ), f"Actual response: {create_addon.status_code}, {create_addon.text}"
-        assert (
-            "Wrong add-on type for this license." in create_addon.text
-        ), f"Actual response was {create_addon.text}"
+    upload = amo_api.upload("sample-addons/theme.xpi", "listed", auth=session_auth)
+    upload.raise_for_status()
+    # get the addon uuid generated after upload
+    uuid = upload.json()["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
+    # set a license slug that is allowed only for extension submissions
+    ext_license = "MPL-2.0"
+    payload = {
+        **payloads.theme_details(uuid, ext_license),
+        "slug": f"theme-{reusables.get_random_string(10)}",
+    }
+    create_addon = amo_api.create_addon(payload, auth=session_auth)
+    assert (
+        create_addon.status_code == 400
+    ), f"Actual response: {create_addon.status_code}, {create_addon.text}"
+    assert (
+        "Wrong add-on type for this license." in create_addon.text
+    ), f"Actual response was {create_addon.text}"
 
 
 @pytest.mark.serial
-def test_upload_language_pack_unauthorized_user(selenium, base_url):
+def test_upload_language_pack_unauthorized_user(selenium, base_url, amo_api):
     """Users not part of the language pack submission group are not allowed to submit langpacks"""
     # get the sessionid for a regular user
     page = Home(selenium, base_url).open().wait_for_page_to_load()
     page.login("developer")
     session_auth = selenium.get_cookie("sessionid")
-    with open("sample-addons/lang-pack.xpi", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f'Session {session_auth["value"]}'},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-    time.sleep(5)
+    upload = amo_api.upload(
+        "sample-addons/lang-pack.xpi", "listed", auth=session_auth["value"]
+    )
     upload.raise_for_status()
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth["value"])
     payload = payloads.lang_tool_details(uuid)
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f'Session {session_auth["value"]}',
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = amo_api.create_addon(payload, auth=session_auth["value"])
     assert (
         create_addon.status_code == 400
     ), f"Actual response: {create_addon.status_code}, {create_addon.text}"
@@ -1133,28 +810,15 @@ def test_upload_language_pack_unauthorized_user(selenium, base_url):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_language_pack_with_authorized_user(base_url, session_auth):
+def test_upload_language_pack_with_authorized_user(amo_api, session_auth):
     """Upload a langpack with a user that belongs to the language pack submissions group"""
-    with open("sample-addons/lang-pack.xpi", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-    time.sleep(5)
+    upload = amo_api.upload("sample-addons/lang-pack.xpi", "listed", auth=session_auth)
     upload.raise_for_status()
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     payload = payloads.lang_tool_details(uuid)
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = amo_api.create_addon(payload, auth=session_auth)
     assert (
         create_addon.status_code == 201
     ), f"Actual response: {create_addon.status_code}, {create_addon.text}"
@@ -1165,31 +829,18 @@ def test_upload_language_pack_with_authorized_user(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_language_pack_incorrect_category(base_url, session_auth):
+def test_upload_language_pack_incorrect_category(amo_api, session_auth):
     """Language packs only accept 'general' as a category value; other values should fail"""
-    with open("sample-addons/lang-pack.xpi", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-    time.sleep(5)
+    upload = amo_api.upload("sample-addons/lang-pack.xpi", "listed", auth=session_auth)
     upload.raise_for_status()
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
     payload = {
         **payloads.lang_tool_details(uuid),
         "categories": {"firefox": ["bookmarks"]},
     }
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = amo_api.create_addon(payload, auth=session_auth)
     assert (
         create_addon.status_code == 400
     ), f"Actual response: {create_addon.status_code}, {create_addon.text}"
@@ -1200,74 +851,52 @@ def test_upload_language_pack_incorrect_category(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_privileged_addon_with_unauthorized_account(base_url, session_auth):
+def test_upload_privileged_addon_with_unauthorized_account(amo_api, session_auth):
     """Upload an addon signed with a mozilla signature using an unauthorized account"""
-    with open("sample-addons/mozilla-signed.xpi", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "unlisted"},
-        )
-        time.sleep(5)
-        upload.raise_for_status()
-        # get the addon uuid generated after upload
-        uuid = upload.json()["uuid"]
-        payload = {**payloads.listed_addon_minimal(uuid)}
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
-        assert (
-            create_addon.status_code == 400
-        ), f"Actual response: {create_addon.status_code}, {create_addon.text}"
-        assert "You cannot submit a Mozilla Signed Extension" in create_addon.text
+    upload = amo_api.upload(
+        "sample-addons/mozilla-signed.xpi", "unlisted", auth=session_auth
+    )
+    upload.raise_for_status()
+    # get the addon uuid generated after upload
+    uuid = upload.json()["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
+    payload = {**payloads.listed_addon_minimal(uuid)}
+    create_addon = amo_api.create_addon(payload, auth=session_auth)
+    assert (
+        create_addon.status_code == 400
+    ), f"Actual response: {create_addon.status_code}, {create_addon.text}"
+    assert "You cannot submit a Mozilla Signed Extension" in create_addon.text
 
 
 @pytest.mark.serial
 @pytest.mark.login("staff_user")
-def test_upload_privileged_addon_with_authorized_account(selenium, base_url):
+def test_upload_privileged_addon_with_authorized_account(selenium, amo_api):
     """Upload an addon signed with a mozilla signature using an account holding the right permissions"""
     session_auth = selenium.get_cookie("sessionid")
-    with open("sample-addons/mozilla-signed.xpi", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f'Session {session_auth["value"]}'},
-            files={"upload": file},
-            data={"channel": "unlisted"},
-        )
-        time.sleep(5)
-        upload.raise_for_status()
-        # get the addon uuid generated after upload
-        uuid = upload.json()["uuid"]
-        payload = {**payloads.listed_addon_minimal(uuid)}
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f'Session {session_auth["value"]}',
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
-        assert (
-            create_addon.status_code == 201
-        ), f"Actual response: {create_addon.status_code}, {create_addon.text}"
-        # check that the addon was created as a mozilla signed addon
-        assert (
-            create_addon.json()["latest_unlisted_version"]["file"][
-                "is_mozilla_signed_extension"
-            ]
-            is True
-        )
+    upload = amo_api.upload(
+        "sample-addons/mozilla-signed.xpi", "unlisted", auth=session_auth["value"]
+    )
+    upload.raise_for_status()
+    # get the addon uuid generated after upload
+    uuid = upload.json()["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth["value"])
+    payload = {**payloads.listed_addon_minimal(uuid)}
+    create_addon = amo_api.create_addon(payload, auth=session_auth["value"])
+    assert (
+        create_addon.status_code == 201
+    ), f"Actual response: {create_addon.status_code}, {create_addon.text}"
+    # check that the addon was created as a mozilla signed addon
+    assert (
+        create_addon.json()["latest_unlisted_version"]["file"][
+            "is_mozilla_signed_extension"
+        ]
+        is True
+    )
 
 
 @pytest.mark.serial
 @pytest.mark.create_session("staff_user")
-def test_upload_addon_with_reserved_guid_authorized_account(base_url, session_auth):
+def test_upload_addon_with_reserved_guid_authorized_account(amo_api, session_auth):
     """Upload an addon with a reserved guid using an account that holds the right permissions"""
     # create a restricted GUID
     guid = f"{reusables.get_random_string(10)}@mozilla.org"
@@ -1276,38 +905,25 @@ def test_upload_addon_with_reserved_guid_authorized_account(base_url, session_au
         "name": "Reserved guid",
         "browser_specific_settings": {"gecko": {"id": guid}},
     }
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "unlisted"},
-        )
-        time.sleep(5)
-        upload.raise_for_status()
-        # get the addon uuid generated after upload
-        uuid = upload.json()["uuid"]
-        payload = {**payloads.listed_addon_minimal(uuid)}
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
-        assert (
-            create_addon.status_code == 201
-        ), f"Actual response: {create_addon.status_code}, {create_addon.text}"
-        # check that the addon was created with the guid set
-        assert create_addon.json()["guid"] == guid
+    addon_file = api_helpers.make_addon(manifest)
+    upload = amo_api.upload(addon_file, "unlisted", auth=session_auth)
+    upload.raise_for_status()
+    # get the addon uuid generated after upload
+    uuid = upload.json()["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
+    payload = {**payloads.listed_addon_minimal(uuid)}
+    create_addon = amo_api.create_addon(payload, auth=session_auth)
+    assert (
+        create_addon.status_code == 201
+    ), f"Actual response: {create_addon.status_code}, {create_addon.text}"
+    # check that the addon was created with the guid set
+    assert create_addon.json()["guid"] == guid
 
 
 @pytest.mark.serial
 @pytest.mark.create_session("staff_user")
 def test_upload_addon_with_trademark_name_authorized_account(
-    selenium, base_url, session_auth
+    selenium, amo_api, session_auth
 ):
     """Upload an addon that includes the 'Firefox' trademark name with a user that holds the right permissions"""
     # create an addon with a trademark name
@@ -1316,49 +932,31 @@ def test_upload_addon_with_trademark_name_authorized_account(
         **payloads.minimal_manifest,
         "name": addon_name,
     }
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "unlisted"},
-        )
-        time.sleep(5)
-        upload.raise_for_status()
-        uuid = upload.json()["uuid"]
-        payload = payloads.listed_addon_minimal(uuid)
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
-        # verify that the addon was created successfully
-        assert (
-            create_addon.status_code == 201
-        ), f"Actual response: {create_addon.status_code}, {create_addon.text}"
-        assert addon_name == create_addon.json()["name"]["en-US"]
+    addon_file = api_helpers.make_addon(manifest)
+    upload = amo_api.upload(addon_file, "unlisted", auth=session_auth)
+    upload.raise_for_status()
+    uuid = upload.json()["uuid"]
+    api_helpers.wait_for_upload_processed(amo_api, uuid, session_auth)
+    payload = payloads.listed_addon_minimal(uuid)
+    create_addon = amo_api.create_addon(payload, auth=session_auth)
+    # verify that the addon was created successfully
+    assert (
+        create_addon.status_code == 201
+    ), f"Actual response: {create_addon.status_code}, {create_addon.text}"
+    assert addon_name == create_addon.json()["name"]["en-US"]
 
 
 @pytest.mark.serial
 @pytest.mark.skip(reason= "skip, need to update the user")
-def test_upload_addon_restricted_user(selenium, base_url):
+def test_upload_addon_restricted_user(selenium, base_url, amo_api):
     """Try to upload an addon with a user that is on the restricted list for addon submissions"""
     # get the sessionid for a regular user
     page = Home(selenium, base_url).open().wait_for_page_to_load()
     page.login("restricted_user")
     session_auth = selenium.get_cookie("sessionid")
-    with open("sample-addons/listed-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f'Session {session_auth["value"]}'},
-            files={"upload": file},
-            data={"channel": "unlisted"},
-        )
-    time.sleep(5)
+    upload = amo_api.upload(
+        "sample-addons/listed-addon.zip", "unlisted", auth=session_auth["value"]
+    )
     assert (
         "The email address used for your account is not allowed for submissions."
         in upload.text
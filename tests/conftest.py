@@ -6,12 +6,12 @@
 import os
 
 import json
+import time
 import zipfile
 
 from io import IOBase
 
 import pytest
-import requests
 
 from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.common.by import By
@@ -19,14 +19,113 @@ from selenium.webdriver.firefox.service import Service
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from api.api_client import AMOClient
+from pages.desktop import base
 from pages.desktop.frontend.home import Home
-from pages.desktop.frontend.login import Login
+from pages.desktop.frontend.login import ACCOUNT_POOL, Login
 from pages.desktop.developers.devhub_home import DevHubHome
+from scripts import (
+    addon_install,
+    browser_pool,
+    duration_history,
+    network_capture,
+    page_metrics,
+    resource_blocking,
+    webdriver_profiler,
+)
+from scripts.link_checker import LinkChecker
+from scripts.session_store import SessionStore
+from scripts.xpi_cache import XPICache
 
 # Window resolutions
 DESKTOP = (1920, 1080)
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--browser-pool",
+        action="store_true",
+        default=False,
+        help="keep one warm browser per worker and reset it between tests "
+        "instead of starting a new browser for every test",
+    )
+    parser.addoption(
+        "--account-scheduling",
+        action="store_true",
+        default=False,
+        help="with xdist, run the serial tests in parallel when they don't "
+        "share a user account (see scripts/account_scheduler.py)",
+    )
+    parser.addoption(
+        "--duration-history",
+        action="store_true",
+        default=False,
+        help="record the test durations to .test-history.sqlite and collect "
+        "the longest tests first (see scripts/duration_history.py)",
+    )
+    parser.addoption(
+        "--shard",
+        default=None,
+        metavar="INDEX/COUNT",
+        help='run one of COUNT shards balanced by the recorded test durations, e.g. "2/4"',
+    )
+    parser.addoption(
+        "--page-metrics",
+        action="store_true",
+        default=False,
+        help="record the timings and web vitals of every page the tests load "
+        "to page-metrics.jsonl (see scripts/page_metrics.py)",
+    )
+    parser.addoption(
+        "--page-budgets",
+        default=None,
+        metavar="PATH",
+        help="json file with the metric budgets of every page; implies --page-metrics",
+    )
+    parser.addoption(
+        "--capture-network",
+        action="store_true",
+        default=False,
+        help="log the requests of every test to network-log/<test>.jsonl through "
+        "the WAF bypass extension (see scripts/network_capture.py)",
+    )
+    parser.addoption(
+        "--profile-webdriver",
+        action="store_true",
+        default=False,
+        help="record every WebDriver command to webdriver-profile/<test>.jsonl "
+        "and add command counts to the html report",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("account_scheduling"):
+        # imported here, since it needs pytest-xdist
+        from scripts.account_scheduler import AccountSchedulerPlugin
+
+        config.pluginmanager.register(AccountSchedulerPlugin(), "account_scheduler")
+    if config.getoption("duration_history") or config.getoption("shard"):
+        config.pluginmanager.register(
+            duration_history.DurationHistoryPlugin(config), "duration_history"
+        )
+    if config.getoption("page_metrics") or config.getoption("page_budgets"):
+        config.pluginmanager.register(
+            page_metrics.PageMetricsPlugin(
+                config, base.page_metrics, budgets=config.getoption("page_budgets")
+            ),
+            "page_metrics",
+        )
+    if config.getoption("capture_network"):
+        config.pluginmanager.register(
+            network_capture.NetworkCapture("network-log"), "network_capture"
+        )
+    if config.getoption("profile_webdriver"):
+        config.pluginmanager.register(
+            webdriver_profiler.WebDriverProfiler("webdriver-profile"),
+            "webdriver_profiler",
+        )
+
+
 class RetryableService(Service):
     """A geckodriver Service that can be started more than once.
 
@@ -67,8 +166,9 @@ def firefox_service(driver_path, driver_args, driver_log):
 
 
 @pytest.fixture(scope="session")
-def waf_bypass_addon(tmp_path_factory, variables):
+def waf_bypass_addon(tmp_path_factory, variables, pytestconfig):
     header_value = os.environ.get(variables["FXA_CI_HEADER"], "")
+    capture_network = pytestconfig.getoption("capture_network")
 
     addon_dir = tmp_path_factory.mktemp("waf_bypass_addon")
 
@@ -118,19 +218,52 @@ if (HEADER_VALUE) {{
   );
 }}
 """
+    files = {"background.js": background_js}
+    # the same extension logs the requests of the tests (see scripts/network_capture.py)
+    if capture_network:
+        files["background.js"] += network_capture.BACKGROUND_SCRIPT
+        manifest["content_scripts"] = [
+            {
+                "matches": ["<all_urls>"],
+                "js": ["content.js"],
+                "run_at": "document_start",
+            }
+        ]
+        files["content.js"] = network_capture.CONTENT_SCRIPT
+    files["manifest.json"] = json.dumps(manifest)
+    return build_extension(addon_dir, "waf_bypass_addon.zip", files)
 
-    (addon_dir / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
-    (addon_dir / "background.js").write_text(background_js, encoding="utf-8")
-
-    addon_zip = addon_dir / "waf_bypass_addon.zip"
 
+def build_extension(directory, name, files):
+    """Writes `files` (file name -> content) to `directory` and packs them in
+    the extension `name`; returns the path of the extension"""
+    addon_zip = directory / name
     with zipfile.ZipFile(addon_zip, "w") as zip_file:
-        zip_file.write(addon_dir / "manifest.json", "manifest.json")
-        zip_file.write(addon_dir / "background.js", "background.js")
-
+        for file, content in files.items():
+            (directory / file).write_text(content, encoding="utf-8")
+            zip_file.write(directory / file, file)
     return str(addon_zip)
 
 
+@pytest.fixture(scope="session")
+def resource_blocker(tmp_path_factory):
+    """Returns the path of the extension blocking the given resource classes,
+    built once per set of classes (see scripts/resource_blocking.py)"""
+    extensions = {}
+
+    def build(classes, image_size):
+        key = (tuple(sorted(classes)), image_size)
+        if key not in extensions:
+            extensions[key] = build_extension(
+                tmp_path_factory.mktemp("resource_blocker"),
+                "resource_blocker.zip",
+                resource_blocking.blocker_files(classes, image_size),
+            )
+        return extensions[key]
+
+    return build
+
+
 @pytest.fixture(scope="session")
 def base_url(base_url, variables):
     """ Returns the base url depending on the environment used"""
@@ -244,15 +377,46 @@ def firefox_notifications(notifications):
     params=[DESKTOP],
     ids=["Desktop"],
 )
-def selenium(selenium, base_url, session_auth, request, waf_bypass_addon):
+def selenium(
+    base_url,
+    session_auth,
+    request,
+    waf_bypass_addon,
+    pooled_browser,
+    amo_api,
+    session_store,
+):
     """Fixture to set a custom resolution for tests running on Desktop
     and handle browser sessions when needed"""
-    selenium.install_addon(waf_bypass_addon, temporary=True)
+    if pooled_browser:
+        selenium = pooled_browser.acquire(request)
+    else:
+        # pytest-selenium's own driver fixture, started and quit for this test only
+        selenium = request.getfixturevalue("driver")
+        selenium.install_addon(waf_bypass_addon, temporary=True)
+    profiler = request.config.pluginmanager.get_plugin("webdriver_profiler")
+    if profiler:
+        profiler.attach(selenium)
+    capture = request.config.pluginmanager.get_plugin("network_capture")
+    started = time.time()
+    # tests that don't check anything visual can skip the heavy resources
+    block_resources = request.node.get_closest_marker("block_resources")
+    if block_resources:
+        selenium.install_addon(
+            request.getfixturevalue("resource_blocker")(
+                block_resources.args or resource_blocking.RESOURCE_CLASSES,
+                block_resources.kwargs.get(
+                    "image_size", resource_blocking.DEFAULT_IMAGE_SIZE
+                ),
+            ),
+            temporary=True,
+        )
     selenium.set_window_size(*request.param)
     # establishing actions  based on markers
     create_session = request.node.get_closest_marker("create_session")
     login = request.node.get_closest_marker("login")
     clear_session = request.node.get_closest_marker("clear_session")
+    preinstalled = request.node.get_closest_marker("preinstalled")
     # this is used when we want to open an AMO page with a sessionid
     # cookie (i.e. a logged-in user) already set
     if create_session:
@@ -266,42 +430,49 @@ def selenium(selenium, base_url, session_auth, request, waf_bypass_addon):
                 "value": session_auth,
             }
         )
-    # this is used when we want to start the browser with a normal login
-    # mostly used for the scope of getting the session cookie and storing it for later use
+    # this is used when we want to start the browser with a logged-in user; the
+    # FxA login only happens if the session store has no valid session for the user
     if login:
-        home = Home(selenium, base_url).open().wait_for_page_to_load()
-        home.header.click_login()
-        home.wait.until(
-            EC.visibility_of_element_located((By.NAME, "email")),
-            message=f"FxA email input field was not displayed in {selenium.current_url}",
-        )
         user = login.args[0]
-        Login(selenium, base_url).account(user)
-        home.wait.until(
-            EC.url_contains("addons"),
-            message=f"AMO could not be loaded in {selenium.current_url}",
+        sessionid = session_store.get(
+            user, login=lambda: browser_login(selenium, base_url, user)
+        )
+        selenium.get(base_url)
+        selenium.add_cookie(
+            {
+                "name": "sessionid",
+                "value": sessionid,
+            }
         )
-        session_cookie = selenium.get_cookie("sessionid")
-        with open(user + ".txt", "w") as file:
-            file.write(session_cookie["value"])
+    # this is used when a test only needs add-ons installed as a precondition;
+    # an argument ending in "_slug" is a key of the variables file
+    if preinstalled:
+        xpi_cache = request.getfixturevalue("xpi_cache")
+        variables = request.getfixturevalue("variables")
+        for slug in preinstalled.args:
+            if slug.endswith("_slug"):
+                if slug not in variables:
+                    raise LookupError(
+                        f"The preinstalled marker names '{slug}', which is not "
+                        f"in the variables file"
+                    )
+                slug = variables[slug]
+            install_from_amo(selenium, amo_api, xpi_cache, slug)
     yield selenium
 
+    if capture:
+        capture.save(request.node, selenium, since=started)
+
     # delete the user session and files created for a test suite;
     # this is normally used in the last test of a suite to handle the clean-up part
     if clear_session:
         # clear session by calling the DELETE session API
-        delete_session = requests.delete(
-            url=f"{base_url}/api/v5/accounts/session/",
-            headers={"Authorization": f"Session {session_auth}"},
-        )
+        delete_session = amo_api.delete("/api/v5/accounts/session/", auth=session_auth)
         assert (
             delete_session.status_code == 200
         ), f"Actual status code was {delete_session.status_code}"
         # test that session was invalidated correctly accessing the account with the deleted session
-        get_user = requests.get(
-            url=f"{base_url}/api/v5/accounts/profile/",
-            headers={"Authorization": f"Session {session_auth}"},
-        )
+        get_user = amo_api.get("/api/v5/accounts/profile/", auth=session_auth)
         assert (
             get_user.status_code == 401
         ), f"Actual status code was {get_user.status_code}"
@@ -309,27 +480,231 @@ def selenium(selenium, base_url, session_auth, request, waf_bypass_addon):
             "Valid user session not found matching the provided session key."
             in get_user.text
         ), f"Actual response message was {get_user.text}"
-        user_file = create_session.args[0]
-        if os.path.exists(f"{user_file}.txt"):
-            os.remove(f"{user_file}.txt")
-        else:
-            # fail if the file does not exist
-            raise FileNotFoundError("The file does not exist")
+        session_store.discard(create_session.args[0])
+
+
+def browser_login(selenium, base_url, user):
+    """Logs `user` in through the FxA UI and returns the new sessionid"""
+    home = Home(selenium, base_url).open().wait_for_page_to_load()
+    home.header.click_login()
+    home.wait.until(
+        EC.visibility_of_element_located((By.NAME, "email")),
+        message=f"FxA email input field was not displayed in {selenium.current_url}",
+    )
+    Login(selenium, base_url).account(user)
+    home.wait.until(
+        EC.url_contains("addons"),
+        message=f"AMO could not be loaded in {selenium.current_url}",
+    )
+    return selenium.get_cookie("sessionid")["value"]
+
+
+def install_from_amo(selenium, amo_api, xpi_cache, slug, version=None):
+    """Installs the current (or the given) version of the AMO add-on `slug`
+    without going through the install UI and returns the add-on id"""
+    if version is None:
+        file = amo_api.get_addon(slug).json()["current_version"]["file"]
+    else:
+        file = amo_api.get_version(slug, version).json()["file"]
+    return addon_install.install_directly(
+        selenium, xpi_cache.local_url(file["url"], file["hash"]), file["hash"]
+    )
+
+
+@pytest.fixture
+def install_addon(selenium, amo_api, xpi_cache):
+    """Installs AMO add-ons directly through the AddonManager, e.g.
+    `addon_id = install_addon("slug")` or `install_addon("slug", "1.0")`;
+    see also the `preinstalled` marker"""
+    return lambda slug, version=None: install_from_amo(
+        selenium, amo_api, xpi_cache, slug, version
+    )
+
+
+@pytest.fixture(scope="session")
+def pooled_browser(request, waf_bypass_addon):
+    """Session-scoped browser pool used by the selenium fixture when the tests
+    are started with `--browser-pool`; since xdist workers are separate
+    processes, every worker gets its own warm browser"""
+    if not request.config.getoption("browser_pool"):
+        yield None
+        return
+    pool = browser_pool.BrowserPool(
+        addons=[waf_bypass_addon],
+        max_init_attempts=int(request.config.getini("max_driver_init_attempts")),
+    )
+    yield pool
+    pool.quit()
+    request.config.stash[browser_pool.BROWSER_POOL_STATS] = pool.summary()
+
+
+@pytest.fixture(scope="session")
+def amo_api(request, base_url):
+    """A session-wide AMO API client that keeps its connections alive between
+    tests; the user session is passed per request, e.g.
+    `amo_api.get(endpoint, auth=session_auth)`"""
+    client = AMOClient(base_url)
+    yield client
+    client.session.close()
+    request.config.stash[API_CLIENT_STATS] = client.summary()
+
+
+@pytest.fixture(scope="session")
+def link_checker():
+    """Checks links concurrently and remembers the results for the session
+    (see scripts/link_checker.py)"""
+    checker = LinkChecker()
+    yield checker
+    checker.close()
+
+
+@pytest.fixture(scope="session")
+def session_store(base_url, amo_api):
+    """The sessions of the test users, shared by all the xdist workers and kept
+    between runs in the '.sessions' folder (see scripts/session_store.py)"""
+    return SessionStore(base_url, amo_api, accounts=ACCOUNT_POOL)
+
+
+@pytest.fixture(scope="session")
+def xpi_cache(amo_api):
+    """XPI files downloaded once, checked against their AMO hash and served
+    from a loopback server (see scripts/xpi_cache.py)"""
+    cache = XPICache(amo_api)
+    yield cache
+    cache.close()
+
+
+# stash keys for the statistics collected during the run; the "_WORKERS" keys
+# hold what each xdist worker sent to the controller at the end of its session
+API_CLIENT_STATS = pytest.StashKey[dict]()
+API_CLIENT_WORKERS = pytest.StashKey[list]()
+
+
+def pytest_sessionfinish(session):
+    """Sends the statistics collected by an xdist worker to the controller"""
+    if not hasattr(session.config, "workeroutput"):
+        return
+    stats = session.config.stash.get(browser_pool.BROWSER_POOL_STATS, None)
+    if stats:
+        session.config.workeroutput["browser_pool"] = stats
+    stats = session.config.stash.get(API_CLIENT_STATS, None)
+    if stats:
+        session.config.workeroutput["amo_api"] = stats
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    workeroutput = getattr(node, "workeroutput", {})
+    if workeroutput.get("browser_pool"):
+        node.config.stash.setdefault(browser_pool.BROWSER_POOL_WORKERS, []).append(
+            workeroutput["browser_pool"]
+        )
+    if workeroutput.get("amo_api"):
+        node.config.stash.setdefault(API_CLIENT_WORKERS, []).append(
+            workeroutput["amo_api"]
+        )
+
+
+def collected_stats(config, local_key, workers_key):
+    """Returns the statistics of this process together with the ones sent by xdist workers"""
+    summaries = list(config.stash.get(workers_key, []))
+    stats = config.stash.get(local_key, None)
+    if stats:
+        summaries.append(stats)
+    return summaries
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Reports how much browser start-up time the pool saved in this run, how
+    many commands the in-page waits saved and how much time was spent waiting
+    for the AMO API"""
+    summaries = collected_stats(
+        config, browser_pool.BROWSER_POOL_STATS, browser_pool.BROWSER_POOL_WORKERS
+    )
+    if summaries:
+        total = browser_pool.merge_summaries(summaries)
+        terminalreporter.write_sep("-", "browser pool")
+        terminalreporter.write_line(
+            f"{total['cold_starts']} browser start(s) in {total['cold_start_time']:.1f}s, "
+            f"{total['reuses']} reuse(s), {total['resets']} reset(s) in {total['reset_time']:.1f}s"
+        )
+        terminalreporter.write_line(
+            f"estimated start-up time saved: {browser_pool.saved_time(total):.1f}s"
+        )
+    # the user properties of the reports travel from the xdist workers as well
+    saved_commands = [
+        value
+        for reports in terminalreporter.stats.values()
+        for report in reports
+        if getattr(report, "when", None) == "teardown"
+        for name, value in getattr(report, "user_properties", [])
+        if name == "saved_webdriver_commands"
+    ]
+    if saved_commands:
+        terminalreporter.write_sep("-", "page ready waits")
+        terminalreporter.write_line(
+            f"in-page waits saved about {sum(saved_commands)} WebDriver command(s) "
+            f"in {len(saved_commands)} test(s)"
+        )
+    summaries = [
+        stats
+        for stats in collected_stats(config, API_CLIENT_STATS, API_CLIENT_WORKERS)
+        if stats["requests"]
+    ]
+    if summaries:
+        requests_sent = sum(stats["requests"] for stats in summaries)
+        total_time = sum(stats["total_time"] for stats in summaries)
+        slowest = sorted(
+            (item for stats in summaries for item in stats["slowest"]),
+            key=lambda item: item[-1],
+        )[-5:]
+        terminalreporter.write_sep("-", "AMO API")
+        terminalreporter.write_line(
+            f"{requests_sent} request(s) in {total_time:.1f}s, "
+            f"{total_time / requests_sent:.2f}s on average"
+        )
+        for method, path, status, latency in reversed(slowest):
+            terminalreporter.write_line(f"  {latency:.2f}s {method} {path} ({status})")
+
+
+@pytest.fixture(autouse=True)
+def page_ready_stats(request):
+    """Records how many WebDriver commands the in-page waits of
+    `pages.desktop.base.wait_for_ready` saved during the test"""
+    base.page_ready_stats.update(waits=0, saved_commands=0)
+    yield
+    if base.page_ready_stats["waits"]:
+        request.node.user_properties.append(
+            ("saved_webdriver_commands", base.page_ready_stats["saved_commands"])
+        )
 
 
 @pytest.fixture(scope="function")
-def session_auth(request):
-    """Fixture that reads and returns the sessionid cookie; to be used as a
-    standalone fixture for in API tests that require authentication and
-    also complements the selenium fixture  when we want to start
-    the browser with an active user session"""
+def session_auth(request, base_url, session_store):
+    """Fixture that returns the sessionid of the user passed to the `create_session`
+    marker; to be used as a standalone fixture in API tests that require
+    authentication and also complements the selenium fixture when we want to start
+    the browser with an active user session. The user is only logged in, with the
+    pooled browser if there is one, if the session store doesn't have a valid
+    session for them"""
     marker = request.node.get_closest_marker("create_session")
-    # the user file is passed in the test as a marker argument
+    # the user is passed in the test as a marker argument
     if marker:
-        user_file = marker.args[0]
-        with open(f"{user_file}.txt", "r") as file:
-            sessionid = str(file.read())
-        return sessionid
+        user = marker.args[0]
+
+        def login():
+            pooled_browser = request.getfixturevalue("pooled_browser")
+            if pooled_browser:
+                # the selenium fixture resets it again before the test runs
+                driver = pooled_browser.acquire(request)
+            else:
+                driver = request.getfixturevalue("driver")
+                driver.install_addon(
+                    request.getfixturevalue("waf_bypass_addon"), temporary=True
+                )
+            return browser_login(driver, base_url, user)
+
+        return session_store.get(user, login=login)
 
 
 @pytest.fixture
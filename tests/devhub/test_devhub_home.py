@@ -205,11 +205,8 @@ def test_devhub_my_addons_section_tc_id_C15072(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-# log in fresh rather than reusing the cached session: under the parallel
-# (-n 4) CI run the shared developer.txt is only refreshed part-way through the
-# suite by the login-marked tests, so a create_session test that runs before
-# that refresh reads a stale/expired session and lands on the logged-out DevHub
-# home, where the "My Add-ons" section (and its buttons) does not exist.
+# a logged-out user lands on a DevHub home without the "My Add-ons" section
+# (and its buttons), so the test needs a valid developer session
 @pytest.mark.login("developer")
 def test_devhub_my_addons_list_items(selenium, base_url, wait):
     """Verifies that the "My Add-ons"
@@ -119,7 +119,7 @@ def test_submit_a_new_version_for_addon_prod(selenium, base_url, variables, wait
         "name": "listed_addon_1_1",
         "description": "addon used for test",
     }
-    api_helpers.make_addon(manifest)
+    addon_file = api_helpers.make_addon(manifest)
     page = DevHubHome(selenium, base_url).open().wait_for_page_to_load()
     page.devhub_login("submissions_user")
     manage_versions = ManageVersions(selenium, base_url)
@@ -127,7 +127,7 @@ def test_submit_a_new_version_for_addon_prod(selenium, base_url, variables, wait
     manage_versions.click_visible_radio_button()
     manage_versions.click_upload_new_version_button()
     submit_addon_page = SubmitAddon(selenium, base_url).wait_for_page_to_load()
-    submit_addon_page.upload_addon("make-addon.zip")
+    submit_addon_page.upload_addon(addon_file)
     submit_addon_page.is_validation_successful()
     submit_addon_page.click_continue()
     upload_source = UploadSource(selenium, base_url).wait_for_page_to_load()
@@ -413,7 +413,9 @@ def test_submit_mixed_addon_versions_tc_id_c14981(selenium, base_url, variables,
 
 
 @pytest.mark.serial
-def test_verify_new_unlisted_version_autoapproval_tc_id_C4372(selenium, base_url, variables):
+def test_verify_new_unlisted_version_autoapproval_tc_id_C4372(
+    selenium, base_url, amo_api, variables
+):
     """Uploads a new version to an existing addon and verifies that is auto-approved"""
     page = DevHubHome(selenium, base_url).open().wait_for_page_to_load()
     page.devhub_login("developer")
@@ -421,7 +423,7 @@ def test_verify_new_unlisted_version_autoapproval_tc_id_C4372(selenium, base_url
     # in order to upload a new version, we need to increment on the existing version number
     # to obtain the current version number, we make an API request that returns the value
     auth = selenium.get_cookie("sessionid")["value"]
-    version_string = api_helpers.get_addon_version_string(base_url, addon, auth)
+    version_string = api_helpers.get_addon_version_string(amo_api, addon, auth)
     # create a new addon version with the incremented versio number
     manifest = {
         "manifest_version": 2,
@@ -429,11 +431,11 @@ def test_verify_new_unlisted_version_autoapproval_tc_id_C4372(selenium, base_url
         "version": f"{float(version_string) + 1}",
         "name": "New version auto-approval",
     }
-    api_helpers.make_addon(manifest)
+    addon_file = api_helpers.make_addon(manifest)
     # go to the unlisted distribution page to submit a new version
     selenium.get(f"{base_url}/developers/addon/{addon}/versions/submit/")
     submit_version = SubmitAddon(selenium).wait_for_page_to_load()
-    submit_version.upload_addon("make-addon.zip")
+    submit_version.upload_addon(addon_file)
     # wait for the validation to finish and check if it is successful
     time.sleep(5)
     submit_version.is_validation_successful()
@@ -478,12 +480,12 @@ def test_submit_unicode_addon_tc_id_c4590(
         "name": addon_name,
         "description": description,
     }
-    api_helpers.make_addon(manifest)
+    addon_file = api_helpers.make_addon(manifest)
     selenium.get(f"{base_url}/developers/addon/submit/upload-listed")
     submit_addon = SubmitAddon(selenium, base_url).wait_for_page_to_load()
     # checking that the Firefox compatibility checkbox is selected by default
     wait.until(lambda _: submit_addon.firefox_compat_checkbox.is_selected())
-    submit_addon.upload_addon("make-addon.zip")
+    submit_addon.upload_addon(addon_file)
     # waits for the validation to complete and checks that is successful
     time.sleep(5)
     submit_addon.is_validation_successful()
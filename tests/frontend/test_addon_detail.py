@@ -19,6 +19,7 @@ from pages.desktop.frontend.users import User
 from pages.desktop.frontend.reviews import Reviews
 from pages.desktop.frontend.versions import Versions
 from scripts import reusables
+from scripts.link_checker import element_urls
 
 @pytest.mark.sanity
 @pytest.mark.nondestructive
@@ -207,9 +208,10 @@ def test_addon_with_stats_summary(selenium, base_url, variables):
     selenium.get(f"{base_url}/addon/{extension}")
     addon = Detail(selenium, base_url).wait_for_page_to_load()
     # checks that a summary of users, reviews and star ratings are present
-    assert addon.stats.stats_users_count > 0
-    assert addon.stats.stats_reviews_count > 0
-    assert addon.stats.addon_star_rating_stats.is_displayed()
+    stats = addon.stats.summary()
+    assert stats.users > 0
+    assert stats.reviews > 0
+    assert stats.star_rating_displayed
 
 
 @pytest.mark.nondestructive
@@ -668,7 +670,7 @@ def test_more_info_addon_tags(selenium, base_url, variables):
 
 @pytest.mark.nondestructive
 @pytest.mark.skip(reason="need to update way of interaction")
-def test_screenshot_viewer(selenium, base_url, variables):
+def test_screenshot_viewer(selenium, base_url, variables, link_checker):
     """Tests that the screenshot viewer works as expected."""
     extension = variables["detail_extension_slug"]
     selenium.get(f"{base_url}/addon/{extension}")
@@ -676,21 +678,24 @@ def test_screenshot_viewer(selenium, base_url, variables):
     assert "Screenshots" in addon.screenshots.screenshot_section_header.text
     # clicks through each screenshot
     # and verifies that the screenshot full size viewer is opened
-    # also check that the image preview sources
-    # are actually retrieved from the server (no broken previews)
+    image_sources = []
     for preview in addon.screenshots.screenshot_preview:
         preview_count = addon.screenshots.screenshot_preview.index(preview)
         preview.click()
         time.sleep(1)
-        # check that he image preview is not broken
-        src_img = selenium.find_elements(By.CSS_SELECTOR, ".ScreenShots-image")[
-            preview_count
-        ].get_attribute("src")
-        assert requests.get(src_img, timeout=10).status_code == 200
+        image_sources.append(
+            selenium.find_elements(By.CSS_SELECTOR, ".ScreenShots-image")[
+                preview_count
+            ].get_attribute("src")
+        )
         # checks that the screenshot viewer has opened
         addon.screenshots.screenshot_full_view_displayed()
         action = ActionChains(selenium)
         action.send_keys(Keys.ESCAPE)
+    # check that the image preview sources are actually retrieved
+    # from the server (no broken previews), all at once
+    results = link_checker.check(image_sources)
+    assert all(result.ok for result in results.values()), link_checker.report(results)
 
 
 @pytest.mark.nondestructive
@@ -905,47 +910,46 @@ def test_click_addon_recommendations(selenium, base_url, variables):
 #     addon.wait_for_current_url("https://extensionworkshop.allizom.org/")
 
 
-def test_addon_description_outgoing_urls(selenium, base_url):
+def _check_outgoing_links(selenium, link_checker, links):
+    """Checks that `links` go through the outgoing domain and end up on the
+    extension workshop, without leaving the page"""
+    urls = element_urls(selenium, links)
+    assert urls, "No links were found"
+    for url in urls:
+        assert "https://stage.outgoing.nonprod.webservices.mozgcp.net" in url
+    results = link_checker.check(urls)
+    assert all(result.ok for result in results.values()), link_checker.report(results)
+    for result in results.values():
+        assert result.final_url.startswith("https://extensionworkshop.allizom.org/")
+
+
+def test_addon_description_outgoing_urls(selenium, base_url, link_checker):
     """Checks that external URLs in description are redirected through the outgoing domain"""
     selenium.get(f"{base_url}/addon/outgoing-urls/")
     addon = Detail(selenium, base_url).wait_for_page_to_load()
-    outgoing_description = addon.description.addon_description_text.find_element(
-        By.CSS_SELECTOR, "a"
+    _check_outgoing_links(
+        selenium,
+        link_checker,
+        addon.description.addon_description_text.find_elements(By.CSS_SELECTOR, "a"),
     )
-    assert (
-        "https://stage.outgoing.nonprod.webservices.mozgcp.net"
-        in outgoing_description.get_attribute("href")
-    )
-    outgoing_description.click()
-    addon.wait_for_current_url("https://extensionworkshop.allizom.org/")
 
 
-def test_addon_developer_comments_outgoing_urls(selenium, base_url):
+def test_addon_developer_comments_outgoing_urls(selenium, base_url, link_checker):
     """Checks that external URLs in developer comments are redirected through the outgoing domain"""
     selenium.get(f"{base_url}/addon/outgoing-urls/")
     addon = Detail(selenium, base_url).wait_for_page_to_load()
-    outgoing_dev_comments = addon.developer_comments.content.find_element(
-        By.CSS_SELECTOR, "a"
+    _check_outgoing_links(
+        selenium,
+        link_checker,
+        addon.developer_comments.content.find_elements(By.CSS_SELECTOR, "a"),
     )
-    assert (
-        "https://stage.outgoing.nonprod.webservices.mozgcp.net"
-        in outgoing_dev_comments.get_attribute("href")
-    )
-    outgoing_dev_comments.click()
-    addon.wait_for_current_url("https://extensionworkshop.allizom.org/")
 
 
-def test_addon_more_info_homepage_outgoing_urls(selenium, base_url):
+def test_addon_more_info_homepage_outgoing_urls(selenium, base_url, link_checker):
     """Checks that external URLs in homepage are redirected through the outgoing domain"""
     selenium.get(f"{base_url}/addon/outgoing-urls/")
     addon = Detail(selenium, base_url).wait_for_page_to_load()
-    outgoing_homepage = addon.more_info.addon_homepage_link
-    assert (
-        "https://stage.outgoing.nonprod.webservices.mozgcp.net"
-        in outgoing_homepage.get_attribute("href")
-    )
-    outgoing_homepage.click()
-    addon.wait_for_current_url("https://extensionworkshop.allizom.org/")
+    _check_outgoing_links(selenium, link_checker, [addon.more_info.addon_homepage_link])
 
 
 def test_addon_more_info_support_site_outgoing_urls(selenium, base_url):
@@ -4,6 +4,7 @@ import pytest
 
 from selenium.webdriver.support.select import Select
 
+from pages.desktop.base import users_from_text
 from pages.desktop.frontend.extensions import Extensions
 from pages.desktop.frontend.search import Search
 
@@ -61,15 +62,15 @@ def test_extension_landing_header(base_url, selenium):
 def test_recommended_extensions_shelf(base_url, selenium):
     """Test that verifies the recommended extensions shelf"""
     extensions = Extensions(selenium, base_url).open()
-    shelf_items = extensions.shelves.recommended_addons.list
+    shelf_items = extensions.shelves.recommended_addons.snapshot_list()
     assert "Recommended extensions" in extensions.shelves.recommended_addons.card_header
     # the following statements are checking that each shelf has four addons
     # and each addon has a name, icon and number of users
     assert len(shelf_items) == 4
     for item in shelf_items:
-        assert item.name
-        assert item.addon_icon_preview.is_displayed()
-        assert item.addon_users_preview.is_displayed()
+        assert item.addon_name.text
+        assert item.addon_icon.attributes["src"]
+        assert users_from_text(item.addon_users.text) > 0
 
 
 @pytest.mark.sanity
@@ -90,15 +91,15 @@ def test_browse_more_recommended_extensions(base_url, selenium):
 def test_top_rated_extensions(base_url, selenium):
     """Checks the top rated extensions shelve"""
     extensions = Extensions(selenium, base_url).open()
-    shelf_items = extensions.shelves.top_rated_addons.list
+    shelf_items = extensions.shelves.top_rated_addons.snapshot_list()
     assert "Top rated extensions" in extensions.shelves.top_rated_addons.card_header
     # the following statements are checking that each shelf has four addons
     # and each addon has a name, icon and number of users
     assert len(shelf_items) == 4
     for item in shelf_items:
-        assert item.name
-        assert item.addon_icon_preview.is_displayed()
-        assert item.addon_users_preview.is_displayed()
+        assert item.addon_name.text
+        assert item.addon_icon.attributes["src"]
+        assert users_from_text(item.addon_users.text) > 0
 
 
 @pytest.mark.sanity
@@ -115,24 +116,26 @@ def test_browse_more_top_rated_extensions(base_url, selenium):
         assert "Recommended" in result.promoted_badge_label
     # using a list slice below (normal len is 25) to validate rating ordering
     # because not all addons in the list have a rating on stage
-    ratings = search_results.result_list.search_results[0:16]
+    ratings = search_results.result_list.ratings(
+        search_results.result_list.search_results[0:16]
+    )
     for rating in ratings:
-        assert rating.rating >= 3
+        assert rating >= 3
 
 
 @pytest.mark.nondestructive
 def test_trending_extensions(base_url, selenium):
     """Checks the trending extensions shelve"""
     extensions = Extensions(selenium, base_url).open()
-    shelf_items = extensions.shelves.trending_addons.list
+    shelf_items = extensions.shelves.trending_addons.snapshot_list()
     assert "Trending extensions" in extensions.shelves.trending_addons.card_header
     # the following statements are checking that each shelf has four addons
     # and each addon has a name, icon and number of users
     assert len(shelf_items) == 4
     for item in shelf_items:
-        assert item.name
-        assert item.addon_icon_preview.is_displayed()
-        assert item.addon_users_preview.is_displayed()
+        assert item.addon_name.text
+        assert item.addon_icon.attributes["src"]
+        assert users_from_text(item.addon_users.text) > 0
 
 
 @pytest.mark.sanity
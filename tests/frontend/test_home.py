@@ -7,6 +7,7 @@ from selenium.webdriver import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 
+from pages.desktop.base import users_from_text
 from pages.desktop.frontend.home import Home
 from pages.desktop.frontend.search import Search
 from scripts import reusables
@@ -178,13 +179,13 @@ def test_home_recommended_extensions_shelf_tc_id_c95105(base_url, selenium):
     """Test checking the Home Recommended extensions"""
     page = Home(selenium, base_url).open().wait_for_page_to_load()
     assert "Recommended extensions" in page.recommended_extensions.card_header
-    shelf_items = page.recommended_extensions.list
+    shelf_items = page.recommended_extensions.snapshot_list()
     # verifies that each shelf extension has the necessary components
     assert len(shelf_items) == 4
     for item in shelf_items:
-        assert item.name.is_displayed()
-        assert item.addon_icon_preview.is_displayed()
-        assert item.addon_users_preview.is_displayed()
+        assert item.addon_name.text
+        assert item.addon_icon.attributes["src"]
+        assert users_from_text(item.addon_users.text) > 0
 
 
 @pytest.mark.nondestructive
@@ -212,15 +213,14 @@ def test_home_popular_themes_shelf(base_url, selenium):
     # depending on the environment's homepage configuration
     shelf_header = themes_shelf.card_header
     assert shelf_header in ("Popular themes", "Trending themes")
-    shelf_items = themes_shelf.list
+    shelf_items = themes_shelf.snapshot_list()
     # verifies that each shelf themes has the necessary components
     users_list = []
     assert len(shelf_items) == 3
     for item in shelf_items:
-        assert item.name.is_displayed()
-        assert item.addon_icon_preview.is_displayed()
-        assert item.addon_users_preview.is_displayed()
-        users_list.append(int(item.addon_users_preview.text.split()[0].replace(",", "")))
+        assert item.addon_name.text
+        assert item.addon_icon.attributes["src"]
+        users_list.append(users_from_text(item.addon_users.text))
     # only the "Popular themes" shelf is ordered by user count; the "Trending
     # themes" shelf is ordered by hotness, so skip the ordering check there
     if shelf_header == "Popular themes":
@@ -299,9 +299,7 @@ def test_filter_by_users_tc_id_c92462(base_url, selenium):
     sort = "users"
     selenium.get(f"{base_url}/search/?&q={term}&sort={sort}")
     search_page = Search(selenium, base_url).wait_for_page_to_load()
-    results = [
-        getattr(result, sort) for result in search_page.result_list.search_results
-    ]
+    results = search_page.result_list.users_counts()
     assert sorted(results, reverse=True) == results
 
 
@@ -318,8 +316,8 @@ def test_filter_by_rating_and_hotness_tc_id_c92462(base_url, selenium, category,
     search_page = Search(selenium, base_url).wait_for_page_to_load()
     results = search_page.result_list.search_results
     if sort_attr == "rating":
-        for result in search_page.result_list.search_results:
-            assert result.rating > 4
+        for rating in search_page.result_list.ratings(results):
+            assert rating > 4
     else:
         assert len(results) == 25
 
@@ -421,9 +419,7 @@ def test_most_users_recommended_addons_tc_id_c92462(base_url, selenium, variable
     Select(search_page.filter_by_badging).select_by_visible_text("Recommended")
     page.search.search_for(variables["search_term"])
     # verify if elements are correctly sorted
-    results = [
-        getattr(result, "users") for result in search_page.result_list.search_results
-    ]
+    results = search_page.result_list.users_counts()
     assert sorted(results, reverse=True) == results
     # verify badge type
     results = search_page.result_list.search_results
@@ -442,9 +438,7 @@ def test_most_users_by_firefox_addons_tc_id_c92462(base_url, selenium, variables
     Select(search_page.filter_by_badging).select_by_visible_text("By Firefox")
     page.search.search_for(variables["search_term"])
     # verify if elements are correctly sorted
-    results = [
-        getattr(result, "users") for result in search_page.result_list.search_results
-    ]
+    results = search_page.result_list.users_counts()
     assert sorted(results, reverse=True) == results
     # verify badge type
     results = search_page.result_list.search_results
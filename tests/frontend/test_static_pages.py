@@ -1,7 +1,6 @@
 """This python file contains tests for the pages whose content do not change
     when a user visits them"""
 import pytest
-import requests
 
 from selenium.common.exceptions import NoSuchElementException
 
@@ -9,26 +8,22 @@ from pages.desktop.frontend.home import Home
 from pages.desktop.frontend.static_pages import StaticPages
 
 @pytest.mark.nondestructive
-def test_about_firefox_addons_page_links(base_url, selenium):
+@pytest.mark.block_resources
+def test_about_firefox_addons_page_links(base_url, selenium, link_checker):
     """Check the links from About Firefox"""
     Home(selenium, base_url).open().wait_for_page_to_load()
     selenium.get(f"{base_url}/about")
     page = StaticPages(selenium, base_url).wait_for_page_to_load()
-    for count in range(len(page.page_links)):
-        link = page.page_links[count]
-        # skip the link for sending an email
-        if "mailto" in link.get_attribute("href"):
-            continue
-        # get the link's domain
-        link_domain = link.get_attribute("href").split("/")[2].split(".")[0]
-        # click the link
-        link.click()
+    # the links for sending an email are skipped by the link checker
+    results = link_checker.check(page.page_link_urls)
+    assert all(result.ok for result in results.values()), link_checker.report(results)
+    for url, result in results.items():
         # verify if the opened page link contains the correct domain
-        page.wait_for_current_url(link_domain)
-        # go back to test the next link
-        selenium.get(f"{base_url}/about")
+        link_domain = url.split("/")[2].split(".")[0]
+        assert link_domain in result.final_url
 
 @pytest.mark.nondestructive
+@pytest.mark.block_resources
 def test_review_guidelines_page_loaded_correctly(base_url, selenium):
     """Test that verifies the review guidelines page"""
     selenium.get(f"{base_url}/review_guide")
@@ -45,6 +40,7 @@ def test_review_guidelines_page_loaded_correctly(base_url, selenium):
 
 
 @pytest.mark.nondestructive
+@pytest.mark.block_resources
 def test_about_firefox_addons_page_loaded_correctly(base_url, selenium):
     """Test that verifies the about firefox addons page"""
     selenium.get(f"{base_url}/about")
@@ -70,6 +66,7 @@ def test_about_firefox_addons_page_loaded_correctly(base_url, selenium):
 
 
 @pytest.mark.nondestructive
+@pytest.mark.block_resources
 def test_blocked_addon_page_loaded_correctly(base_url, selenium, variables):
     """Test that checks the blocked addon page"""
     selenium.get(variables["static_page_blocked_addon"])
@@ -94,6 +91,7 @@ def test_blocked_addon_page_loaded_correctly(base_url, selenium, variables):
 
 
 @pytest.mark.nondestructive
+@pytest.mark.block_resources
 def test_blocked_addon_page_does_not_have_login_button(base_url, selenium, variables):
     """Checks the blocked addon page without login"""
     selenium.get(variables["static_page_blocked_addon"])
@@ -103,6 +101,7 @@ def test_blocked_addon_page_does_not_have_login_button(base_url, selenium, varia
 
 
 @pytest.mark.nondestructive
+@pytest.mark.block_resources
 def test_review_guidelines_page_links(base_url, selenium):
     """Checks the links from review guidelines page"""
     selenium.get(f"{base_url}/review_guide")
@@ -114,20 +113,16 @@ def test_review_guidelines_page_links(base_url, selenium):
 
 @pytest.mark.nondestructive
 @pytest.mark.skip
-def test_blocked_addon_page_links(base_url, selenium, variables):
+def test_blocked_addon_page_links(base_url, selenium, variables, link_checker):
     """Checks the links from blocked addon page"""
     selenium.get(variables["static_page_blocked_addon"])
     page = StaticPages(selenium, base_url)
-    for count in range(len(page.page_links)):
-        link = page.page_links[count]
-        # get the link's domain
-        link_domain = link.get_attribute("href").split("/")[2].split(".")[0]
-        # click the link
-        link.click()
+    results = link_checker.check(page.page_link_urls)
+    assert all(result.ok for result in results.values()), link_checker.report(results)
+    for url, result in results.items():
         # verify if the opened page link contains the correct domain
-        assert link_domain in selenium.current_url
-        # go back to test the next link
-        page.driver.back()
+        link_domain = url.split("/")[2].split(".")[0]
+        assert link_domain in result.final_url
 
 
 @pytest.mark.nondestructive
@@ -156,21 +151,16 @@ def test_login_expired_page(base_url, selenium, variables):
 
 
 @pytest.mark.nondestructive
-def test_not_found_page(base_url, selenium):
+@pytest.mark.block_resources
+def test_not_found_page(base_url, selenium, link_checker):
     """Go to an addon detail page that does not exist"""
     selenium.get(f"{base_url}/addon/§§/")
     page = StaticPages(selenium, base_url)
     assert "Oops! We can’t find that page" in page.page_header
-    for count in range(len(page.page_links)):
-        link = page.page_links[count]
-        # get the link's domain
-        link_domain = link.get_attribute("href").split("/")[2].split(".")[0]
-        # click the link
-        link.click()
-        # verify that the page was found (status code != 404)
-        r = requests.get(selenium.current_url)
-        r.raise_for_status()
+    # verify that the pages are found (status code != 404)
+    results = link_checker.check(page.page_link_urls)
+    assert all(result.ok for result in results.values()), link_checker.report(results)
+    for url, result in results.items():
         # verify if the opened page link contains the correct domain
-        assert link_domain in selenium.current_url
-        # go back to test the next link
-        page.driver.back()
+        link_domain = url.split("/")[2].split(".")[0]
+        assert link_domain in result.final_url
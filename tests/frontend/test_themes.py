@@ -3,6 +3,7 @@ import pytest
 
 from selenium.webdriver.support.select import Select
 
+from pages.desktop.base import users_from_text
 from pages.desktop.frontend.search import Search
 from pages.desktop.frontend.themes import Themes
 
@@ -60,15 +61,15 @@ def test_themes_landing_header(base_url, selenium):
 def test_recommended_themes(base_url, selenium):
     """Tests that recommended themes are shown on the landing page."""
     themes = Themes(selenium, base_url).open()
-    shelf_items = themes.shelves.recommended_addons.list
+    shelf_items = themes.shelves.recommended_addons.snapshot_list()
     assert "Recommended themes" in themes.shelves.recommended_addons.card_header
     # the following statements are checking that each shelf has three themes
     # and each theme has a name, preview and number of users
     assert len(shelf_items) == 3
     for item in shelf_items:
-        assert item.name
-        assert item.addon_icon_preview.is_displayed()
-        assert item.addon_users_preview.is_displayed()
+        assert item.addon_name.text
+        assert item.addon_icon.attributes["src"]
+        assert users_from_text(item.addon_users.text) > 0
 
 
 @pytest.mark.sanity
@@ -94,15 +95,15 @@ def test_browse_more_recommended_themes(base_url, selenium):
 def test_top_rated_themes(base_url, selenium):
     """Tests that top-rated themes are displayed on the themes page."""
     themes = Themes(selenium, base_url).open()
-    shelf_items = themes.shelves.top_rated_addons.list
+    shelf_items = themes.shelves.top_rated_addons.snapshot_list()
     assert "Top rated themes" in themes.shelves.top_rated_addons.card_header
     # the following statements are checking that each shelf has three themes
     # and each theme has a name, preview and number of users
     assert len(shelf_items) == 3
     for item in shelf_items:
-        assert item.name
-        assert item.addon_icon_preview.is_displayed()
-        assert item.addon_users_preview.is_displayed()
+        assert item.addon_name.text
+        assert item.addon_icon.attributes["src"]
+        assert users_from_text(item.addon_users.text) > 0
 
 
 @pytest.mark.sanity
@@ -122,15 +123,15 @@ def test_browse_more_top_rated_themes(base_url, selenium):
 def test_trending_themes(base_url, selenium):
     """Tests that trending themes are shown on the themes page."""
     themes = Themes(selenium, base_url).open()
-    shelf_items = themes.shelves.trending_addons.list
+    shelf_items = themes.shelves.trending_addons.snapshot_list()
     assert "Trending themes" in themes.shelves.trending_addons.card_header
     # the following statements are checking that each shelf has three themes
     # and each theme has a name, preview and number of users
     assert len(shelf_items) == 3
     for item in shelf_items:
-        assert item.name
-        assert item.addon_icon_preview.is_displayed()
-        assert item.addon_users_preview.is_displayed()
+        assert item.addon_name.text
+        assert item.addon_icon.attributes["src"]
+        assert users_from_text(item.addon_users.text) > 0
 
 
 @pytest.mark.sanity
@@ -4,8 +4,10 @@ import pytest
 from pages.desktop.frontend.extensions import Extensions
 from pages.desktop.frontend.home import Home
 from pages.desktop.frontend.themes import Themes
+from scripts import locale_sweep
 
 
+@pytest.mark.block_resources
 @pytest.mark.parametrize(
     "language",
     ("it", "es-ES", "de", "fr"),
@@ -52,6 +54,7 @@ def test_header_translations(base_url, selenium, variables, language):
     )
 
 
+@pytest.mark.block_resources
 @pytest.mark.parametrize(
     "language",
     ("it", "es-ES", "de", "fr"),
@@ -80,6 +83,7 @@ def test_shelf_titles_translations(base_url, selenium, variables, language):
     )
 
 
+@pytest.mark.block_resources
 @pytest.mark.parametrize(
     "language",
     ("it", "es-ES", "de", "fr"),
@@ -109,6 +113,7 @@ def test_extensions_page_translations(base_url, selenium, variables, language):
     )
 
 
+@pytest.mark.block_resources
 @pytest.mark.parametrize(
     "language",
     ("it", "es-ES", "de", "fr"),
@@ -136,3 +141,16 @@ def test_themes_page_translations(base_url, selenium, variables, language):
         page.shelves.trending_addons.card_header
         in variables[language]["themes_page"]["shelf_title_trending_themes"]
     )
+
+
+def test_translations_without_browser(base_url, amo_api, variables):
+    """Tests the strings of every locale in translations.json on the server
+    rendered pages, fetched concurrently without a browser."""
+    translations = locale_sweep.locales(variables)
+    if not translations:
+        pytest.skip("No locales loaded, run with --variables translations.json")
+    missing = locale_sweep.sweep(amo_api, base_url, translations)
+    assert not missing, "\n".join(
+        f'{locale} {section}.{key}: "{string}" not found on {url}'
+        for locale, section, key, string, url in missing
+    )
@@ -343,7 +343,7 @@ def test_user_account_manage_section(base_url, selenium, variables):
     user = User(selenium, base_url).open().wait_for_page_to_load()
     email = Login(selenium, base_url)
     # verifies if the correct email is displayed in the email field
-    assert email.REUSABLE_USER_EMAIL in user.edit.email_field
+    assert email.credentials("reusable_user").email in user.edit.email_field
     # checks that the email filed shows a help text and a link to a sumo page
     assert variables["email_field_help_text"] in user.edit.email_field_help_text
     user.edit.email_field_help_link()
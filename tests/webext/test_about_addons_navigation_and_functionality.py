@@ -12,7 +12,7 @@ from pages.desktop.about_addons import AboutAddons
 from pages.desktop.toolbar.toolbar import Toolbar
 from scripts.kbd import primary_modifier, send_chord_in_chrome
 from scripts.shadow_dom import shadow_query
-from scripts.addon_install import accept_popup_notification
+from scripts.addon_install import handle_door_hanger
 
 
 # -------- helpers ---------------------------------------------------------
@@ -27,18 +27,8 @@ def _install_first_extension(selenium, base_url, firefox, firefox_notifications)
     page.click_recommendations_side_button()
     ext = next(c for c in page.addon_cards_items if c.is_extension_card())
     ext.install_button.click()
-    accept_popup_notification(
-        selenium,
-        firefox.browser.wait_for_notification(
-            firefox_notifications.AddOnInstallConfirmation
-        ),
-    )
-    accept_popup_notification(
-        selenium,
-        firefox.browser.wait_for_notification(
-            firefox_notifications.AddOnInstallComplete
-        ),
-    )
+    handle_door_hanger(selenium, firefox_notifications.AddOnInstallConfirmation)
+    handle_door_hanger(selenium, firefox_notifications.AddOnInstallComplete)
     if len(selenium.window_handles) == 2:
         selenium.switch_to.window(selenium.window_handles[0])
     return page
@@ -396,22 +386,12 @@ def test_suite_keyboard_open_addons_install_uninstall(
     page.click_recommendations_side_button()
     ext = next(c for c in page.addon_cards_items if c.is_extension_card())
     ext.install_button.click()
-    accept_popup_notification(
-        selenium,
-        firefox.browser.wait_for_notification(
-            firefox_notifications.AddOnInstallConfirmation
-        ),
-    )
-    accept_popup_notification(
-        selenium,
-        firefox.browser.wait_for_notification(
-            firefox_notifications.AddOnInstallComplete
-        ),
-    )
+    handle_door_hanger(selenium, firefox_notifications.AddOnInstallConfirmation)
+    handle_door_hanger(selenium, firefox_notifications.AddOnInstallComplete)
     if len(selenium.window_handles) > 1:
         selenium.switch_to.window(selenium.window_handles[0])
     page.click_extensions_side_button()
-    count_after_install = len(page.installed_addon_name)
+    count_after_install = len(page.installed_addons.of_type("extension"))
     assert count_after_install >= 2, "Extension install did not register"
     # uninstall via three-dot Remove + chrome confirm accept
     page.click_more_options_button_addon()
@@ -422,7 +402,8 @@ def test_suite_keyboard_open_addons_install_uninstall(
     page = AboutAddons(selenium, base_url).wait_for_page_to_load()
     page.click_extensions_side_button()
     WebDriverWait(selenium, 10).until(
-        lambda d: len(page.installed_addon_name) == count_after_install - 1,
+        lambda d: len(page.refresh_installed_addons().of_type("extension"))
+        == count_after_install - 1,
         message="Extension was not uninstalled",
     )
 
@@ -438,16 +419,11 @@ def test_suite_keyboard_open_addons_install_uninstall(
             "uninstall sub-flow cannot be exercised this run"
         )
     theme.install_button.click()
-    accept_popup_notification(
-        selenium,
-        firefox.browser.wait_for_notification(
-            firefox_notifications.AddOnInstallConfirmation
-        ),
-    )
+    handle_door_hanger(selenium, firefox_notifications.AddOnInstallConfirmation)
     if len(selenium.window_handles) > 1:
         selenium.switch_to.window(selenium.window_handles[0])
     page.click_themes_side_button()
-    themes_after_install = len(page.installed_addon_name)
+    themes_after_install = len(page.installed_addons.of_type("theme"))
     page.click_more_options_button_addon()
     page.click_more_options_remove_addon()
     WebDriverWait(selenium, 10).until(EC.alert_is_present())
@@ -456,7 +432,8 @@ def test_suite_keyboard_open_addons_install_uninstall(
     page = AboutAddons(selenium, base_url).wait_for_page_to_load()
     page.click_themes_side_button()
     WebDriverWait(selenium, 10).until(
-        lambda d: len(page.installed_addon_name) == themes_after_install - 1,
+        lambda d: len(page.refresh_installed_addons().of_type("theme"))
+        == themes_after_install - 1,
         message="Theme was not uninstalled",
     )
 
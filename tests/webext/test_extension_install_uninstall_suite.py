@@ -6,7 +6,7 @@ from selenium.webdriver.support.wait import WebDriverWait
 
 from pages.desktop.about_addons import AboutAddons
 from pages.desktop.toolbar.toolbar import Toolbar
-from scripts.addon_install import accept_popup_notification
+from scripts.addon_install import handle_door_hanger
 
 
 # -------- helpers ---------------------------------------------------------
@@ -19,18 +19,8 @@ def _install_first_extension(selenium, base_url, firefox, firefox_notifications)
     page.click_recommendations_side_button()
     ext = next(c for c in page.addon_cards_items if c.is_extension_card())
     ext.install_button.click()
-    accept_popup_notification(
-        selenium,
-        firefox.browser.wait_for_notification(
-            firefox_notifications.AddOnInstallConfirmation
-        ),
-    )
-    accept_popup_notification(
-        selenium,
-        firefox.browser.wait_for_notification(
-            firefox_notifications.AddOnInstallComplete
-        ),
-    )
+    handle_door_hanger(selenium, firefox_notifications.AddOnInstallConfirmation)
+    handle_door_hanger(selenium, firefox_notifications.AddOnInstallComplete)
     if len(selenium.window_handles) == 2:
         selenium.switch_to.window(selenium.window_handles[0])
     page.click_extensions_side_button()
@@ -51,12 +41,7 @@ def _install_first_theme(selenium, base_url, firefox, firefox_notifications):
     if theme is None:
         return None
     theme.install_button.click()
-    accept_popup_notification(
-        selenium,
-        firefox.browser.wait_for_notification(
-            firefox_notifications.AddOnInstallConfirmation
-        ),
-    )
+    handle_door_hanger(selenium, firefox_notifications.AddOnInstallConfirmation)
     if len(selenium.window_handles) == 2:
         selenium.switch_to.window(selenium.window_handles[0])
     page.click_themes_side_button()
@@ -99,10 +84,10 @@ def test_suite_remove_extension_via_three_dot(
     page = _install_first_extension(
         selenium, base_url, firefox, firefox_notifications
     )
-    installed_before = len(page.installed_addon_name)
-    assert installed_before >= 2, (
+    installed_before = page.installed_addons.of_type("extension")
+    assert len(installed_before) >= 2, (
         "Setup error — expected the WAF Bypass helper plus the freshly "
-        "installed extension, got only " + str(installed_before)
+        f"installed extension, got {installed_before.names}"
     )
     # Step 3 — three-dot Remove
     page.click_more_options_button_addon()
@@ -110,17 +95,15 @@ def test_suite_remove_extension_via_three_dot(
     # Step 4 — accept the chrome confirm dialog (Remove without report)
     WebDriverWait(selenium, 10).until(EC.alert_is_present())
     selenium.switch_to.alert.accept()
-    # The list must now have one fewer entry. Refresh the AboutAddons view
-    # to make sure the count reflects the post-remove state.
+    # The AddonManager must now list one extension fewer. Refresh the
+    # AboutAddons view so the pending uninstall is carried out.
     selenium.get("about:addons")
     page = AboutAddons(selenium, base_url).wait_for_page_to_load()
     page.click_extensions_side_button()
     WebDriverWait(selenium, 10).until(
-        lambda d: len(page.installed_addon_name) == installed_before - 1,
-        message=(
-            f"Extension was not removed — list still shows "
-            f"{[el.text for el in page.installed_addon_name]}"
-        ),
+        lambda d: len(page.refresh_installed_addons().of_type("extension"))
+        == len(installed_before) - 1,
+        message=f"Extension was not removed — installed before: {installed_before.names}",
     )
 
 @pytest.mark.webext
@@ -136,25 +119,25 @@ def test_suite_remove_theme_via_three_dot(
     )
     if page is None:
         pytest.skip("Discovery feed returned no theme cassettes this run")
-    themes_before_remove = len(page.installed_addon_name)
+    themes_before_remove = page.installed_addons.of_type("theme")
+    user_theme = themes_before_remove.active_theme
+    assert user_theme is not None and not user_theme.builtin, (
+        f"Setup error — the installed theme is not enabled: {themes_before_remove}"
+    )
     # Step 3 — three-dot Remove and accept the chrome confirm dialog
     page.click_more_options_button_addon()
     page.click_more_options_remove_addon()
     WebDriverWait(selenium, 10).until(EC.alert_is_present())
     selenium.switch_to.alert.accept()
-    # Refresh to confirm — the list must shrink by exactly one (the user
-    # theme). Firefox always ships a set of built-in default themes (System,
-    # Dark, Light, Alpenglow) which stay in the list.
+    # Refresh to confirm — only the user theme must be gone. Firefox always
+    # ships a set of built-in default themes (System, Dark, Light, Alpenglow)
+    # which stay installed.
     selenium.get("about:addons")
     page = AboutAddons(selenium, base_url).wait_for_page_to_load()
     page.click_themes_side_button()
     WebDriverWait(selenium, 10).until(
-        lambda d: len(page.installed_addon_name) == themes_before_remove - 1,
-        message=(
-            f"Theme was not removed — count before={themes_before_remove}, "
-            f"after={len(page.installed_addon_name)}, "
-            f"list={[el.text for el in page.installed_addon_name]}"
-        ),
+        lambda d: page.refresh_installed_addons().get(user_theme.id) is None,
+        message=f'Theme "{user_theme.name}" was not removed',
     )
 
 @pytest.mark.webext
@@ -186,12 +169,7 @@ def test_suite_install_extension_from_private_window(
         c for c in page.addon_cards_items if c.is_extension_card()
     )
     extension_card.install_button.click()
-    accept_popup_notification(
-        selenium,
-        firefox.browser.wait_for_notification(
-            firefox_notifications.AddOnInstallConfirmation
-        ),
-    )
+    handle_door_hanger(selenium, firefox_notifications.AddOnInstallConfirmation)
 
 @pytest.mark.webext
 def test_suite_about_debugging_load_temp_addon(
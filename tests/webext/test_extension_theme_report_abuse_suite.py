@@ -5,7 +5,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
 
 from pages.desktop.about_addons import AboutAddons
-from scripts.addon_install import accept_popup_notification
+from scripts.addon_install import handle_door_hanger
 
 
 # -------- helpers ---------------------------------------------------------
@@ -21,18 +21,8 @@ def _install_first_extension(selenium, base_url, firefox, firefox_notifications)
     page.click_recommendations_side_button()
     ext = next(c for c in page.addon_cards_items if c.is_extension_card())
     ext.install_button.click()
-    accept_popup_notification(
-        selenium,
-        firefox.browser.wait_for_notification(
-            firefox_notifications.AddOnInstallConfirmation
-        ),
-    )
-    accept_popup_notification(
-        selenium,
-        firefox.browser.wait_for_notification(
-            firefox_notifications.AddOnInstallComplete
-        ),
-    )
+    handle_door_hanger(selenium, firefox_notifications.AddOnInstallConfirmation)
+    handle_door_hanger(selenium, firefox_notifications.AddOnInstallComplete)
     if len(selenium.window_handles) == 2:
         selenium.switch_to.window(selenium.window_handles[0])
     page.click_extensions_side_button()
@@ -54,12 +44,7 @@ def _install_first_theme(selenium, base_url, firefox, firefox_notifications):
     if theme is None:
         return None
     theme.install_button.click()
-    accept_popup_notification(
-        selenium,
-        firefox.browser.wait_for_notification(
-            firefox_notifications.AddOnInstallConfirmation
-        ),
-    )
+    handle_door_hanger(selenium, firefox_notifications.AddOnInstallConfirmation)
     if len(selenium.window_handles) == 2:
         selenium.switch_to.window(selenium.window_handles[0])
     page.click_themes_side_button()
@@ -131,29 +116,22 @@ def test_suite_three_dot_remove_with_report_extension(
     )
 
 @pytest.mark.webext
-def test_suite_three_dot_report_extension(
-    selenium, base_url, firefox, firefox_notifications, wait
-):
+@pytest.mark.preinstalled("install_extension_slug")
+def test_suite_three_dot_report_extension(selenium, base_url, wait):
     """three-dot menu → Report on an extension opens the AMO abuse-report
     form for that addon in a new tab."""
-    _install_first_extension(
-        selenium, base_url, firefox, firefox_notifications
-    )
-    page = AboutAddons(selenium, base_url)
+    page = AboutAddons(selenium, base_url).open_extensions_tab()
     _click_three_dot_action(page, "report")
     _wait_for_abuse_report_tab(selenium)
 
 @pytest.mark.webext
-def test_suite_toolbar_remove_with_report_extension(
-    selenium, base_url, firefox, firefox_notifications, wait
-):
+@pytest.mark.preinstalled("install_extension_slug")
+def test_suite_toolbar_remove_with_report_extension(selenium, base_url, wait):
     """Toolbar kebab → Remove Extension on a unified-extensions entry opens
     the same chrome confirm dialog as TC1. The dialog text must mention the
     removal and the report checkbox; the checkbox itself cannot be toggled
     (see module docstring), so the dialog is dismissed without report."""
-    _install_first_extension(
-        selenium, base_url, firefox, firefox_notifications
-    )
+    AboutAddons(selenium, base_url).open_extensions_tab()
     with selenium.context(selenium.CONTEXT_CHROME):
         WebDriverWait(selenium, 10).until(
             EC.visibility_of_element_located((By.ID, "unified-extensions-button"))
@@ -184,14 +162,11 @@ def test_suite_toolbar_remove_with_report_extension(
     selenium.switch_to.alert.dismiss()
 
 @pytest.mark.webext
-def test_suite_toolbar_report_extension(
-    selenium, base_url, firefox, firefox_notifications, wait
-):
+@pytest.mark.preinstalled("install_extension_slug")
+def test_suite_toolbar_report_extension(selenium, base_url, wait):
     """Toolbar kebab → Report Extension opens the AMO abuse-report form for
     that addon in a new tab."""
-    _install_first_extension(
-        selenium, base_url, firefox, firefox_notifications
-    )
+    AboutAddons(selenium, base_url).open_extensions_tab()
     with selenium.context(selenium.CONTEXT_CHROME):
         WebDriverWait(selenium, 10).until(
             EC.visibility_of_element_located((By.ID, "unified-extensions-button"))
@@ -6,7 +6,7 @@ from selenium.webdriver.support.wait import WebDriverWait
 
 from pages.desktop.about_addons import AboutAddons
 from scripts.shadow_dom import shadow_query, shadow_visible
-from scripts.addon_install import accept_popup_notification
+from scripts.addon_install import handle_door_hanger
 
 
 # -------- helpers ---------------------------------------------------------
@@ -32,18 +32,8 @@ def _install_an_extension(selenium, base_url, firefox, firefox_notifications):
         c for c in page.addon_cards_items if c.is_extension_card()
     )
     extension_card.install_button.click()
-    accept_popup_notification(
-        selenium,
-        firefox.browser.wait_for_notification(
-            firefox_notifications.AddOnInstallConfirmation
-        ),
-    )
-    accept_popup_notification(
-        selenium,
-        firefox.browser.wait_for_notification(
-            firefox_notifications.AddOnInstallComplete
-        ),
-    )
+    handle_door_hanger(selenium, firefox_notifications.AddOnInstallConfirmation)
+    handle_door_hanger(selenium, firefox_notifications.AddOnInstallComplete)
     if len(selenium.window_handles) == 2:
         selenium.switch_to.window(selenium.window_handles[0])
     page.click_extensions_side_button()
@@ -159,16 +149,14 @@ def test_suite_toolbar_extension_menu(
     )
 
 @pytest.mark.webext
-def test_suite_view_recent_updates(
-    selenium, base_url, firefox, firefox_notifications, wait
-):
+@pytest.mark.preinstalled("install_extension_slug")
+def test_suite_view_recent_updates(selenium, base_url, wait):
     """Selecting Options → View Recent Updates loads the Recent Updates page
     with the section header visible; switching to any other side-tab hides
     that section again. The spec's "older-version → check-for-updates" sub-
     flow is not exercised because it requires a known-outdated addon in the
     feed; the structural checks below are what the page must satisfy."""
-    _install_an_extension(selenium, base_url, firefox, firefox_notifications)
-    page = AboutAddons(selenium, base_url)
+    page = AboutAddons(selenium, base_url).open_extensions_tab()
 
     # Step 1 — Options → View Recent Updates
     _open_options_menu(page)
@@ -220,17 +208,15 @@ def test_suite_debug_addons(
     assert "/runtime/this-firefox" in selenium.current_url
 
 @pytest.mark.webext
-def test_suite_manage_extension_shortcuts(
-    selenium, base_url, firefox, firefox_notifications, wait
-):
+@pytest.mark.preinstalled("install_extension_slug")
+def test_suite_manage_extension_shortcuts(selenium, base_url, wait):
     """Options → Manage Extension Shortcuts loads the shortcuts page with at
     least one shortcut input field. The Back button returns to the previously
     viewed side-tab. The spec's keystroke-capture assertions (CTRL/ALT
     tooltip, "in use" warning) are not asserted here because they require
     OS-level synthetic key events that Marionette does not reliably emit
     through the shortcut input widget."""
-    _install_an_extension(selenium, base_url, firefox, firefox_notifications)
-    page = AboutAddons(selenium, base_url)
+    page = AboutAddons(selenium, base_url).open_extensions_tab()
 
     # Step 1 — Options → Manage Extension Shortcuts
     _open_options_menu(page)
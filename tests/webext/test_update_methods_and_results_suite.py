@@ -7,13 +7,13 @@ from selenium.webdriver.support.wait import WebDriverWait
 from pages.desktop.about_addons import AboutAddons
 from pages.desktop.frontend.versions import Versions
 from scripts.addon_install import install_older_version_via_chrome
-from scripts.addon_install import accept_popup_notification
+from scripts.addon_install import handle_door_hanger
 
 
 # -------- helpers ---------------------------------------------------------
 
 def _install_older_version_from_amo(
-    selenium, base_url, firefox, firefox_notifications, variables
+    selenium, base_url, firefox_notifications, variables, amo_api, xpi_cache
 ):
     """Open the AMO "all versions" page for the extension referenced by
     ``addon_version_update_webext`` and install ``versions_list[1]`` — the
@@ -23,38 +23,27 @@ def _install_older_version_from_amo(
     AMO renders an "Add to Firefox" install button only on the latest
     version card; older versions expose a plain download link. To start an
     install of the older version through the same chrome path the UI uses
-    we read the XPI URL off the older card and call
-    ``AddonManager.installAddonFromAOM`` from chrome context — see
-    ``scripts.addon_install``.
+    we call ``AddonManager.installAddonFromAOM`` from chrome context — see
+    ``scripts.addon_install``. The download itself is not under test, so
+    the XPI comes from the local cache rather than from AMO's CDN.
     """
     selenium.get(variables["addon_version_update_webext"])
     versions_page = Versions(selenium, base_url).wait_for_page_to_load()
-    # Read the older card's XPI URL via the same `.AddonVersionCard` markup
-    # the page object exposes.
-    xpi_url = selenium.execute_script(
-        """
-        const cards = [...document.querySelectorAll('.AddonVersionCard')];
-        if (cards.length < 2) return null;
-        return cards[1].querySelector('.InstallButtonWrapper-download-link')?.href;
-        """
-    )
-    assert xpi_url, (
-        f"Older version card had no download link — only "
-        f"{len(versions_page.versions_list)} version cards are listed"
+    # the file of the older card, as reported by the versions API
+    addon = variables["addon_version_update_webext"].rstrip("/").split("/")[-2]
+    versions = amo_api.versions(addon).json()["results"]
+    cards = versions_page.versions_list
+    assert len(versions) >= 2 and len(cards) >= 2, (
+        f"No older version to install — the API lists {len(versions)} versions "
+        f"and the page {len(cards)} version cards"
     )
+    # the API and the page list the versions in the same order
+    assert cards[1].version_number == versions[1]["version"]
+    older_file = versions[1]["file"]
+    xpi_url = xpi_cache.local_url(older_file["url"], older_file["hash"])
     install_older_version_via_chrome(selenium, xpi_url)
-    accept_popup_notification(
-        selenium,
-        firefox.browser.wait_for_notification(
-            firefox_notifications.AddOnInstallConfirmation
-        ),
-    )
-    accept_popup_notification(
-        selenium,
-        firefox.browser.wait_for_notification(
-            firefox_notifications.AddOnInstallComplete
-        ),
-    )
+    handle_door_hanger(selenium, firefox_notifications.AddOnInstallConfirmation)
+    handle_door_hanger(selenium, firefox_notifications.AddOnInstallComplete)
     if len(selenium.window_handles) > 1:
         selenium.switch_to.window(selenium.window_handles[0])
 
@@ -76,14 +65,14 @@ def _wait_check_for_updates_finished(selenium, timeout=20):
 
 @pytest.mark.webext
 def test_suite_check_for_updates_after_older_install(
-    selenium, base_url, firefox, firefox_notifications, variables, wait
+    selenium, base_url, firefox_notifications, variables, wait, amo_api, xpi_cache
 ):
     """Install an older version of the AMO test extension referenced by
     ``addon_version_update_webext``. Open about:addons → Extensions, click
     Options ⚙️ → Check for Updates, and assert the in-page confirmation
     (``#updates-message`` state attribute) is set."""
     _install_older_version_from_amo(
-        selenium, base_url, firefox, firefox_notifications, variables
+        selenium, base_url, firefox_notifications, variables, amo_api, xpi_cache
     )
     selenium.get("about:addons")
     page = AboutAddons(selenium, base_url).wait_for_page_to_load()
@@ -100,7 +89,7 @@ def test_suite_check_for_updates_after_older_install(
 
 @pytest.mark.webext
 def test_suite_toggle_auto_update_and_check(
-    selenium, base_url, firefox, firefox_notifications, variables, wait
+    selenium, base_url, firefox_notifications, variables, wait, amo_api, xpi_cache
 ):
     """Install an older version (same as TC1), navigate to the Extensions
     tab, then through the Options menu un-check
@@ -110,7 +99,7 @@ def test_suite_toggle_auto_update_and_check(
     state on click, so the test asserts the ``checked`` attribute changes
     after the click before going on to verify the update check completes."""
     _install_older_version_from_amo(
-        selenium, base_url, firefox, firefox_notifications, variables
+        selenium, base_url, firefox_notifications, variables, amo_api, xpi_cache
     )
     selenium.get("about:addons")
     page = AboutAddons(selenium, base_url).wait_for_page_to_load()